@@ -3,7 +3,7 @@
  */
 
 import { describe, it, expect } from 'vitest';
-import { parsePriceToWonBigInt } from '@/lib/price-utils';
+import { parsePriceToWonBigInt, resolvePriceWonBigInt } from '@/lib/price-utils';
 
 describe('parsePriceToWonBigInt', () => {
   describe('매매가 파싱', () => {
@@ -90,3 +90,17 @@ describe('parsePriceToWonBigInt', () => {
     });
   });
 });
+
+describe('resolvePriceWonBigInt', () => {
+  it('should use the crawler precomputed value when present', () => {
+    expect(resolvePriceWonBigInt(350000000, '3억 5,000')).toBe(BigInt(350000000));
+  });
+
+  it('should keep null precomputed value as null', () => {
+    expect(resolvePriceWonBigInt(null, '-')).toBeNull();
+  });
+
+  it('should fall back to parsing when no precomputed value exists', () => {
+    expect(resolvePriceWonBigInt(undefined, '7억6,000')).toBe(BigInt(760000000));
+  });
+});
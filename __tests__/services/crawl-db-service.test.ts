@@ -0,0 +1,127 @@
+/**
+ * 크롤링 DB 저장 서비스 테스트 (기존 매물 삭제 범위)
+ */
+
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+
+vi.mock('@/lib/logger', () => ({
+  createLogger: vi.fn(() => ({
+    info: vi.fn(),
+    warn: vi.fn(),
+    error: vi.fn(),
+    debug: vi.fn(),
+  })),
+}));
+
+vi.mock('@/repositories', () => ({
+  crawlHistoryRepository: { update: vi.fn() },
+  articleRepository: {
+    deleteByComplexIds: vi.fn(),
+    deleteByComplexIdExcept: vi.fn(),
+    deleteByComplexIdAndArticleNos: vi.fn(),
+    createMany: vi.fn(),
+  },
+}));
+
+vi.mock('@/services/crawl-file-reader', () => ({
+  loadLatestCrawlData: vi.fn(),
+}));
+
+vi.mock('@/services/complex-processor', () => ({
+  prepareComplexUpsertData: vi.fn(() => []),
+  mergeExistingGeoData: vi.fn(async () => 0),
+  enrichWithGeocode: vi.fn(async () => 0),
+  upsertComplexes: vi.fn(),
+}));
+
+import { articleRepository } from '@/repositories';
+import { loadLatestCrawlData } from '@/services/crawl-file-reader';
+import { upsertComplexes } from '@/services/complex-processor';
+import { saveCrawlResultsToDB } from '@/services/crawl-db-service';
+
+function crawlResult(complexNo: string, articleNos: string[], extra: Record<string, any> = {}) {
+  return {
+    crawling_info: { complex_no: complexNo },
+    overview: { complexNo },
+    articles: {
+      articleList: articleNos.map((articleNo) => ({
+        articleNo,
+        tradeTypeName: '매매',
+        dealOrWarrantPrc: '5억',
+        area1: '84',
+      })),
+      ...extra,
+    },
+  };
+}
+
+describe('saveCrawlResultsToDB', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    vi.mocked(upsertComplexes).mockResolvedValue(
+      new Map([
+        ['100', 'complex-100'],
+        ['200', 'complex-200'],
+      ])
+    );
+  });
+
+  it('증분 크롤링 결과는 이어받은 기존 매물을 삭제하지 않는다', async () => {
+    vi.mocked(loadLatestCrawlData).mockResolvedValue({
+      data: [
+        crawlResult('100', ['new-1'], {
+          crawlMode: 'incremental',
+          carriedArticleNos: ['old-1', 'old-2'],
+        }),
+        crawlResult('200', ['a-1', 'a-2']),
+      ],
+      errors: [],
+    });
+
+    const result = await saveCrawlResultsToDB({
+      crawlId: 'crawl-1',
+      complexNos: ['100', '200'],
+      userId: 'user-1',
+      baseDir: '/tmp',
+    });
+
+    expect(result.errors).toEqual([]);
+    expect(articleRepository.deleteByComplexIds).toHaveBeenCalledTimes(1);
+    expect(articleRepository.deleteByComplexIds).toHaveBeenCalledWith(['complex-200']);
+    expect(articleRepository.deleteByComplexIdExcept).toHaveBeenCalledWith('complex-100', [
+      'old-1',
+      'old-2',
+    ]);
+    const inserted = vi.mocked(articleRepository.createMany).mock.calls.flatMap(([batch]) =>
+      batch.map((article: any) => article.articleNo)
+    );
+    expect(inserted).toEqual(['new-1', 'a-1', 'a-2']);
+  });
+
+  it('필터 크롤링 결과는 이번에 수집된 매물만 교체하고 필터 밖 매물은 유지한다', async () => {
+    vi.mocked(loadLatestCrawlData).mockResolvedValue({
+      data: [
+        {
+          ...crawlResult('100', ['jeonse-1', 'jeonse-2']),
+          crawling_info: { complex_no: '100', filters: { tradeTypes: ['B1'] } },
+        },
+      ],
+      errors: [],
+    });
+    vi.mocked(upsertComplexes).mockResolvedValue(new Map([['100', 'complex-100']]));
+
+    await saveCrawlResultsToDB({
+      crawlId: 'crawl-2',
+      complexNos: ['100'],
+      userId: 'user-1',
+      baseDir: '/tmp',
+    });
+
+    expect(articleRepository.deleteByComplexIds).not.toHaveBeenCalled();
+    expect(articleRepository.deleteByComplexIdExcept).not.toHaveBeenCalled();
+    expect(articleRepository.deleteByComplexIdAndArticleNos).toHaveBeenCalledWith('complex-100', [
+      'jeonse-1',
+      'jeonse-2',
+    ]);
+  });
+});
@@ -33,6 +33,21 @@ export function parsePriceToWonBigInt(priceStr: string | null | undefined): bigi
   return BigInt(eok * 100000000 + man * 10000);
 }
 
+/**
+ * 크롤러가 미리 계산한 원 단위 가격을 BigInt로 변환
+ * 크롤링 결과에 숫자 가격(dealOrWarrantPrcWon 등)이 있으면 그대로 사용하고,
+ * 이전 버전 크롤러 결과처럼 없을 때만 문자열을 파싱합니다.
+ */
+export function resolvePriceWonBigInt(
+  precomputedWon: number | string | null | undefined,
+  priceStr: string | null | undefined
+): bigint | null {
+  if (precomputedWon !== undefined) {
+    return precomputedWon === null ? null : BigInt(precomputedWon);
+  }
+  return parsePriceToWonBigInt(priceStr);
+}
+
 /**
  * 가격 문자열을 숫자로 변환 (레거시)
  * 예: "3억 5,000" → 350000000 (원 단위)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+하이브리드 크롤러(hybrid_crawler.py)의 단지별 우선 백엔드 (http / browser)
+HTTP 수집에 실패한 단지는 BACKEND_REPROBE_HOURS(연속 실패 시 최대 8배) 동안 브라우저로 바로 크롤링한다.
+
+파일:
+    {OUTPUT_DIR}/backend_preferences.json
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from complex_stats import atomic_write_json, file_lock
+
+
+class BackendPreferenceStore:
+    """단지별 HTTP 수집 성공 여부 저장소 (여러 프로세스가 동시에 갱신해도 안전하도록 파일 잠금 사용)"""
+
+    def __init__(self, output_dir: Optional[Path] = None):
+        output_dir = Path(output_dir or os.getenv('OUTPUT_DIR', './crawled_data'))
+        self.path = output_dir / 'backend_preferences.json'
+        self.lock_path = output_dir / 'backend_preferences.lock'
+        self.reprobe_hours = float(os.getenv('BACKEND_REPROBE_HOURS', '24'))
+
+    def load(self) -> Dict[str, Dict]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[WARNING] 백엔드 선호 파일 읽기 실패, 새로 시작: {e}")
+            return {}
+
+    def record(self, outcomes: Dict[str, bool], now: Optional[datetime] = None):
+        """단지별 HTTP 수집 성공 여부 기록 (실패하면 다음 실행부터 브라우저 우선)"""
+        if not outcomes:
+            return
+        now = now or datetime.now(timezone.utc)
+        with file_lock(self.lock_path):
+            complexes = self.load()
+            for complex_no, http_ok in outcomes.items():
+                entry = dict(complexes.get(str(complex_no), {}))
+                if http_ok:
+                    entry['backend'] = 'http'
+                    entry['http_failures'] = 0
+                else:
+                    entry['backend'] = 'browser'
+                    entry['http_failures'] = entry.get('http_failures', 0) + 1
+                    entry['http_failed_at'] = now.isoformat(timespec='seconds')
+                complexes[str(complex_no)] = entry
+            atomic_write_json(self.path, complexes)
+
+    def preferred(self, entry: Optional[Dict], now: Optional[datetime] = None) -> str:
+        """우선 백엔드 ('http' | 'browser') - 재검사 주기가 지나면 HTTP 재시도"""
+        if not entry or entry.get('backend') != 'browser' or not entry.get('http_failed_at'):
+            return 'http'
+        now = now or datetime.now(timezone.utc)
+        failures = max(entry.get('http_failures', 1), 1)
+        reprobe_hours = self.reprobe_hours * 2 ** min(failures - 1, 3)
+        elapsed = (now - datetime.fromisoformat(entry['http_failed_at'])).total_seconds() / 3600
+        return 'http' if elapsed >= reprobe_hours else 'browser'
+
+    def preferences(self, complex_numbers: List[str], now: Optional[datetime] = None) -> Dict[str, str]:
+        complexes = self.load()
+        return {no: self.preferred(complexes.get(str(no)), now) for no in complex_numbers}
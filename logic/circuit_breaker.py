@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+봇 탐지 서킷 브레이커
+같은 프로세스의 모든 크롤러/페이지가 하나의 브레이커를 공유한다 (같은 IP로 요청하므로).
+
+    closed     정상 크롤링
+    open       BOT_BREAKER_WINDOW초 안에 봇 탐지 신호(404/단지 ID 제거 리다이렉트)가
+               BOT_BREAKER_THRESHOLD회 이상 → 전체 크롤링을 BOT_BREAKER_COOLDOWN초 중단
+    half_open  대기 후 한 크롤러만 새 신원(뷰포트/UA/빈 세션)으로 시험 요청
+               성공하면 closed, 다시 탐지되면 대기 시간을 2배로 늘려 open (최대 BOT_BREAKER_MAX_COOLDOWN)
+"""
+
+import os
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# half_open 시험 요청 결과를 기다리는 다른 크롤러의 확인 간격 (초)
+PROBE_POLL_SECONDS = 5.0
+
+
+class BotDetectionBreaker:
+    """봇 탐지 신호 기반 서킷 브레이커"""
+
+    def __init__(self, threshold: int = 3, window: float = 300, cooldown: float = 180,
+                 max_cooldown: float = 1800, clock: Callable[[], float] = time.monotonic):
+        self.threshold = max(1, threshold)
+        self.window = window
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.clock = clock
+
+        self.state = CLOSED
+        self.signals: Deque[float] = deque()
+        self.cooldown = cooldown
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.trips = 0
+        self.last_reason: Optional[str] = None
+
+    @classmethod
+    def from_env(cls) -> 'BotDetectionBreaker':
+        return cls(
+            threshold=int(os.getenv('BOT_BREAKER_THRESHOLD', '3')),
+            window=float(os.getenv('BOT_BREAKER_WINDOW', '300')),
+            cooldown=float(os.getenv('BOT_BREAKER_COOLDOWN', '180')),
+            max_cooldown=float(os.getenv('BOT_BREAKER_MAX_COOLDOWN', '1800')),
+        )
+
+    def _trip(self, reason: str):
+        self.state = OPEN
+        self.opened_at = self.clock()
+        self.probe_in_flight = False
+        self.signals.clear()
+        self.trips += 1
+        self.last_reason = reason
+
+    def record_signal(self, reason: str) -> bool:
+        """봇 탐지 신호 기록, 이번 신호로 차단(open)되면 True"""
+        now = self.clock()
+        if self.state == HALF_OPEN:
+            # 시험 요청 실패 → 더 오래 대기
+            self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+            self._trip(reason)
+            return True
+        if self.state == OPEN:
+            return False
+
+        self.signals.append(now)
+        while self.signals and now - self.signals[0] > self.window:
+            self.signals.popleft()
+        if len(self.signals) >= self.threshold:
+            self._trip(reason)
+            return True
+        return False
+
+    def record_success(self) -> bool:
+        """정상 응답 기록, 시험 요청 성공으로 복구(closed)되면 True"""
+        if self.state != HALF_OPEN:
+            return False
+        self.state = CLOSED
+        self.cooldown = self.base_cooldown
+        self.probe_in_flight = False
+        self.signals.clear()
+        return True
+
+    def release_probe(self):
+        """시험 요청이 성공/탐지 어느 쪽으로도 판정되지 않고 끝나면 다른 크롤러가 다시 시험"""
+        if self.state == HALF_OPEN:
+            self.probe_in_flight = False
+
+    def cooldown_left(self) -> float:
+        """차단(open) 대기 남은 시간 (상태를 바꾸지 않는 조회용, 시간 예산 판단 등)"""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self.opened_at + self.cooldown - self.clock())
+
+    def wait_time(self) -> float:
+        """요청 전 대기해야 할 시간 (0이면 진행, half_open 전환 시 호출자가 시험 요청 담당)"""
+        if self.state == CLOSED:
+            return 0.0
+        if self.state == OPEN:
+            remaining = self.opened_at + self.cooldown - self.clock()
+            if remaining > 0:
+                return remaining
+            self.state = HALF_OPEN
+            self.probe_in_flight = True
+            return 0.0
+        # half_open: 시험 요청이 끝날 때까지 다른 크롤러는 대기
+        if self.probe_in_flight:
+            return PROBE_POLL_SECONDS
+        self.probe_in_flight = True
+        return 0.0
+
+    def snapshot(self) -> Dict:
+        """상태 보고용"""
+        return {
+            'state': self.state,
+            'trips': self.trips,
+            'recent_signals': len(self.signals),
+            'cooldown_seconds': self.cooldown,
+            'last_reason': self.last_reason,
+        }
+
+
+_shared_breaker: Optional[BotDetectionBreaker] = None
+
+
+def get_shared_breaker() -> BotDetectionBreaker:
+    """프로세스 공용 브레이커"""
+    global _shared_breaker
+    if _shared_breaker is None:
+        _shared_breaker = BotDetectionBreaker.from_env()
+    return _shared_breaker
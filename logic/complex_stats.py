@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+단지별 매물 변동(churn) 통계
+크롤링할 때마다 직전 스냅샷과 비교해 신규/삭제/가격변경 매물 수를 기록하고,
+시간당 변동량의 지수이동평균(EWMA)으로 재크롤링 우선순위를 계산한다.
+
+    우선순위 = 마지막 크롤링 후 경과 시간(h) × 시간당 변동량(EWMA)
+
+스케줄러는 CRAWL_BUDGET개 단지만 우선순위 순으로 크롤링하고,
+MAX_RECRAWL_HOURS 이상 크롤링되지 않은 단지는 변동이 적어도 우선 포함한다.
+
+단지별 크롤링 비용(소요 시간, 페이지 이동 시간, 스크롤 횟수, 실패율)도 EWMA로 기록한다 (활용은 cost_model.py).
+
+증분 크롤링(INCREMENTAL_CRAWL)은 스냅샷의 매물번호를 기준으로 최신순 목록에서 기존 매물이 이어지면 중단하고,
+나머지 매물번호(carriedArticleNos)는 스냅샷에서 이어받는다. 삭제 매물 반영을 위해 FULL_SWEEP_HOURS마다 전체 크롤링한다.
+
+파일:
+    {OUTPUT_DIR}/complex_stats.json          단지별 통계
+    {OUTPUT_DIR}/snapshots/{단지번호}.json   마지막 크롤링 매물 스냅샷 (SNAPSHOT_FIELDS만)
+"""
+
+import fcntl
+import json
+import math
+import os
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+STATS_VERSION = 1
+MIN_CHURN_RATE = 0.01       # 변동 없는 단지도 우선순위가 0이 되지 않도록 하는 하한 (건/시간)
+DEFAULT_CHURN_RATE = 1.0    # 두 번째 크롤링 전까지 사용할 추정치 (건/시간)
+MIN_ELAPSED_HOURS = 0.25    # 연속 크롤링 시 변동률이 튀지 않도록 하는 최소 경과 시간
+# 스냅샷에 남기는 매물 필드 (변동 비교: 매물번호/가격, 대형 단지 구간 분할: 거래유형)
+SNAPSHOT_FIELDS = ('articleNo', 'dealOrWarrantPrc', 'rentPrc', 'tradeTypeCode')
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def atomic_write_json(path: Path, data):
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+@contextmanager
+def file_lock(lock_path: Path):
+    """프로세스 간 배타 잠금"""
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def article_price_map(articles: List[Dict]) -> Dict[str, str]:
+    """매물번호 → 가격 문자열 (거래가/보증금 + 월세)"""
+    return {
+        str(a.get('articleNo')): f"{a.get('dealOrWarrantPrc', '')}/{a.get('rentPrc', '')}"
+        for a in articles if a.get('articleNo')
+    }
+
+
+def snapshot_articles(articles: List[Dict]) -> List[Dict]:
+    """스냅샷용 매물 목록 (SNAPSHOT_FIELDS만)"""
+    return [{key: a[key] for key in SNAPSHOT_FIELDS if key in a} for a in articles]
+
+
+def diff_articles(previous: Dict[str, str], current: Dict[str, str]) -> Dict[str, int]:
+    """이전/현재 매물 가격 맵 비교"""
+    previous_ids = previous.keys()
+    current_ids = current.keys()
+    return {
+        'new': len(current_ids - previous_ids),
+        'removed': len(previous_ids - current_ids),
+        'price_changed': sum(1 for no in current_ids & previous_ids if current[no] != previous[no]),
+        'total': len(current),
+    }
+
+
+class ComplexStatsStore:
+    """단지별 변동 통계 / 스냅샷 저장소 (여러 프로세스가 동시에 갱신해도 안전하도록 파일 잠금 사용)"""
+
+    def __init__(self, output_dir: Optional[Path] = None):
+        output_dir = Path(output_dir or os.getenv('OUTPUT_DIR', './crawled_data'))
+        self.path = output_dir / 'complex_stats.json'
+        self.snapshot_dir = output_dir / 'snapshots'
+        self.lock_path = output_dir / 'complex_stats.lock'
+        self.alpha = float(os.getenv('CHURN_EWMA_ALPHA', '0.3'))
+        self.max_interval_hours = float(os.getenv('MAX_RECRAWL_HOURS', '168'))
+        self.full_sweep_hours = float(os.getenv('FULL_SWEEP_HOURS', '72'))
+
+    def _locked(self):
+        return file_lock(self.lock_path)
+
+    def load(self) -> Dict[str, Dict]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('complexes', {})
+        except (OSError, ValueError) as e:
+            print(f"[WARNING] 변동 통계 파일 읽기 실패, 새로 시작: {e}")
+            return {}
+
+    def _save(self, complexes: Dict[str, Dict]):
+        atomic_write_json(self.path, {'version': STATS_VERSION, 'complexes': complexes})
+
+    def _snapshot_path(self, complex_no: str) -> Path:
+        return self.snapshot_dir / f"{complex_no}.json"
+
+    def load_snapshot(self, complex_no: str) -> Optional[Dict]:
+        """마지막 크롤링 매물 스냅샷 ({'crawled_at', 'articles'})"""
+        path = self._snapshot_path(str(complex_no))
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _ewma(self, entry: Dict, key: str, observed: Optional[float]):
+        if observed is None:
+            return
+        previous = entry.get(key)
+        entry[key] = observed if previous is None else self.alpha * observed + (1 - self.alpha) * previous
+
+    def _update_stats(self, entry: Optional[Dict], changes: Optional[Dict[str, int]], now: datetime,
+                      article_count: int = 0, costs: Optional[Dict[str, Optional[float]]] = None) -> Dict:
+        entry = dict(entry or {})
+        entry['article_count'] = article_count
+        for key, observed in (costs or {}).items():
+            self._ewma(entry, key, observed)
+        if entry.get('failure_rate') is not None:
+            self._ewma(entry, 'failure_rate', 0.0)
+        if changes is not None and entry.get('last_crawled'):
+            elapsed = (now - datetime.fromisoformat(entry['last_crawled'])).total_seconds() / 3600
+            observed = (changes['new'] + changes['removed'] + changes['price_changed']) / max(elapsed, MIN_ELAPSED_HOURS)
+            previous_rate = entry.get('churn_rate')
+            entry['churn_rate'] = observed if previous_rate is None else (
+                self.alpha * observed + (1 - self.alpha) * previous_rate
+            )
+            entry['last_changes'] = changes
+
+        entry['last_crawled'] = now.isoformat(timespec='seconds')
+        entry['crawl_count'] = entry.get('crawl_count', 0) + 1
+        return entry
+
+    def incremental_baseline(self, complex_no: str, now: Optional[datetime] = None) -> Optional[List[Dict]]:
+        """증분 크롤링 기준 매물 목록 (스냅샷이 없거나 전체 크롤링 주기가 지났으면 None → 전체 크롤링)"""
+        snapshot = self.load_snapshot(complex_no)
+        if not snapshot or not snapshot.get('full_crawled_at'):
+            return None
+        now = now or _now()
+        elapsed = (now - datetime.fromisoformat(snapshot['full_crawled_at'])).total_seconds() / 3600
+        if elapsed >= self.full_sweep_hours:
+            return None
+        return snapshot.get('articles', [])
+
+    def _record(self, complexes: Dict[str, Dict], complex_no: str, articles: List[Dict], now: datetime,
+                full: bool = True, carried: Optional[List[str]] = None,
+                costs: Optional[Dict[str, Optional[float]]] = None) -> Optional[Dict[str, int]]:
+        """단지 1개 스냅샷 교체 + complexes 갱신 (잠금/통계 파일 저장은 호출자 담당)"""
+        snapshot = self.load_snapshot(complex_no)
+        previous = (snapshot or {}).get('articles', [])
+        current = snapshot_articles(articles)
+        if carried:
+            carried_ids = {str(no) for no in carried}
+            current += [a for a in previous if str(a.get('articleNo')) in carried_ids]
+
+        changes = None
+        if snapshot is not None:
+            changes = diff_articles(article_price_map(previous), article_price_map(current))
+
+        full_crawled_at = now.isoformat(timespec='seconds') if full else (snapshot or {}).get('full_crawled_at')
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        atomic_write_json(self._snapshot_path(complex_no), {
+            'crawled_at': now.isoformat(timespec='seconds'),
+            'full_crawled_at': full_crawled_at,
+            'articles': current,
+        })
+        complexes[complex_no] = self._update_stats(complexes.get(complex_no), changes, now,
+                                                   article_count=len(current), costs=costs)
+        return changes
+
+    def record_crawl(self, complex_no: str, articles: List[Dict], now: Optional[datetime] = None,
+                     full: bool = True, duration: Optional[float] = None, navigation: Optional[float] = None,
+                     scroll_attempts: Optional[int] = None,
+                     carried: Optional[List[str]] = None) -> Optional[Dict[str, int]]:
+        """크롤링 결과 기록, 직전 스냅샷 대비 변동 반환 (첫 크롤링이면 None)
+        full=False(증분 크롤링)면 마지막 전체 크롤링 시각을 이어받고, carried 매물번호는 직전 스냅샷에서 이어받는다
+        duration/navigation은 단지 크롤링/페이지 이동 소요 시간(초), scroll_attempts는 매물 스크롤 횟수"""
+        now = now or _now()
+        with self._locked():
+            complexes = self.load()
+            changes = self._record(complexes, str(complex_no), articles, now, full=full, carried=carried, costs={
+                'avg_duration': duration,
+                'avg_navigation': navigation,
+                'avg_scroll_attempts': scroll_attempts,
+            })
+            self._save(complexes)
+        return changes
+
+    def record_results(self, results: List[Dict], now: Optional[datetime] = None) -> int:
+        """크롤러 결과 목록 기록 (매물 수집에 성공한 단지만, 실패 단지는 실패율만), 기록한 단지 수 반환
+        통계 파일은 한 번 잠그고 한 번만 읽고 쓴다"""
+        now = now or _now()
+        recorded = 0
+        failed = []
+        with self._locked():
+            complexes = self.load()
+            for item in results:
+                complex_no = (item.get('crawling_info', {}).get('complex_no')
+                              or item.get('overview', {}).get('complexNo') or item.get('complex_no'))
+                if not complex_no:
+                    continue
+                if 'error' in item or 'articles' not in item:
+                    # 존재하지 않는 단지 / 시간 예산으로 연기한 단지는 크롤링 비용과 무관
+                    if not item.get('skipped') and not item.get('deferred'):
+                        failed.append(str(complex_no))
+                    continue
+                articles = item['articles']
+                self._record(
+                    complexes, str(complex_no), articles.get('articleList', []), now,
+                    full=articles.get('crawlMode') != 'incremental',
+                    carried=articles.get('carriedArticleNos'),
+                    costs={
+                        'avg_duration': item.get('crawling_info', {}).get('duration_seconds'),
+                        'avg_navigation': articles.get('navigationSeconds'),
+                        'avg_scroll_attempts': articles.get('scrollAttempts'),
+                    },
+                )
+                recorded += 1
+            self._record_failures(complexes, failed, now)
+            self._save(complexes)
+        return recorded
+
+    def _record_failures(self, complexes: Dict[str, Dict], complex_numbers: List[str], now: datetime):
+        """실패율 EWMA 갱신 (한 번도 수집에 성공하지 못한 단지는 기록 없는 단지와 같이 취급)"""
+        for complex_no in complex_numbers:
+            if str(complex_no) not in complexes:
+                continue
+            entry = dict(complexes[str(complex_no)])
+            # 성공 기록이 있는 단지이므로 실패율 0에서 출발 (첫 실패로 실패율 100%가 되지 않도록)
+            entry.setdefault('failure_rate', 0.0)
+            self._ewma(entry, 'failure_rate', 1.0)
+            entry['failures'] = entry.get('failures', 0) + 1
+            entry['last_failed'] = now.isoformat(timespec='seconds')
+            complexes[str(complex_no)] = entry
+
+    def priority(self, entry: Optional[Dict], now: Optional[datetime] = None) -> float:
+        """재크롤링 우선순위 (한 번도 크롤링되지 않았거나 최대 간격을 넘으면 무한대)"""
+        if not entry or not entry.get('last_crawled'):
+            return math.inf
+        now = now or _now()
+        staleness = (now - datetime.fromisoformat(entry['last_crawled'])).total_seconds() / 3600
+        if staleness >= self.max_interval_hours:
+            return math.inf
+
+        rate = entry.get('churn_rate')
+        rate = DEFAULT_CHURN_RATE if rate is None else max(rate, MIN_CHURN_RATE)
+        return staleness * rate
+
+    def select(self, complex_numbers: List[str], budget: int,
+               now: Optional[datetime] = None) -> Tuple[List[str], List[str]]:
+        """우선순위 상위 budget개 단지 선택 (선택, 제외) - 원래 순서 유지"""
+        if budget <= 0 or budget >= len(complex_numbers):
+            return list(complex_numbers), []
+
+        complexes = self.load()
+        now = now or _now()
+        ranked = sorted(
+            complex_numbers,
+            key=lambda no: self.priority(complexes.get(str(no)), now),
+            reverse=True
+        )
+        chosen = set(ranked[:budget])
+        selected = [no for no in complex_numbers if no in chosen]
+        skipped = [no for no in complex_numbers if no not in chosen]
+        return selected, skipped
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+단지별 크롤링 비용 모델 (예상 소요 시간 / 시간 예산 계획 / 작업 분배)
+비용(예상 소요 시간, 초)은 complex_stats에 기록된 평균 소요 시간 × (1 + 실패율), 기록이 없으면 매물 수 기반 추정
+
+- 시간 예산(--time-budget): 우선순위 대비 비용이 좋은 단지부터 예산 안에 들어가는 만큼만 계획
+- 남은 시간(ETA): 단지 수 비율 대신 완료한 단지의 예측 비용 대비 실제 소요 시간으로 보정
+- 작업 분배: 병렬 샤드/페이지에 단지 수가 아닌 예측 비용 기준으로 분배 (LPT: 비싼 작업부터 가장 한가한 곳에)
+"""
+
+import heapq
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from complex_stats import ComplexStatsStore
+
+DEFAULT_COMPLEX_SECONDS = 30.0  # 소요 시간 기록이 없는 단지의 기본 추정치 (초)
+SECONDS_PER_ARTICLE = 0.05      # 매물 수 기반 추정 시 매물당 추가 시간 (초, 스크롤 1회 20건 ≈ 1초)
+
+
+def estimate_duration(entry: Optional[Dict]) -> float:
+    """단지 크롤링 예상 소요 시간 (초): 평균 소요 시간, 없으면 매물 수 기반 추정 (실패율만큼 재시도 비용 추가)"""
+    entry = entry or {}
+    if entry.get('avg_duration') is not None:
+        duration = float(entry['avg_duration'])
+    else:
+        duration = DEFAULT_COMPLEX_SECONDS + entry.get('article_count', 0) * SECONDS_PER_ARTICLE
+    return duration * (1 + entry.get('failure_rate', 0.0))
+
+
+def estimate_costs(store: ComplexStatsStore, complex_numbers: List[str]) -> Dict[str, float]:
+    """단지별 예상 소요 시간 (초)"""
+    complexes = store.load()
+    return {no: estimate_duration(complexes.get(str(no))) for no in complex_numbers}
+
+
+def plan_time_budget(store: ComplexStatsStore, complex_numbers: List[str], budget_seconds: float,
+                     now: Optional[datetime] = None) -> Tuple[List[str], List[str]]:
+    """시간 예산 안에서 크롤링 순서 계획 (계획, 연기)
+    우선순위/예상 시간이 큰(싸고 급한) 단지부터, 예산을 넘는 단지는 건너뛰고 더 작은 단지로 채운다
+    1순위 단지는 혼자 예산을 넘더라도 계획 (예산보다 큰 단지가 매번 연기되어 영영 크롤링되지 않는 것 방지)"""
+    complexes = store.load()
+    now = now or datetime.now(timezone.utc)
+    costs = {no: max(estimate_duration(complexes.get(str(no))), 1.0) for no in complex_numbers}
+
+    def value(no):
+        priority = store.priority(complexes.get(str(no)), now)
+        return (priority / costs[no], -costs[no])
+
+    planned, deferred = [], []
+    used = 0.0
+    for no in sorted(complex_numbers, key=value, reverse=True):
+        if not planned or used + costs[no] <= budget_seconds:
+            planned.append(no)
+            used += costs[no]
+        else:
+            deferred.append(no)
+    return planned, deferred
+
+
+def estimate_total_seconds(elapsed: float, done_cost: float, total_cost: float,
+                           progress: int = 0, total: int = 0) -> int:
+    """예상 총 소요 시간 (초)
+    완료한 단지가 있으면 (실제 경과 / 완료 단지 예측 비용) 비율로 전체 예측 비용을 보정하고,
+    비용 기록이 없으면 기존 방식(경과 / 완료 수 × 전체 수)"""
+    if done_cost > 0 and total_cost > 0:
+        return int(elapsed / done_cost * total_cost)
+    if progress > 0 and total > 0:
+        return int(elapsed / progress * total)
+    return int(total_cost)
+
+
+def lpt_partition(items: Sequence[str], costs: Dict[str, float], bins: int) -> List[List[str]]:
+    """예측 비용 기준 균등 분배 (비싼 단지부터 누적 비용이 가장 작은 묶음에 배정, 빈 묶음 제외)
+    각 묶음 안에서는 비싼 단지가 먼저 오므로 늦게 끝나는 꼬리 작업이 줄어든다"""
+    bins = max(1, min(bins, len(items)))
+    loads = [(0.0, index) for index in range(bins)]
+    partitions: List[List[str]] = [[] for _ in range(bins)]
+    for item in sorted(items, key=lambda no: costs.get(no, 0.0), reverse=True):
+        load, index = heapq.heappop(loads)
+        partitions[index].append(item)
+        heapq.heappush(loads, (load + costs.get(item, 0.0), index))
+    return [partition for partition in partitions if partition]
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤링 필터 (거래유형 / 가격 / 면적)
+매물 목록 API 쿼리 파라미터로 내려보내 필요한 매물만 받는다.
+
+    --trade-types=매매,전세          거래유형 (A1 매매, B1 전세, B2 월세, B3 단기임대)
+    --price-min / --price-max=만원   매매가/보증금
+    --area-min / --area-max=㎡       면적
+
+필터는 명령행에서 명시적으로 요청한 실행에만 적용한다 (전역 설정으로 두면 모든 크롤링이 부분 수집이 됨).
+필터를 적용한 크롤링은 단지 전체 매물이 아니므로 결과의 crawling_info.filters에 기록하고,
+변동 통계/스냅샷에는 기록하지 않으며, DB 저장 시 기존 매물을 전체 삭제하지 않는다.
+"""
+
+import math
+from typing import Dict, List, Optional, Tuple
+
+TRADE_TYPE_CODES = {
+    '매매': 'A1',
+    '전세': 'B1',
+    '월세': 'B2',
+    '단기임대': 'B3',
+}
+
+FILTER_OPTIONS = ('--trade-types', '--price-min', '--price-max', '--area-min', '--area-max')
+
+
+def parse_trade_types(value: Optional[str]) -> List[str]:
+    """'매매,전세' 또는 'A1:B1' → ['A1', 'B1']"""
+    codes = []
+    for item in (value or '').replace(':', ',').split(','):
+        item = item.strip()
+        if not item:
+            continue
+        code = TRADE_TYPE_CODES.get(item, item.upper())
+        if code not in TRADE_TYPE_CODES.values():
+            raise ValueError(f"알 수 없는 거래유형: {item}")
+        if code not in codes:
+            codes.append(code)
+    return codes
+
+
+def _parse_number(value: Optional[str], upper: bool = False) -> Optional[int]:
+    """API는 정수만 받으므로 하한은 내림, 상한은 올림 (84.9㎡ 상한에 84.x㎡ 매물이 빠지지 않도록)"""
+    if value is None or not str(value).strip():
+        return None
+    number = float(str(value).replace(',', ''))
+    return math.ceil(number) if upper else math.floor(number)
+
+
+class CrawlFilters:
+    """크롤링 필터 (값이 None이면 제한 없음)"""
+
+    def __init__(self, trade_types: Optional[List[str]] = None,
+                 price_min: Optional[int] = None, price_max: Optional[int] = None,
+                 area_min: Optional[int] = None, area_max: Optional[int] = None):
+        self.trade_types = list(trade_types or [])
+        self.price_min = price_min
+        self.price_max = price_max
+        self.area_min = area_min
+        self.area_max = area_max
+
+    @classmethod
+    def from_args(cls, argv: List[str]) -> Tuple['CrawlFilters', List[str]]:
+        """명령행에서 필터 옵션(--key=value)을 분리, (필터, 나머지 인자) 반환"""
+        values: Dict[str, str] = {}
+        remaining = []
+        for arg in argv:
+            option, sep, value = arg.partition('=')
+            if option in FILTER_OPTIONS:
+                # '--price-max 90000'처럼 값을 띄워 쓰면 값이 다른 위치 인자(crawl_id 등)로 새므로 거부
+                if not sep or not value.strip():
+                    raise ValueError(f"{option} 옵션은 {option}=값 형식으로 지정해야 합니다")
+                values[option] = value
+            else:
+                remaining.append(arg)
+        filters = cls(
+            trade_types=parse_trade_types(values.get('--trade-types')),
+            price_min=_parse_number(values.get('--price-min')),
+            price_max=_parse_number(values.get('--price-max'), upper=True),
+            area_min=_parse_number(values.get('--area-min')),
+            area_max=_parse_number(values.get('--area-max'), upper=True),
+        )
+        return filters, remaining
+
+    @property
+    def active(self) -> bool:
+        return bool(self.trade_types) or any(
+            v is not None for v in (self.price_min, self.price_max, self.area_min, self.area_max)
+        )
+
+    def api_params(self) -> Dict[str, str]:
+        """매물 목록 API에 덮어쓸 쿼리 파라미터 (설정된 항목만)"""
+        params = {}
+        if self.trade_types:
+            params['tradeType'] = ':'.join(self.trade_types)
+        if self.price_min is not None:
+            params['priceMin'] = str(self.price_min)
+        if self.price_max is not None:
+            params['priceMax'] = str(self.price_max)
+        if self.area_min is not None:
+            params['areaMin'] = str(self.area_min)
+        if self.area_max is not None:
+            params['areaMax'] = str(self.area_max)
+        return params
+
+    def restrict_trade_types(self, trade_types: str) -> Optional[str]:
+        """구간 거래유형('B2:B3')을 필터와 교집합으로 제한 (겹치지 않으면 None)"""
+        codes = trade_types.split(':')
+        if self.trade_types:
+            codes = [code for code in codes if code in self.trade_types]
+        return ':'.join(codes) or None
+
+    def describe(self) -> Dict:
+        """결과 기록용"""
+        return {
+            'tradeTypes': self.trade_types,
+            'priceMin': self.price_min,
+            'priceMax': self.price_max,
+            'areaMin': self.area_min,
+            'areaMax': self.area_max,
+        }
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤링 워커 프로세스 (worker_pool.CrawlWorkerPool이 실행)
+stdin으로 받은 작업을 실행하고 진행 상황/결과를 stdout에 한 줄 JSON으로 보낸다.
+크롤러의 print 로그는 프로토콜과 섞이지 않도록 stderr로 보낸다.
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+# 프로토콜 전용 stdout 확보 후 나머지 출력은 stderr로
+_protocol = os.fdopen(os.dup(sys.stdout.fileno()), 'w', encoding='utf-8', buffering=1)
+sys.stdout = sys.stderr
+
+from crawler_pool import CrawlerPool  # noqa: E402
+from worker_pool import summarize_results  # noqa: E402
+
+
+def send(message: dict):
+    _protocol.write(json.dumps(message, ensure_ascii=False, default=str) + '\n')
+    _protocol.flush()
+
+
+async def main():
+    from hybrid_crawler import create_crawler
+
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=16 * 1024 * 1024)
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+
+    # 워커 안에서도 작업 간 브라우저 유지 (CRAWLER_MAX_RUNS / CRAWLER_MAX_RSS_MB로 재활용)
+    pool = CrawlerPool(create_crawler)
+    send({'type': 'ready', 'pid': os.getpid()})
+
+    try:
+        while True:
+            try:
+                line = await asyncio.wait_for(reader.readline(), timeout=60)
+            except asyncio.TimeoutError:
+                await pool.close_idle()
+                continue
+            if not line:
+                break  # 스케줄러가 stdin을 닫음 → 종료
+
+            request = json.loads(line)
+            if request.get('type') != 'crawl':
+                continue
+
+            job_id = request['id']
+            crawler = await pool.acquire()
+            crawler.progress_callback = lambda status: send({'type': 'progress', 'id': job_id, 'status': status})
+            ok = False
+            try:
+                results = await crawler.run_crawling(request['complex_numbers'], keep_browser=True)
+                ok = True
+                send({
+                    'type': 'result',
+                    'id': job_id,
+                    'results': summarize_results(results),
+                    'output_file': crawler.last_output_file,
+                })
+            except Exception as e:
+                send({'type': 'error', 'id': job_id, 'error': str(e)})
+            finally:
+                crawler.progress_callback = None
+                await pool.release(crawler, ok)
+    finally:
+        await pool.close_all()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스케줄러용 재사용 크롤러 풀
+실행이 끝난 크롤러의 브라우저/컨텍스트/DB 연결을 닫지 않고 보관했다가
+다음 스케줄 실행에서 그대로 사용해 Chromium 기동과 워밍업 시간을 줄인다.
+
+재활용(종료 후 새로 생성) 조건:
+    - CRAWLER_MAX_RUNS회 실행 후
+    - 프로세스 트리 RSS가 CRAWLER_MAX_RSS_MB 초과
+    - 실행 중 오류 또는 상태 확인 실패
+    - CRAWLER_IDLE_SECONDS 동안 사용되지 않음 (드문 스케줄에서 메모리 반환)
+"""
+
+import asyncio
+import os
+import time
+from typing import Callable, Dict, List, Optional
+
+from loguru import logger
+
+from proc_utils import process_tree_rss_mb
+
+
+class CrawlerPool:
+    """브라우저를 유지한 크롤러 인스턴스 풀"""
+
+    def __init__(self, factory: Callable[[], object]):
+        self.factory = factory
+        self.max_runs = int(os.getenv('CRAWLER_MAX_RUNS', '20'))
+        self.max_rss_mb = float(os.getenv('CRAWLER_MAX_RSS_MB', '1500'))
+        self.idle_seconds = float(os.getenv('CRAWLER_IDLE_SECONDS', '1800'))
+
+        self.idle: List[object] = []
+        self.runs: Dict[int, int] = {}         # id(crawler) → 실행 횟수
+        self.last_used: Dict[int, float] = {}  # id(crawler) → 마지막 반납 시각
+        self.lock = asyncio.Lock()
+
+    async def run(self, complex_numbers: List[str]) -> Optional[List[Dict]]:
+        """풀의 크롤러로 크롤링 실행"""
+        crawler = await self.acquire()
+        ok = False
+        try:
+            results = await crawler.run_crawling(complex_numbers, keep_browser=True)
+            ok = True
+            return results
+        finally:
+            await self.release(crawler, ok)
+
+    async def acquire(self):
+        async with self.lock:
+            if self.idle:
+                crawler = self.idle.pop()
+                logger.info(f"재사용 크롤러 사용 (실행 {self.runs.get(id(crawler), 0)}회)")
+                return crawler
+
+        crawler = self.factory()
+        self.runs[id(crawler)] = 0
+        return crawler
+
+    async def release(self, crawler, ok: bool = True):
+        """실행이 끝난 크롤러 반납 (재활용 조건이면 종료)"""
+        key = id(crawler)
+        self.runs[key] = self.runs.get(key, 0) + 1
+
+        reason = None
+        if not ok:
+            reason = "실행 오류"
+        elif self.runs[key] >= self.max_runs:
+            reason = f"최대 실행 횟수 {self.max_runs}회 도달"
+        else:
+            rss_mb = process_tree_rss_mb()
+            if self.max_rss_mb > 0 and rss_mb > self.max_rss_mb:
+                reason = f"메모리 {rss_mb:.0f}MB > {self.max_rss_mb:.0f}MB"
+
+        if reason:
+            logger.info(f"크롤러 재활용: {reason}")
+            await self._close(crawler)
+            return
+
+        self.last_used[key] = time.time()
+        async with self.lock:
+            self.idle.append(crawler)
+
+    async def close_idle(self):
+        """오래 사용되지 않은 크롤러 종료"""
+        now = time.time()
+        async with self.lock:
+            expired = [c for c in self.idle if now - self.last_used.get(id(c), now) > self.idle_seconds]
+            self.idle = [c for c in self.idle if c not in expired]
+
+        for crawler in expired:
+            logger.info(f"유휴 크롤러 종료 ({self.idle_seconds:.0f}초 미사용)")
+            await self._close(crawler)
+
+    async def close_all(self):
+        async with self.lock:
+            crawlers, self.idle = self.idle, []
+        for crawler in crawlers:
+            await self._close(crawler)
+
+    async def _close(self, crawler):
+        self.runs.pop(id(crawler), None)
+        self.last_used.pop(id(crawler), None)
+        try:
+            await crawler.close_browser()
+        except Exception as e:
+            logger.error(f"크롤러 종료 중 오류: {e}")
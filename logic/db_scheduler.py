@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DB 기반 크롤러 스케줄러
+schedules 테이블의 활성 스케줄을 주기적으로 읽어 nextRun 순 우선순위 큐(heap)로 실행한다.
+
+- 스케줄 변경 감지: 활성 스케줄 수 / max("updatedAt")만 폴링, 바뀌었을 때만 전체 재로딩
+- 실행 선점: nextRun을 조건부 UPDATE로 다음 시각으로 옮긴 프로세스만 실행 (중복 실행 방지)
+- 같은 스케줄의 이전 실행이 끝나지 않았으면 이번 회차는 건너뜀
+- 크롤링은 웹 앱 크롤링 API(/api/crawl)에 위임: 매물 DB 저장, lastRun / schedule_logs 기록은
+  앱의 크롤링 워크플로가 수행 (위임 자체가 실패한 경우만 여기서 schedule_logs에 실패 기록)
+
+실행: SCHEDULER_MODE=db python scheduler.py (INTERNAL_API_SECRET 필요)
+주의: Next.js 스케줄러(lib/scheduler.ts)와 동시에 사용하지 마세요.
+"""
+
+import asyncio
+import heapq
+import os
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+import aiohttp
+from loguru import logger
+from psycopg2.extras import RealDictCursor
+
+from db_utils import connect_db
+from scheduler import CrawlerScheduler, build_cron_trigger
+
+SCHEDULE_TIMEZONE = 'Asia/Seoul'
+
+
+def to_db_time(dt: Optional[datetime]) -> Optional[datetime]:
+    """aware datetime → DB 저장용 naive UTC (Prisma DateTime 형식)"""
+    if dt is None:
+        return None
+    return dt.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def from_db_time(dt: Optional[datetime]) -> Optional[datetime]:
+    """DB의 naive UTC → aware datetime"""
+    if dt is None:
+        return None
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt
+
+
+class DBScheduler(CrawlerScheduler):
+    """schedules 테이블 기반 다중 스케줄 실행기"""
+
+    def __init__(self):
+        super().__init__()
+        self.poll_interval = float(os.getenv('SCHEDULE_POLL_SECONDS', '30'))
+        self.db_conn = None
+
+        self.schedules: Dict[str, Dict] = {}   # id → 스케줄 행 (+ trigger)
+        self.versions: Dict[str, int] = {}     # id → 현재 heap 항목 버전 (이전 버전 항목은 무시)
+        self.queue: List[Tuple[float, str, int]] = []  # (실행 시각 timestamp, id, 버전)
+        self.running: Dict[str, asyncio.Task] = {}
+        self.fingerprint = None
+        self.last_poll = 0.0
+
+        # 크롤링 위임 대상 (웹 앱 크롤링 API)
+        self.crawl_api_url = os.getenv('CRAWL_API_URL', 'http://localhost:3000').rstrip('/')
+        self.internal_secret = os.getenv('INTERNAL_API_SECRET', '')
+        self.api_timeout = float(os.getenv('CRAWL_API_TIMEOUT', '60'))
+        if not self.internal_secret:
+            raise RuntimeError(
+                "SCHEDULER_MODE=db는 크롤링을 웹 앱 크롤링 API로 위임하므로 INTERNAL_API_SECRET이 필요합니다 "
+                "(없으면 수집한 매물이 DB에 저장되지 않음)"
+            )
+
+        logger.info(f"DB 스케줄러 모드 (폴링 간격: {self.poll_interval}초, 크롤링 API: {self.crawl_api_url})")
+
+    # ----- DB -----
+
+    def _connect(self) -> bool:
+        try:
+            if self.db_conn and not self.db_conn.closed:
+                return True
+            self.db_conn = connect_db()
+            if not self.db_conn:
+                logger.error("DATABASE_URL이 설정되지 않았습니다.")
+                return False
+            self.db_conn.autocommit = True
+            logger.info("[DB] PostgreSQL 연결 성공")
+            return True
+        except Exception as e:
+            logger.error(f"[DB] 연결 실패: {e}")
+            self.db_conn = None
+            return False
+
+    def _execute(self, query: str, params: tuple = (), fetch: str = None):
+        """쿼리 실행 (연결이 끊어졌으면 한 번 재연결)"""
+        for attempt in range(2):
+            if not self._connect():
+                raise ConnectionError("DB 연결 불가")
+            try:
+                with self.db_conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                    cursor.execute(query, params)
+                    if fetch == 'one':
+                        return cursor.fetchone()
+                    if fetch == 'all':
+                        return cursor.fetchall()
+                    return cursor.rowcount
+            except Exception as e:
+                if attempt == 0 and self.db_conn is not None and self.db_conn.closed:
+                    logger.warning(f"[DB] 연결 끊김, 재연결: {e}")
+                    continue
+                raise
+
+    # ----- 스케줄 로딩 -----
+
+    def _next_fire_time(self, schedule: Dict, now: datetime) -> Optional[datetime]:
+        return schedule['trigger'].get_next_fire_time(None, now)
+
+    def _push(self, schedule_id: str, fire_time: datetime):
+        version = self.versions.get(schedule_id, 0) + 1
+        self.versions[schedule_id] = version
+        self.schedules[schedule_id]['fire_time'] = fire_time
+        heapq.heappush(self.queue, (fire_time.timestamp(), schedule_id, version))
+
+    def refresh_schedules(self, force: bool = False) -> bool:
+        """스케줄 변경 여부 확인 후 변경 시 재로딩 (재로딩했으면 True)"""
+        self.last_poll = time.time()
+        row = self._execute(
+            'SELECT count(*) AS cnt, max("updatedAt") AS updated FROM schedules WHERE "isActive" = true',
+            fetch='one'
+        )
+        fingerprint = (row['cnt'], row['updated'])
+        if not force and fingerprint == self.fingerprint:
+            return False
+        self.fingerprint = fingerprint
+
+        rows = self._execute(
+            '''
+            SELECT id, name, "complexNos", use_bookmarked_complexes, "cronExpr", "nextRun", "userId", "updatedAt"
+            FROM schedules
+            WHERE "isActive" = true
+            ''',
+            fetch='all'
+        )
+
+        now = datetime.now(timezone.utc)
+        grace = timedelta(seconds=self.misfire_grace)
+        active_ids = set()
+
+        for row in rows:
+            schedule_id = row['id']
+            active_ids.add(schedule_id)
+            known = self.schedules.get(schedule_id)
+            if known and known['updatedAt'] == row['updatedAt']:
+                continue
+
+            try:
+                trigger = build_cron_trigger(row['cronExpr'], timezone=SCHEDULE_TIMEZONE)
+            except ValueError as e:
+                logger.error(f"[{row['name']}] {e}")
+                self.versions.pop(schedule_id, None)
+                self.schedules.pop(schedule_id, None)
+                continue
+
+            schedule = dict(row, trigger=trigger)
+            self.schedules[schedule_id] = schedule
+
+            # DB의 nextRun이 유효하면 그대로 사용 (유예 시간 내 지난 회차는 즉시 실행)
+            stored = from_db_time(row['nextRun'])
+            if stored and stored >= now - grace and (not known or known['cronExpr'] == row['cronExpr']):
+                fire_time = stored
+            else:
+                fire_time = self._next_fire_time(schedule, now)
+                if fire_time is None:
+                    continue
+                self._execute(
+                    'UPDATE schedules SET "nextRun" = %s WHERE id = %s',
+                    (to_db_time(fire_time), schedule_id)
+                )
+            self._push(schedule_id, fire_time)
+
+        for schedule_id in set(self.schedules) - active_ids:
+            logger.info(f"스케줄 제거/비활성화: {self.schedules[schedule_id]['name']}")
+            self.schedules.pop(schedule_id)
+            self.versions.pop(schedule_id, None)
+
+        # 무효화된 항목이 쌓이면 heap 재구성
+        if len(self.queue) > 2 * len(self.schedules) + 16:
+            self.queue = [item for item in self.queue if self.versions.get(item[1]) == item[2]]
+            heapq.heapify(self.queue)
+
+        logger.info(f"활성 스케줄 {len(self.schedules)}개 로드")
+        return True
+
+    # ----- 실행 -----
+
+    def resolve_complex_numbers(self, schedule: Dict) -> List[str]:
+        """스케줄 대상 단지 (관심단지 모드면 실행 시점 즐겨찾기 조회)"""
+        if not schedule['use_bookmarked_complexes']:
+            return list(schedule['complexNos'] or [])
+
+        rows = self._execute(
+            '''
+            SELECT c."complexNo"
+            FROM favorites f
+            JOIN complexes c ON c.id = f."complexId"
+            WHERE f."userId" = %s
+            ORDER BY f."createdAt"
+            ''',
+            (schedule['userId'],),
+            fetch='all'
+        )
+        return [row['complexNo'] for row in rows]
+
+    def claim(self, schedule: Dict, next_fire: Optional[datetime]) -> bool:
+        """nextRun을 다음 회차로 옮겨 이번 회차 실행권 획득 (다른 프로세스가 먼저 옮겼으면 False)"""
+        updated = self._execute(
+            '''
+            UPDATE schedules SET "nextRun" = %s
+            WHERE id = %s AND "isActive" = true AND "nextRun" IS NOT DISTINCT FROM %s
+            ''',
+            (to_db_time(next_fire), schedule['id'], to_db_time(schedule['fire_time']))
+        )
+        return updated == 1
+
+    def write_log(self, schedule_id: str, status: str, duration_seconds: int,
+                  articles_count: int, error_message: Optional[str] = None):
+        """schedule_logs 기록 (duration은 Next.js 스케줄러와 동일하게 초 단위)"""
+        try:
+            self._execute(
+                '''
+                INSERT INTO schedule_logs (id, "scheduleId", status, duration, "articlesCount", "errorMessage", "executedAt")
+                VALUES (%s, %s, %s, %s, %s, %s, %s)
+                ''',
+                (str(uuid.uuid4()), schedule_id, status, duration_seconds, articles_count, error_message,
+                 to_db_time(datetime.now(timezone.utc)))
+            )
+        except Exception as e:
+            logger.error(f"[DB] 스케줄 로그 저장 실패: {e}")
+
+    async def request_crawl(self, schedule: Dict, complex_numbers: List[str]) -> str:
+        """웹 앱 크롤링 API에 스케줄 크롤링 요청 (앱이 백그라운드로 수집·DB 저장·로그 기록), crawlId 반환"""
+        payload = {
+            'complexNumbers': complex_numbers,
+            'userId': schedule['userId'],
+            'initiator': 'schedule',
+            'scheduleId': schedule['id'],
+            'scheduleName': schedule['name'],
+        }
+        timeout = aiohttp.ClientTimeout(total=self.api_timeout)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with session.post(
+                f"{self.crawl_api_url}/api/crawl",
+                json=payload,
+                headers={'x-internal-secret': self.internal_secret}
+            ) as response:
+                data = await response.json(content_type=None)
+                if response.status != 200 or not data.get('crawlId'):
+                    raise RuntimeError(f"크롤링 API 요청 실패 (HTTP {response.status}): {data.get('error') or data}")
+                return data['crawlId']
+
+    async def execute_schedule(self, schedule: Dict):
+        """스케줄 1회 실행 (크롤링 API에 위임)"""
+        name = schedule['name']
+        start = time.time()
+        try:
+            complex_numbers = self.resolve_complex_numbers(schedule)
+            if not complex_numbers:
+                logger.warning(f"[{name}] 크롤링 대상 단지가 없어 건너뜀")
+                return
+            complex_numbers = self.plan_complexes(complex_numbers)
+
+            if self.schedule_jitter:
+                await asyncio.sleep(random.uniform(0, self.schedule_jitter))
+
+            logger.info(f"[{name}] 스케줄 크롤링 요청: {len(complex_numbers)}개 단지")
+            crawl_id = await self.request_crawl(schedule, complex_numbers)
+            logger.info(f"[{name}] 크롤링 시작됨 (crawlId: {crawl_id}) - 결과는 crawl_history / schedule_logs 참고")
+        except Exception as e:
+            logger.error(f"[{name}] 스케줄 실행 중 오류: {e}")
+            self.write_log(schedule['id'], 'failed', int(time.time() - start), 0, str(e))
+        finally:
+            self.running.pop(schedule['id'], None)
+
+    def _stored_next_run(self, schedule_id: str, now: datetime) -> Optional[datetime]:
+        """DB에 기록된 nextRun (다른 실행기가 옮긴 값과 동기화용, 지났거나 없으면 None)"""
+        try:
+            row = self._execute('SELECT "nextRun" FROM schedules WHERE id = %s', (schedule_id,), fetch='one')
+        except Exception as e:
+            logger.error(f"[DB] nextRun 조회 실패: {e}")
+            return None
+        stored = from_db_time(row['nextRun']) if row else None
+        return stored if stored and stored > now else None
+
+    def dispatch_due(self):
+        """실행 시각이 된 스케줄 실행"""
+        now = datetime.now(timezone.utc)
+        while self.queue and self.queue[0][0] <= now.timestamp():
+            _, schedule_id, version = heapq.heappop(self.queue)
+            if self.versions.get(schedule_id) != version:
+                continue
+
+            schedule = self.schedules[schedule_id]
+            next_fire = self._next_fire_time(schedule, max(now, schedule['fire_time']) + timedelta(seconds=1))
+
+            try:
+                claimed = self.claim(schedule, next_fire)
+            except Exception as e:
+                logger.error(f"[{schedule['name']}] 실행 선점 실패: {e}")
+                claimed = False
+
+            if not claimed:
+                logger.info(f"[{schedule['name']}] 다른 실행기가 이미 처리한 회차, 건너뜀")
+                next_fire = self._stored_next_run(schedule_id, now) or next_fire
+            elif schedule_id in self.running:
+                logger.warning(f"[{schedule['name']}] 이전 실행이 아직 진행 중이어서 이번 회차 건너뜀")
+            else:
+                self.running[schedule_id] = asyncio.create_task(self.execute_schedule(dict(schedule)))
+
+            if next_fire is not None:
+                self._push(schedule_id, next_fire)
+
+    async def run(self):
+        """스케줄러 실행"""
+        try:
+            self.refresh_schedules(force=True)
+            logger.info("DB 스케줄러 시작됨")
+
+            while True:
+                self.dispatch_due()
+
+                # 다음 실행 시각 또는 다음 폴링 시각 중 빠른 쪽까지 대기
+                wait = self.poll_interval - (time.time() - self.last_poll)
+                if self.queue:
+                    wait = min(wait, self.queue[0][0] - time.time())
+                await asyncio.sleep(max(0.5, wait))
+
+                if time.time() - self.last_poll >= self.poll_interval:
+                    try:
+                        self.refresh_schedules()
+                    except Exception as e:
+                        logger.error(f"스케줄 갱신 실패: {e}")
+                        self.last_poll = time.time()
+
+                    if self.crawler_pool:
+                        await self.crawler_pool.close_idle()
+
+        except KeyboardInterrupt:
+            logger.info("스케줄러 종료 요청됨")
+        except Exception as e:
+            logger.error(f"스케줄러 실행 중 오류: {e}")
+        finally:
+            if self.running:
+                logger.info(f"진행 중인 스케줄 {len(self.running)}개 완료 대기")
+                await asyncio.gather(*self.running.values(), return_exceptions=True)
+            if self.crawler_pool:
+                await self.crawler_pool.close_all()
+            if self.worker_pool:
+                await self.worker_pool.close_all()
+            await self.notifier.close()
+            if self.db_conn:
+                self.db_conn.close()
+            logger.info("DB 스케줄러 종료됨")
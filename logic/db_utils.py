@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PostgreSQL 연결 공통 유틸리티
+크롤러와 스케줄러가 같은 DATABASE_URL(Prisma 형식)을 psycopg2로 사용하기 위한 변환
+"""
+
+import os
+from typing import List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+
+import psycopg2
+
+# psycopg2가 인식하지 못하는 Prisma 전용 파라미터
+PRISMA_ONLY_PARAMS = [
+    'schema',           # Prisma schema
+    'connection_limit', # Prisma connection pool
+    'pool_timeout',     # Prisma pool timeout
+    'connect_timeout'   # Prisma connect timeout
+]
+
+
+def clean_database_url(database_url: str) -> Tuple[str, List[str]]:
+    """Prisma DATABASE_URL을 psycopg2용으로 변환 (변환된 URL, 제거된 파라미터)"""
+    # Docker 내부에서는 'db' 호스트 사용
+    # DATABASE_URL이 localhost로 시작하면 docker 내부이므로 db로 변경
+    if 'localhost' in database_url or '127.0.0.1' in database_url:
+        if os.path.exists('/.dockerenv'):
+            database_url = database_url.replace('localhost', 'db').replace('127.0.0.1', 'db')
+            print(f"[DB] Docker 환경 감지 - 호스트를 'db'로 변경")
+
+    removed_params = []
+    if '?' in database_url:
+        parsed = urlparse(database_url)
+        query_params = parse_qs(parsed.query)
+
+        for param in PRISMA_ONLY_PARAMS:
+            if param in query_params:
+                query_params.pop(param)
+                removed_params.append(param)
+
+        database_url = urlunparse((
+            parsed.scheme,
+            parsed.netloc,
+            parsed.path,
+            parsed.params,
+            urlencode(query_params, doseq=True),
+            parsed.fragment
+        ))
+
+    return database_url, removed_params
+
+
+def connect_db(database_url: Optional[str] = None):
+    """DATABASE_URL로 psycopg2 연결 생성 (URL이 없으면 None)"""
+    database_url = database_url or os.getenv('DATABASE_URL')
+    if not database_url:
+        return None
+
+    database_url, removed_params = clean_database_url(database_url)
+    if removed_params:
+        print(f"[DB] Prisma 전용 파라미터 제거 (psycopg2 호환): {', '.join(removed_params)}")
+    return psycopg2.connect(database_url)
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤링 실패 진단 정보 수집 (FAILURE_DIAGNOSTICS)
+실패할 때마다 전체 페이지 스크린샷을 동기로 찍는 대신,
+페이지별로 최근 네트워크 이벤트와 DOM 스냅샷을 작은 링 버퍼에 계속 담아두고
+실패 시에만 백그라운드로 파일에 기록한다. (실패 경로 비용: 버퍼 복사뿐)
+
+    trace       네트워크 이벤트 + DOM 스냅샷 JSON (기본)
+    screenshot  trace + 화면 스크린샷 (백그라운드, 전체 페이지 아님)
+    off         수집 안 함
+
+파일: {OUTPUT_DIR}/diagnostics/{사유}_{단지번호}_{시각}.json|.png
+실행당 최대 DIAGNOSTICS_MAX_ARTIFACTS건까지만 기록한다.
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Set
+
+# 진단에 불필요한 리소스 (대부분 라우트에서 차단되어 requestfailed 잡음만 생김)
+IGNORED_RESOURCE_TYPES = {'image', 'media', 'font', 'stylesheet'}
+
+MAX_URL_LENGTH = 300
+MAX_DOM_CHARS = 100_000
+
+DOM_SNAPSHOT_SCRIPT = """
+(maxChars) => ({
+    url: location.href,
+    title: document.title,
+    readyState: document.readyState,
+    text: (document.body ? document.body.innerText : '').slice(0, 2000),
+    html: document.documentElement.outerHTML.slice(0, maxChars),
+})
+"""
+
+
+class PageTrace:
+    """페이지 1개의 최근 네트워크 이벤트 / DOM 스냅샷 링 버퍼"""
+
+    def __init__(self, max_events: int, max_snapshots: int):
+        self.events: Deque[Dict] = deque(maxlen=max_events)
+        self.snapshots: Deque[Dict] = deque(maxlen=max_snapshots)
+
+    def add_event(self, kind: str, request, status: Optional[int] = None, failure: Optional[str] = None):
+        try:
+            if request.resource_type in IGNORED_RESOURCE_TYPES:
+                return
+            event = {
+                't': round(time.time(), 3),
+                'kind': kind,
+                'method': request.method,
+                'type': request.resource_type,
+                'url': request.url[:MAX_URL_LENGTH],
+            }
+        except Exception:
+            return
+        if status is not None:
+            event['status'] = status
+        if failure:
+            event['failure'] = failure
+        self.events.append(event)
+
+
+class FailureDiagnostics:
+    """페이지 추적 연결 및 실패 시 진단 파일 비동기 기록"""
+
+    def __init__(self, output_dir: Path):
+        self.mode = os.getenv('FAILURE_DIAGNOSTICS', 'trace').lower()
+        self.max_artifacts = int(os.getenv('DIAGNOSTICS_MAX_ARTIFACTS', '20'))
+        self.max_events = int(os.getenv('DIAGNOSTICS_BUFFER_EVENTS', '200'))
+        self.max_snapshots = 3
+        self.output_dir = Path(output_dir) / 'diagnostics'
+        self.artifact_count = 0
+        self.tasks: Set[asyncio.Task] = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode in ('trace', 'screenshot')
+
+    def start_run(self):
+        """실행 단위 기록 수 초기화"""
+        self.artifact_count = 0
+
+    def _spawn(self, coro):
+        task = asyncio.create_task(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    def attach(self, page) -> Optional[PageTrace]:
+        """페이지 이벤트 구독 (이벤트 핸들러는 버퍼에 추가만 함)"""
+        if not self.enabled:
+            return None
+        trace = PageTrace(self.max_events, self.max_snapshots)
+        page.on('request', lambda request: trace.add_event('request', request))
+        page.on('response', lambda response: trace.add_event('response', response.request, status=response.status))
+        page.on('requestfailed', lambda request: trace.add_event('failed', request, failure=request.failure))
+        page.on('domcontentloaded', lambda _: self._spawn(self._snapshot_dom(page, trace)))
+        return trace
+
+    async def _snapshot_dom(self, page, trace: PageTrace):
+        try:
+            snapshot = await page.evaluate(DOM_SNAPSHOT_SCRIPT, MAX_DOM_CHARS)
+            snapshot['t'] = round(time.time(), 3)
+            trace.snapshots.append(snapshot)
+        except Exception:
+            pass  # 페이지 이동/종료 중이면 생략
+
+    def capture(self, trace: Optional[PageTrace], page, complex_no: str, reason: str, error: str = ''):
+        """실패 시점의 버퍼를 복사해 백그라운드로 기록 (대기 없음)"""
+        if not self.enabled or trace is None:
+            return
+        if self.artifact_count >= self.max_artifacts:
+            if self.artifact_count == self.max_artifacts:
+                print(f"[진단] 실행당 최대 {self.max_artifacts}건 기록 완료, 이후 진단 정보는 생략합니다.")
+                self.artifact_count += 1
+            return
+        self.artifact_count += 1
+
+        try:
+            current_url = page.url if page else None
+        except Exception:
+            current_url = None
+        report = {
+            'complex_no': complex_no,
+            'reason': reason,
+            'error': error,
+            'url': current_url,
+            'captured_at': datetime.now().isoformat(),
+            'events': list(trace.events),
+            'dom_snapshots': list(trace.snapshots),
+        }
+        base_path = self.output_dir / f"{reason}_{complex_no}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        self._spawn(self._write(base_path, report, page if self.mode == 'screenshot' else None))
+
+    async def _write(self, base_path: Path, report: Dict, page=None):
+        try:
+            await asyncio.to_thread(self._write_json, base_path.with_suffix('.json'), report)
+            print(f"[진단] 실패 진단 정보 저장: {base_path.with_suffix('.json')}")
+        except Exception as e:
+            print(f"[WARNING] 진단 정보 저장 실패: {e}")
+
+        if page is not None:
+            try:
+                await page.screenshot(path=str(base_path.with_suffix('.png')), timeout=5000)
+            except Exception as e:
+                print(f"[WARNING] 스크린샷 저장 실패: {e}")
+
+    def _write_json(self, path: Path, report: Dict):
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+
+    async def flush(self, timeout: float = 10):
+        """대기 중인 진단 기록 완료 대기 (브라우저 종료 전 호출)"""
+        pending: List[asyncio.Task] = list(self.tasks)
+        if pending:
+            await asyncio.wait(pending, timeout=timeout)
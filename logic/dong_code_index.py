@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+법정동코드 압축 인덱스
+dong_code_active.txt / 법정동코드 전체자료.txt를 mmap으로 읽는 바이너리 인덱스로 컴파일하여
+코드 → 법정동명, 법정동명/주소 → 코드, 시군구 하위 코드 목록을 빠르게 조회한다.
+
+인덱스 파일 구조 (모든 섹션 8바이트 정렬, 네이티브 바이트 순서):
+    header       매직, 바이트 순서 마커, 항목 수, 키 수, 각 섹션 오프셋
+    codes        uint64[n]    정렬된 10자리 법정동코드
+    flags        uint8[n]     1: 존재, 0: 폐지
+    name_offsets uint32[n+1]  names 블롭 내 오프셋
+    names        UTF-8 블롭   법정동명 (원문)
+    key_offsets  uint32[k+1]  keys 블롭 내 오프셋
+    keys         UTF-8 블롭   정규화된 이름 키 (정렬됨, 접두사 탐색용 평탄화 트라이)
+    key_entries  uint32[k]    키 → 항목 인덱스
+
+사용법:
+    python dong_code_index.py build [원본파일] [인덱스파일]
+    python dong_code_index.py lookup <코드|법정동명|주소>
+    python dong_code_index.py children <시군구코드 5자리>
+"""
+
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_SOURCE = ROOT_DIR / 'dong_code_active.txt'
+FULL_SOURCE = ROOT_DIR / '법정동코드 전체자료.txt'
+
+MAGIC = b'DONGIDX1'
+BYTE_ORDER_MARK = 0x01020304
+# magic, bom, n, k, codes, flags, name_offsets, names, key_offsets, keys, key_entries
+_HEADER = struct.Struct('=8sIIIQQQQQQQ')
+
+# 시도 약칭 (주소 문자열에서 흔히 쓰이는 형태)
+SIDO_ALIASES = {
+    '서울특별시': '서울',
+    '부산광역시': '부산',
+    '대구광역시': '대구',
+    '인천광역시': '인천',
+    '광주광역시': '광주',
+    '대전광역시': '대전',
+    '울산광역시': '울산',
+    '세종특별자치시': '세종',
+    '경기도': '경기',
+    '강원도': '강원',
+    '강원특별자치도': '강원',
+    '충청북도': '충북',
+    '충청남도': '충남',
+    '전라북도': '전북',
+    '전북특별자치도': '전북',
+    '전라남도': '전남',
+    '경상북도': '경북',
+    '경상남도': '경남',
+    '제주특별자치도': '제주',
+}
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_name(name: str) -> str:
+    """공백 제거 + 소문자 (lib/dong-code.ts와 동일한 정규화)"""
+    return _WHITESPACE_RE.sub('', name).lower()
+
+
+def _read_source(source_path: Path, include_abolished: bool = False) -> List[Tuple[int, str, bool]]:
+    """원본 텍스트 파일 파싱 → (코드, 법정동명, 존재여부) 목록"""
+    raw = Path(source_path).read_bytes()
+    try:
+        text = raw.decode('utf-8')
+    except UnicodeDecodeError:
+        # 행정안전부 원본(전체자료)은 CP949 인코딩
+        text = raw.decode('cp949')
+
+    entries = {}
+    for line in text.splitlines()[1:]:  # 헤더 제외
+        parts = [p.strip() for p in line.split('\t')]
+        if len(parts) < 2 or len(parts[0]) != 10 or not parts[0].isdigit() or not parts[1]:
+            continue
+        active = len(parts) < 3 or parts[2] == '존재'
+        if not active and not include_abolished:
+            continue
+        entries[int(parts[0])] = (parts[1], active)
+
+    return [(code, name, active) for code, (name, active) in sorted(entries.items())]
+
+
+def _name_keys(name: str) -> Iterator[str]:
+    """한 법정동명에 대한 검색 키 (전체, 시도 약칭, 시도 생략)"""
+    tokens = name.split(' ')
+    yield normalize_name(name)
+    if len(tokens) > 1:
+        rest = ''.join(tokens[1:])
+        alias = SIDO_ALIASES.get(tokens[0])
+        if alias:
+            yield normalize_name(alias + rest)
+        yield normalize_name(rest)
+
+
+def _pad(buf: bytearray):
+    buf.extend(b'\0' * (-len(buf) % 8))
+
+
+def build_index(source_path: Path = DEFAULT_SOURCE, index_path: Optional[Path] = None,
+                include_abolished: bool = False) -> Path:
+    """원본 텍스트를 바이너리 인덱스로 컴파일"""
+    source_path = Path(source_path)
+    index_path = Path(index_path) if index_path else default_index_path()
+    entries = _read_source(source_path, include_abolished)
+
+    codes = array('Q', (code for code, _, _ in entries))
+    flags = array('B', (1 if active else 0 for _, _, active in entries))
+
+    name_offsets = array('I', [0])
+    names = bytearray()
+    for _, name, _ in entries:
+        names.extend(name.encode('utf-8'))
+        name_offsets.append(len(names))
+
+    # 같은 키가 여러 항목에 해당하면 코드 순으로 모두 유지
+    key_pairs = sorted(
+        {(key.encode('utf-8'), idx) for idx, (_, name, _) in enumerate(entries) for key in _name_keys(name)}
+    )
+    key_offsets = array('I', [0])
+    keys = bytearray()
+    key_entries = array('I')
+    for key, idx in key_pairs:
+        keys.extend(key)
+        key_offsets.append(len(keys))
+        key_entries.append(idx)
+
+    body = bytearray()
+    offsets = []
+    for section in (codes.tobytes(), flags.tobytes(), name_offsets.tobytes(), bytes(names),
+                    key_offsets.tobytes(), bytes(keys), key_entries.tobytes()):
+        offsets.append(_HEADER.size + len(body))
+        body.extend(section)
+        _pad(body)
+
+    header = _HEADER.pack(MAGIC, BYTE_ORDER_MARK, len(entries), len(key_pairs), *offsets)
+
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_path.with_suffix(index_path.suffix + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(body)
+    os.replace(tmp_path, index_path)
+    return index_path
+
+
+class _BlobArray:
+    """오프셋 배열 + 바이트 블롭을 bytes 시퀀스처럼 보이게 하는 뷰 (bisect용)"""
+
+    def __init__(self, offsets: memoryview, blob: memoryview):
+        self.offsets = offsets
+        self.blob = blob
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> bytes:
+        return bytes(self.blob[self.offsets[i]:self.offsets[i + 1]])
+
+
+class DongCodeIndex:
+    """mmap 기반 법정동코드 조회"""
+
+    def __init__(self, index_path: Path):
+        self.index_path = Path(index_path)
+        self._file = open(self.index_path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+
+        (magic, bom, n, k, codes_off, flags_off, name_off_off, names_off,
+         key_off_off, keys_off, key_entries_off) = _HEADER.unpack_from(view, 0)
+        if magic != MAGIC or bom != BYTE_ORDER_MARK:
+            view.release()
+            self.close()
+            raise ValueError(f"법정동코드 인덱스 형식이 올바르지 않습니다: {self.index_path}")
+
+        self._views = [
+            view[codes_off:codes_off + 8 * n].cast('Q'),
+            view[flags_off:flags_off + n],
+            view[name_off_off:name_off_off + 4 * (n + 1)].cast('I'),
+            view[key_off_off:key_off_off + 4 * (k + 1)].cast('I'),
+            view[key_entries_off:key_entries_off + 4 * k].cast('I'),
+            view,
+        ]
+        self.codes, self.flags, name_offsets, key_offsets, self.key_entries, _ = self._views
+        self.names = _BlobArray(name_offsets, view[names_off:])
+        self.keys = _BlobArray(key_offsets, view[keys_off:])
+        self._views += [self.names.blob, self.keys.blob]
+
+    def close(self):
+        for v in reversed(getattr(self, '_views', [])):
+            v.release()
+        self._views = []
+        if getattr(self, '_mmap', None) is not None:
+            self._mmap.close()
+            self._mmap = None
+        if getattr(self, '_file', None) is not None:
+            self._file.close()
+            self._file = None
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def _entry(self, idx: int) -> Dict:
+        code = f"{self.codes[idx]:010d}"
+        return {
+            'code': code,
+            'lawdCd': code[:5],
+            'name': self.names[idx].decode('utf-8'),
+            'active': bool(self.flags[idx]),
+        }
+
+    def _find_code_index(self, code: int) -> Optional[int]:
+        idx = bisect_left(self.codes, code)
+        if idx < len(self.codes) and self.codes[idx] == code:
+            return idx
+        return None
+
+    def get_name(self, code) -> Optional[str]:
+        """10자리 법정동코드 → 법정동명"""
+        idx = self._find_code_index(int(code))
+        return self.names[idx].decode('utf-8') if idx is not None else None
+
+    def _key_range(self, key: bytes) -> Tuple[int, int]:
+        """정확히 key와 같은 키 구간 [lo, hi)"""
+        lo = bisect_left(self.keys, key)
+        hi = lo
+        while hi < len(self.keys) and self.keys[hi] == key:
+            hi += 1
+        return lo, hi
+
+    def find(self, name: str) -> Optional[Dict]:
+        """법정동명 정확히 일치 (공백 무시, 시도 약칭 허용)"""
+        lo, hi = self._key_range(normalize_name(name).encode('utf-8'))
+        return self._entry(self.key_entries[lo]) if hi > lo else None
+
+    def resolve_address(self, address: str) -> Optional[Dict]:
+        """
+        주소 문자열에서 가장 길게 일치하는 법정동 찾기
+        예: "경기도 화성시 반송동 93" → 반송동 항목 (lawdCd: 41590)
+        """
+        normalized = normalize_name(address).encode('utf-8')
+        # 키는 정렬되어 있으므로 접두사를 줄여가며 정확 일치를 찾으면 최장 일치가 된다
+        for length in range(len(normalized), 0, -1):
+            prefix = normalized[:length]
+            try:
+                prefix.decode('utf-8')
+            except UnicodeDecodeError:
+                continue  # 멀티바이트 문자 중간에서 잘린 경우
+            lo, hi = self._key_range(prefix)
+            if hi > lo:
+                # 여러 시도에 같은 이름이 있으면 존재하는 코드를 우선
+                candidates = [self.key_entries[i] for i in range(lo, hi)]
+                best = next((c for c in candidates if self.flags[c]), candidates[0])
+                return self._entry(best)
+        return None
+
+    def prefix_search(self, prefix: str, limit: int = 20) -> List[Dict]:
+        """정규화된 이름이 prefix로 시작하는 항목 (자동완성용)"""
+        key = normalize_name(prefix).encode('utf-8')
+        results = []
+        seen = set()
+        i = bisect_left(self.keys, key)
+        while i < len(self.keys) and len(results) < limit:
+            if not self.keys[i].startswith(key):
+                break
+            idx = self.key_entries[i]
+            if idx not in seen:
+                seen.add(idx)
+                results.append(self._entry(idx))
+            i += 1
+        return results
+
+    def children(self, sgg_code: str, include_abolished: bool = False) -> List[Dict]:
+        """시군구코드(5자리) 하위 읍면동/리 코드 목록"""
+        base = int(str(sgg_code)[:5]) * 100000
+        lo = bisect_left(self.codes, base + 1)  # 시군구 자체(xxxxx00000) 제외
+        hi = bisect_left(self.codes, base + 100000)
+        return [
+            self._entry(i) for i in range(lo, hi)
+            if include_abolished or self.flags[i]
+        ]
+
+
+def default_index_path() -> Path:
+    return Path(os.getenv('DONG_CODE_INDEX', Path(os.getenv('OUTPUT_DIR', './crawled_data')) / 'dong_code.idx'))
+
+
+# 인덱스 파일 경로별 캐시 (프로세스 내 재사용)
+_index_cache: Dict[Path, DongCodeIndex] = {}
+
+
+def get_dong_code_index(source_path: Path = DEFAULT_SOURCE,
+                        index_path: Optional[Path] = None) -> Optional[DongCodeIndex]:
+    """
+    인덱스 로드 (없거나 원본보다 오래되었으면 컴파일)
+    원본 파일도 인덱스도 없으면 None
+    """
+    index_path = Path(index_path) if index_path else default_index_path()
+    cache_key = index_path.resolve()
+    if cache_key in _index_cache:
+        return _index_cache[cache_key]
+
+    source_path = Path(source_path)
+    stale = not index_path.exists() or (
+        source_path.exists() and source_path.stat().st_mtime > index_path.stat().st_mtime
+    )
+    if stale:
+        if not source_path.exists():
+            return None
+        build_index(source_path, index_path)
+
+    _index_cache[cache_key] = DongCodeIndex(index_path)
+    return _index_cache[cache_key]
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] in ['--help', '-h']:
+        print(__doc__)
+        return
+
+    command = sys.argv[1]
+    if command == 'build':
+        source = Path(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_SOURCE
+        output = Path(sys.argv[3]) if len(sys.argv) > 3 else default_index_path()
+        include_abolished = source == FULL_SOURCE or '--include-abolished' in sys.argv
+        path = build_index(source, output, include_abolished=include_abolished)
+        index = DongCodeIndex(path)
+        print(f"✅ 법정동코드 인덱스 생성: {path} ({len(index)}개, {path.stat().st_size:,} bytes)")
+        index.close()
+        return
+
+    index = get_dong_code_index()
+    if index is None:
+        print("❌ 법정동코드 원본 파일을 찾을 수 없습니다.")
+        sys.exit(1)
+
+    query = ' '.join(sys.argv[2:])
+    if command == 'lookup':
+        if query.isdigit() and len(query) == 10:
+            print(index.get_name(query))
+        else:
+            print(index.find(query) or index.resolve_address(query))
+    elif command == 'children':
+        for entry in index.children(query):
+            print(f"{entry['code']}\t{entry['name']}")
+    else:
+        print(f"알 수 없는 명령: {command}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+간단 크롤러용 디스크 HTTP 응답 캐시
+URL + 쿼리 파라미터를 키로 JSON 응답을 저장하고,
+
+- 엔드포인트별 TTL 이내면 네트워크 없이 캐시 응답 사용
+- TTL이 지났으면 ETag/Last-Modified로 조건부 요청 (304면 캐시 재사용)
+- 서버 오류(5xx/429)나 연결 실패 시 max_stale초 이내의 만료된 캐시 응답 사용 (stale-if-error)
+- 전체 크기가 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (파일 mtime 기준 LRU)
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from loguru import logger
+
+
+def cache_key(url: str, params: Optional[Dict] = None) -> str:
+    query = '&'.join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+    return hashlib.sha1(f"{url}?{query}".encode('utf-8')).hexdigest()
+
+
+class HttpResponseCache:
+    """ETag/Last-Modified 조건부 요청을 지원하는 JSON 응답 캐시"""
+
+    def __init__(self, cache_dir: Path, ttls: Dict[str, float], max_bytes: int, max_stale: float = 86400):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttls = ttls
+        self.max_bytes = max_bytes
+        self.max_stale = max_stale
+        self.stats = {'hit': 0, 'revalidated': 0, 'stale': 0, 'miss': 0, 'evicted': 0}
+
+        # 파일 크기 인덱스 (LRU 정리 시 디렉토리 재탐색 최소화)
+        self.sizes: Dict[str, int] = {}
+        for path in self.cache_dir.glob('*.json'):
+            self.sizes[path.stem] = path.stat().st_size
+        self.total_bytes = sum(self.sizes.values())
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def lookup(self, endpoint: str, url: str, params: Optional[Dict] = None) -> Tuple[Optional[Dict], bool]:
+        """(캐시 항목, TTL 이내 여부) - 항목이 없으면 (None, False)"""
+        key = cache_key(url, params)
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            os.utime(path)  # LRU 갱신 (그 사이 정리로 삭제됐으면 미스)
+        except (OSError, ValueError):
+            self.stats['miss'] += 1
+            return None, False
+
+        fresh = time.time() - entry['stored_at'] < self.ttls.get(endpoint, 0)
+        if fresh:
+            self.stats['hit'] += 1
+        return entry, fresh
+
+    def conditional_headers(self, entry: Optional[Dict]) -> Dict[str, str]:
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def revalidated(self, url: str, params: Optional[Dict], entry: Dict) -> Dict:
+        """304 응답: 캐시 항목의 저장 시각만 갱신"""
+        self.stats['revalidated'] += 1
+        entry['stored_at'] = time.time()
+        self._write(cache_key(url, params), entry)
+        return entry['data']
+
+    def stale(self, entry: Optional[Dict]) -> Optional[Dict]:
+        """서버 오류/연결 실패 시 대신 사용할 만료된 캐시 데이터 (max_stale초 지난 항목은 None)"""
+        if not entry or time.time() - entry['stored_at'] >= self.max_stale:
+            return None
+        self.stats['stale'] += 1
+        return entry['data']
+
+    def store(self, url: str, params: Optional[Dict], data, headers) -> None:
+        """200 응답 저장 (조건부 요청에 필요한 검증자 포함)"""
+        key = cache_key(url, params)
+        if key in self.sizes:
+            self.stats['miss'] += 1  # 만료 후 재검증 실패(변경됨)도 미스로 집계
+        entry = {
+            'url': url,
+            'params': params or {},
+            'stored_at': time.time(),
+            'etag': headers.get('ETag') if headers else None,
+            'last_modified': headers.get('Last-Modified') if headers else None,
+            'data': data,
+        }
+        self._write(key, entry)
+        self._evict()
+
+    def _write(self, key: str, entry: Dict):
+        path = self._path(key)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+        size = path.stat().st_size
+        self.total_bytes += size - self.sizes.get(key, 0)
+        self.sizes[key] = size
+
+    def _evict(self):
+        if self.total_bytes <= self.max_bytes:
+            return
+
+        entries = []
+        for key in list(self.sizes):
+            try:
+                entries.append((self._path(key).stat().st_mtime, key))
+            except OSError:
+                self.total_bytes -= self.sizes.pop(key)
+
+        # 상한의 90%까지 여유 있게 정리 (저장할 때마다 정리가 반복되지 않도록)
+        target = self.max_bytes * 0.9
+        for _, key in sorted(entries):
+            if self.total_bytes <= target:
+                break
+            try:
+                self._path(key).unlink()
+            except OSError:
+                pass
+            self.total_bytes -= self.sizes.pop(key)
+            self.stats['evicted'] += 1
+
+    def log_stats(self):
+        requests = self.stats['hit'] + self.stats['revalidated'] + self.stats['miss']
+        hit_rate = (self.stats['hit'] + self.stats['revalidated']) / requests * 100 if requests else 0.0
+        logger.info(
+            f"HTTP 캐시: 적중 {self.stats['hit']}, 재검증(304) {self.stats['revalidated']}, "
+            f"오류 시 만료 응답 {self.stats['stale']}, 미스 {self.stats['miss']}, 삭제 {self.stats['evicted']} (적중률 {hit_rate:.1f}%, "
+            f"{self.total_bytes / 1024 / 1024:.1f}MB)"
+        )
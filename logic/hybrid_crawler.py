@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+하이브리드 네이버 부동산 크롤러 (CRAWLER_BACKEND=hybrid)
+단지마다 가벼운 HTTP 크롤러(simple_crawler)를 먼저 시도하고,
+응답 형식/완전성 검증에 실패한 단지만 Playwright 브라우저로 다시 크롤링한다.
+
+- 브라우저는 폴백 대상이 있을 때만 실행 (전부 HTTP로 끝나면 Chromium을 띄우지 않음)
+- 단지별 사용 백엔드는 결과의 crawling_info.backend에 기록
+- HTTP 실패 단지는 backend_preferences.json에 기록해 다음 실행부터 바로 브라우저 사용
+  (BACKEND_REPROBE_HOURS마다 HTTP 재시도)
+"""
+
+import asyncio
+import os
+from typing import Dict, List, Optional
+
+from backend_preference import BackendPreferenceStore
+from crawl_filters import CrawlFilters
+from nas_playwright_crawler import NASNaverRealEstateCrawler, count_articles, get_kst_now, pop_time_budget
+from simple_crawler import SimpleNaverRealEstateCrawler
+
+# 전체 매물 수(totalCount) 대비 최소 수집 비율 (페이지 사이 매물 변동으로 인한 소폭 누락 허용)
+MIN_COMPLETENESS = 0.95
+
+
+def validate_http_result(complex_no: str, result: Dict) -> Optional[str]:
+    """HTTP 크롤링 결과 검증, 문제가 있으면 사유 반환 (정상이면 None)"""
+    if 'error' in result:
+        return f"오류: {result['error']}"
+
+    overview = result.get('overview')
+    if not isinstance(overview, dict) or str(overview.get('complexNo', '')) != str(complex_no):
+        return "단지 개요 없음"
+
+    articles = result.get('articles')
+    if not isinstance(articles, dict) or not isinstance(articles.get('articleList'), list):
+        return "매물 목록 없음"
+
+    article_list = articles['articleList']
+    if any(not isinstance(a, dict) or not a.get('articleNo') for a in article_list):
+        return "매물 형식 오류"
+    if articles.get('failedPages'):
+        return f"페이지 수집 실패 {articles['failedPages']}"
+
+    total_count = articles.get('totalCount')
+    if isinstance(total_count, int) and len(article_list) < total_count * MIN_COMPLETENESS:
+        return f"매물 누락 ({len(article_list)}/{total_count})"
+    return None
+
+
+class HybridNaverRealEstateCrawler(NASNaverRealEstateCrawler):
+    """HTTP 우선, 실패 단지만 브라우저로 크롤링하는 크롤러"""
+
+    def __init__(self, crawl_id: Optional[str] = None, filters: Optional[CrawlFilters] = None,
+                 time_budget: Optional[float] = None):
+        super().__init__(crawl_id=crawl_id, filters=filters, time_budget=time_budget)
+        self.backend_store = BackendPreferenceStore(self.output_dir)
+        self.keep_browser = False
+        print(f"- 백엔드: 하이브리드 (HTTP 우선, 실패 시 브라우저)")
+
+    async def prepare_browser(self, keep_browser: bool = False):
+        # 브라우저는 폴백 대상이 생길 때 실행
+        self.keep_browser = keep_browser
+
+    async def crawl_http(self, complex_numbers: List[str]) -> List[Dict]:
+        http_crawler = SimpleNaverRealEstateCrawler(filters=self.filters)
+        try:
+            await http_crawler.setup_session()
+            return await http_crawler.crawl_multiple_complexes(complex_numbers, deadline=self.deadline)
+        finally:
+            await http_crawler.close_session()
+            if http_crawler.http_cache:
+                http_crawler.http_cache.log_stats()
+
+    def _tag(self, result: Dict, backend: str) -> Dict:
+        result.setdefault('crawling_info', {})['backend'] = backend
+        return result
+
+    async def crawl_targets(self, complex_numbers: List[str]) -> List[Dict]:
+        preferences = self.backend_store.preferences(complex_numbers)
+        http_targets = [no for no in complex_numbers if preferences[no] == 'http']
+        results: Dict[str, Dict] = {}
+        http_failed = set()
+
+        # 1. HTTP 경로
+        if http_targets:
+            print(f"🌐 HTTP 크롤링: {len(http_targets)}개 단지")
+            try:
+                http_results = await self.crawl_http(http_targets)
+            except Exception as e:
+                print(f"[WARNING] HTTP 크롤링 실패, 전체 브라우저로 전환: {e}")
+                http_results = [{'error': str(e)} for _ in http_targets]
+
+            for complex_no, result in zip(http_targets, http_results):
+                if result.get('deferred'):
+                    # 시간 예산 초과로 시작하지 못한 단지는 브라우저로 넘기지 않고 연기
+                    self.deferred_complexes.append(complex_no)
+                    results[complex_no] = self._deferred_result(complex_no)
+                    continue
+                reason = validate_http_result(complex_no, result)
+                if reason:
+                    print(f"⚠️ 단지 {complex_no} HTTP 결과 사용 불가 ({reason}) → 브라우저로 재시도")
+                    http_failed.add(complex_no)
+                    continue
+                result['overview'] = self.summarize_overview(result['overview'])
+                result['crawling_info']['crawling_date'] = get_kst_now().isoformat()
+                results[complex_no] = self._tag(result, 'http')
+
+            self.update_status(
+                status="running",
+                progress=len(results),
+                total=len(complex_numbers),
+                message=f"🌐 HTTP 수집 완료: {len(results)}/{len(http_targets)}개 단지",
+                items_collected=count_articles(list(results.values()))
+            )
+
+        # 2. 브라우저 폴백 (HTTP 실패 + 브라우저 선호 단지)
+        fallback = [no for no in complex_numbers if no not in results]
+        if fallback:
+            print(f"🖥️  브라우저 크롤링: {len(fallback)}개 단지")
+            await super().prepare_browser(self.keep_browser)
+            # 시간 예산이 있으면 단지 하나여도 마감 확인을 거치도록 crawl_multiple_complexes 사용
+            if self.deadline is not None:
+                browser_results = await self.crawl_multiple_complexes(fallback)
+            else:
+                browser_results = await super().crawl_targets(fallback)
+            for complex_no, result in zip(fallback, browser_results):
+                results[complex_no] = self._tag(result, 'browser')
+
+        # 3. 백엔드 선호 기록 (브라우저로도 실패한 단지는 HTTP 문제로 단정할 수 없으므로 제외)
+        outcomes = {
+            no: True for no in http_targets
+            if no not in http_failed and not results[no].get('deferred')
+        }
+        outcomes.update({
+            no: False for no in http_failed
+            if 'error' not in results[no] and 'articles' in results[no]
+        })
+        try:
+            self.backend_store.record(outcomes)
+        except Exception as e:
+            print(f"[WARNING] 백엔드 선호 기록 실패: {e}")
+
+        deferred = [no for no in complex_numbers if results[no].get('deferred')]
+        http_done = len(complex_numbers) - len(fallback) - len(set(deferred) - set(fallback))
+        print(f"📊 백엔드: HTTP {http_done}개, 브라우저 {len(fallback)}개, 연기 {len(deferred)}개")
+        return [results[no] for no in complex_numbers]
+
+
+def create_crawler(crawl_id: Optional[str] = None) -> NASNaverRealEstateCrawler:
+    """CRAWLER_BACKEND(browser | hybrid)에 맞는 크롤러 생성"""
+    if os.getenv('CRAWLER_BACKEND', 'browser').lower() == 'hybrid':
+        return HybridNaverRealEstateCrawler(crawl_id=crawl_id)
+    return NASNaverRealEstateCrawler(crawl_id=crawl_id)
+
+
+async def main():
+    """메인 함수 (nas_playwright_crawler.py와 같은 인자)"""
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == '--info-only':
+        from nas_playwright_crawler import main as browser_main
+        await browser_main()
+        return
+
+    filters, args = CrawlFilters.from_args(sys.argv[1:])
+    time_budget, args = pop_time_budget(args)
+    crawl_id = None
+    complex_numbers = ['22065']  # 기본값
+
+    if len(args) > 0:
+        complex_numbers = [num.strip() for num in args[0].split(',') if num.strip()]
+
+    if len(args) > 1:
+        crawl_id = args[1].strip()
+        print(f"🔗 Crawl ID: {crawl_id}")
+
+    print(f"📋 크롤링 대상 단지: {complex_numbers}")
+    if filters.active:
+        print(f"🔎 크롤링 필터: {filters.describe()}")
+
+    crawler = HybridNaverRealEstateCrawler(crawl_id=crawl_id, filters=filters, time_budget=time_budget)
+    await crawler.run_crawling(complex_numbers)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -10,9 +10,11 @@ import json
 import os
 import time
 import random
+from collections import deque
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from playwright.async_api import async_playwright, Browser, Page, BrowserContext
 import pandas as pd
@@ -20,12 +22,143 @@ from dotenv import load_dotenv
 import psycopg2
 from psycopg2.extras import RealDictCursor
 
+from circuit_breaker import HALF_OPEN, get_shared_breaker
+from complex_stats import ComplexStatsStore
+from cost_model import estimate_costs, estimate_duration, estimate_total_seconds, plan_time_budget
+from crawl_filters import CrawlFilters
+from db_utils import connect_db
+from diagnostics import FailureDiagnostics
+from dong_code_index import get_dong_code_index
+from price_normalizer import normalize_article_prices
+from proc_utils import browser_rss_mb
+from retry_queue import RetryQueue, classify_error
+from spatial_index import update_spatial_index
+from traffic_replay import TrafficRecorder, TrafficReplayer
+
 # 환경변수 로드
 load_dotenv()
 
 # 한국 시간대 (UTC+9)
 KST = timezone(timedelta(hours=9))
 
+# 시간 예산 중 결과 저장/정리에 남겨둘 시간 (초)
+TIME_BUDGET_RESERVE_SECONDS = 30
+
+# 봇 탐지 차단 후 교체할 브라우저 신원 (뷰포트 / User-Agent)
+BROWSER_IDENTITIES = [
+    {
+        'viewport': {'width': 1280, 'height': 720},
+        'user_agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+    },
+    {
+        'viewport': {'width': 1366, 'height': 768},
+        'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+    },
+    {
+        'viewport': {'width': 1440, 'height': 900},
+        'user_agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36',
+    },
+    {
+        'viewport': {'width': 1536, 'height': 864},
+        'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36',
+    },
+]
+# 페이지 내 스크롤 에이전트 (add_init_script로 페이지마다 한 번 설치)
+# 매물 API 응답은 PerformanceObserver로 감지하고, 스크롤 끝/정체 판단까지 페이지 안에서 처리한 뒤
+# 종료 시에만 __scrollAgentReport 바인딩으로 Python에 보고한다.
+SCROLL_AGENT_SCRIPT = """
+(() => {
+    if (window.__scrollAgent) return;
+    const API_PATTERN = '/api/articles/complex/';
+    const SELECTORS = [
+        '.item_list',
+        'div[class*="list_contents"]',
+        'div[class*="item_list"]',
+        'div[class*="article_list"]'
+    ];
+    let apiResponses = 0;
+    let lastApiAt = 0;
+
+    try {
+        new PerformanceObserver((list) => {
+            for (const entry of list.getEntries()) {
+                if (entry.name.includes(API_PATTERN)) {
+                    apiResponses++;
+                    lastApiAt = performance.now();
+                }
+            }
+        }).observe({ type: 'resource' });
+    } catch (e) {}
+
+    const findContainer = () => {
+        let container = null;
+        for (const selector of SELECTORS) {
+            container = document.querySelector(selector);
+            if (container && container.scrollHeight > container.clientHeight) break;
+        }
+        return container;
+    };
+    const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+    const report = (result) => {
+        if (window.__scrollAgentReport) window.__scrollAgentReport(Object.assign({ apiResponses }, result));
+    };
+
+    window.__scrollAgent = {
+        running: false,
+        stopped: false,
+        async run(opts) {
+            let attempts = 0, idle = 0, stalled = 0, seen = apiResponses;
+            try {
+                while (attempts < opts.maxAttempts) {
+                    if (this.stopped) return report({ reason: 'stopped', attempts });
+                    const container = findContainer();
+                    if (!container) return report({ reason: 'no_container', attempts });
+
+                    const before = container.scrollTop;
+                    container.scrollTop += opts.step;
+                    const moved = container.scrollTop > before;
+
+                    // 최근 API 응답이 있으면 짧게, 없으면 길게 대기
+                    await sleep(performance.now() - lastApiAt < 500 ? opts.fastWait : opts.slowWait);
+                    attempts++;
+
+                    const newData = apiResponses > seen;
+                    seen = apiResponses;
+                    if (!moved && !newData) {
+                        if (++idle >= opts.maxIdle) {
+                            return report({ reason: 'end', attempts, scrollTop: container.scrollTop, scrollHeight: container.scrollHeight });
+                        }
+                    } else {
+                        idle = 0;
+                    }
+                    stalled = newData ? 0 : stalled + 1;
+                    if (stalled >= opts.stallLimit) return report({ reason: 'stalled', attempts });
+                }
+                report({ reason: 'max_attempts', attempts });
+            } catch (e) {
+                report({ reason: 'error', error: String(e), attempts });
+            } finally {
+                this.running = false;
+            }
+        },
+        start(opts) {
+            if (this.running) return false;
+            this.running = true;
+            this.stopped = false;
+            this.run(opts);  // 완료를 기다리지 않음 (결과는 바인딩으로 보고)
+            return true;
+        },
+        stop() {
+            this.stopped = true;
+        }
+    };
+})();
+"""
+
+SCROLL_AGENT_START_SCRIPT = "(opts) => window.__scrollAgent ? window.__scrollAgent.start(opts) : false"
+SCROLL_AGENT_STOP_SCRIPT = "() => window.__scrollAgent && window.__scrollAgent.stop()"
+
+
 def get_kst_now():
     """한국 시간으로 현재 시각 반환"""
     return datetime.now(KST)
@@ -39,14 +172,85 @@ async def random_sleep(min_sec: float = 1.5, max_sec: float = 4.0):
     await asyncio.sleep(delay)
 
 
+def merge_articles(article_list: List[Dict], collected_ids: set, all_articles: List[Dict]) -> int:
+    """
+    API 응답의 매물을 중복 제거하며 누적 목록에 추가
+    반환값: 새로 추가된 매물 수
+    """
+    new_count = 0
+    for article in article_list:
+        article_id = article.get('articleNo') or article.get('id')
+        if article_id and article_id not in collected_ids:
+            collected_ids.add(article_id)
+            all_articles.append(article)
+            new_count += 1
+    return new_count
+
+
+def article_list_complete(all_articles: List[Dict], total_count: Optional[int], is_more_data: bool,
+                          grouped_articles: Optional[List[Dict]] = None) -> bool:
+    """서버가 알려준 전체 매물 수(totalCount)만큼 수집했거나 마지막 페이지(isMoreData=false)면 True
+    동일매물 묶기 응답의 대표 매물(grouped_articles)은 1건이 sameAddrCnt건을 대신하므로 묶인 수까지 합산해 비교
+    (묶기 전 응답으로 모은 매물은 이미 개별 매물이라 합산하지 않음)"""
+    if not is_more_data:
+        return True
+    if not total_count:
+        return False
+    if len(all_articles) >= total_count:
+        return True
+    if grouped_articles:
+        represented = sum(max(1, int(a.get('sameAddrCnt') or 1)) for a in grouped_articles)
+        return represented >= total_count
+    return False
+
+
+def with_article_params(url: str, params: Dict[str, str]) -> str:
+    """매물 목록 API URL의 쿼리 파라미터 교체 (정렬/거래유형 등)"""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in params]
+    query.extend(params.items())
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+# 대형 단지 구간 크롤링 단위 (거래유형별, 단기임대는 월세와 함께)
+TRADE_TYPE_SLICES = [
+    ('매매', 'A1'),
+    ('전세', 'B1'),
+    ('월세', 'B2:B3'),
+]
+
+
+def plan_article_slices(previous_articles: List[Dict]) -> List[Dict]:
+    """직전 스냅샷 기준 거래유형별 구간 (expected: 직전 매물 수, 구간 실패 판정용)"""
+    slices = []
+    for name, trade_types in TRADE_TYPE_SLICES:
+        codes = set(trade_types.split(':'))
+        expected = sum(1 for a in previous_articles if a.get('tradeTypeCode') in codes)
+        slices.append({'name': name, 'params': {'tradeType': trade_types}, 'expected': expected})
+    return slices
+
+
+def count_articles(results: List[Dict]) -> int:
+    """크롤링 결과 목록의 전체 매물 수"""
+    total = 0
+    for r in results:
+        if 'articles' in r and 'articleList' in r['articles']:
+            total += len(r['articles']['articleList'])
+    return total
+
+
 class NASNaverRealEstateCrawler:
     """NAS 환경용 네이버 부동산 크롤러"""
 
-    def __init__(self, crawl_id: Optional[str] = None):
+    def __init__(self, crawl_id: Optional[str] = None, filters: Optional[CrawlFilters] = None,
+                 time_budget: Optional[float] = None):
+        self.playwright = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
         self.status_file = None  # 진행 상태 파일 (백업용)
+        self.progress_callback = None  # update_status마다 상태 dict를 받는 콜백 (선택)
+        self.last_output_file: Optional[Path] = None  # 마지막 save_data JSON 경로
         self.start_time = None  # 크롤링 시작 시간
         self.results = []
         self.output_dir = Path(os.getenv('OUTPUT_DIR', './crawled_data'))
@@ -60,9 +264,70 @@ class NASNaverRealEstateCrawler:
         # Retry 설정
         self.max_retries = int(os.getenv('MAX_RETRIES', '3'))  # 최대 재시도 횟수
         self.retry_delay = float(os.getenv('RETRY_DELAY', '5.0'))  # 재시도 간격 (초)
+        # deferred: 실패 단지를 재시도 큐로 미루고 다음 단지 진행 / inline: 그 자리에서 대기 후 재시도
+        self.retry_mode = os.getenv('RETRY_MODE', 'deferred').lower()
+        self.last_overview_error: Optional[str] = None  # 마지막 개요 수집 실패 사유 (재시도 분류용)
 
         # 봇 감지 회피 설정
         self.first_request = True  # 첫 요청 플래그 (워밍업용)
+        self.identity_index = 0  # BROWSER_IDENTITIES 중 현재 신원
+
+        # 페이지 내 스크롤 에이전트 (false: 매 스크롤마다 page.evaluate 호출하는 기존 방식)
+        self.scroll_agent_enabled = os.getenv('SCROLL_AGENT', 'true').lower() == 'true'
+        self.scroll_agent_futures: Dict[Page, asyncio.Future] = {}  # 페이지별 에이전트 보고 대기
+
+        # 크롤링 필터 (거래유형/가격/면적, 매물 목록 API 파라미터로 적용, 명령행에서 요청한 경우만)
+        self.filters = filters or CrawlFilters()
+
+        # 시간 예산 (초, 실행기 타임아웃 전에 남은 단지를 연기하고 정상 종료)
+        self.time_budget = time_budget if time_budget is not None else float(os.getenv('CRAWL_TIME_BUDGET', '0'))
+        self.deadline: Optional[float] = None
+        self.complex_costs: Dict[str, float] = {}  # 단지별 예상 소요 시간 (초)
+        self.planned_cost = 0.0  # 이번 실행 대상 단지의 예측 비용 합계 (ETA용)
+        self.completed_cost = 0.0  # 완료한 단지의 예측 비용 합계
+        self.deferred_complexes: List[str] = []
+
+        # 대형 단지 구간 크롤링: 직전 매물 수가 SHARD_MIN_ARTICLES 이상이면 거래유형별로 나눠 SHARD_PAGES개 페이지에서 병렬 수집
+        self.shard_min_articles = int(os.getenv('SHARD_MIN_ARTICLES', '600'))  # 0: 사용 안 함
+        self.shard_pages = max(1, int(os.getenv('SHARD_PAGES', '3')))
+
+        # 증분 크롤링: 최신순 목록에서 직전 스냅샷 매물이 N건 연속되면 스크롤 중단 (FULL_SWEEP_HOURS마다 전체 크롤링)
+        self.incremental_enabled = os.getenv('INCREMENTAL_CRAWL', 'false').lower() == 'true'
+        self.incremental_known_run = int(os.getenv('INCREMENTAL_KNOWN_RUN', '20'))
+        self.article_order: Optional[str] = None  # 매물 목록 API 정렬 강제 (라우트에서 재작성)
+
+        # 봇 탐지 서킷 브레이커 (프로세스 내 모든 크롤러 공유)
+        self.breaker = get_shared_breaker()
+        self.breaker_trips_seen = self.breaker.trips
+
+        # 브라우저 메모리 감시 (긴 크롤링에서 페이지/컨텍스트를 주기적으로 재활용)
+        self.page_recycle_every = int(os.getenv('PAGE_RECYCLE_EVERY', '10'))  # N개 단지마다 페이지 재생성 (0: 안 함)
+        self.context_recycle_every = int(os.getenv('CONTEXT_RECYCLE_EVERY', '50'))  # N개 단지마다 컨텍스트 재생성 (0: 안 함)
+        self.browser_max_rss_mb = float(os.getenv('BROWSER_MAX_RSS_MB', '1200'))  # 초과 시 컨텍스트 재생성 (0: 안 함)
+        self.complexes_since_page = 0
+        self.complexes_since_context = 0
+        self.browser_stats = {
+            'rss_mb': 0.0, 'renderer_rss_mb': 0.0, 'peak_rss_mb': 0.0,
+            'page_recycles': 0, 'context_recycles': 0,
+        }
+
+        # 단지별 매물 변동 통계 / 스냅샷
+        self.stats_store = ComplexStatsStore(self.output_dir)
+
+        # 실패 진단 정보 (최근 네트워크 이벤트/DOM 링 버퍼, 실패 시에만 백그라운드 기록)
+        self.diagnostics = FailureDiagnostics(self.output_dir)
+        self.page_trace = None
+
+        # 트래픽 녹화/재생 설정 (프로파일링용, 둘 다 설정되면 재생 우선)
+        self.traffic_recorder: Optional[TrafficRecorder] = None
+        self.traffic_replayer: Optional[TrafficReplayer] = None
+        replay_dir = os.getenv('REPLAY_TRAFFIC_DIR')
+        record_dir = os.getenv('RECORD_TRAFFIC_DIR')
+        if replay_dir:
+            latency_scale = float(os.getenv('REPLAY_LATENCY_SCALE', '1.0'))
+            self.traffic_replayer = TrafficReplayer(Path(replay_dir), latency_scale)
+        elif record_dir:
+            self.traffic_recorder = TrafficRecorder(Path(record_dir))
 
         # DB 연결 설정
         self.crawl_id = crawl_id  # API에서 전달받은 crawl ID
@@ -77,6 +342,10 @@ class NASNaverRealEstateCrawler:
         print(f"- DB 연결: {'✅ 활성화' if self.db_enabled else '❌ 비활성화 (파일 모드)'}")
         if self.crawl_id:
             print(f"- Crawl ID: {self.crawl_id}")
+        if self.traffic_replayer:
+            print(f"- 트래픽 재생: {replay_dir} ({self.traffic_replayer.entry_count}건, 지연 배율 x{self.traffic_replayer.latency_scale})")
+        elif self.traffic_recorder:
+            print(f"- 트래픽 녹화: {record_dir}")
 
     def _init_db_connection(self) -> bool:
         """DB 연결 초기화"""
@@ -86,52 +355,7 @@ class NASNaverRealEstateCrawler:
                 print("[WARNING] DATABASE_URL이 설정되지 않았습니다. 파일 모드로 작동합니다.")
                 return False
 
-            # Docker 내부에서는 'db' 호스트 사용
-            # DATABASE_URL이 localhost로 시작하면 docker 내부이므로 db로 변경
-            if 'localhost' in database_url or '127.0.0.1' in database_url:
-                # Docker 내부 환경 감지
-                if os.path.exists('/.dockerenv'):
-                    database_url = database_url.replace('localhost', 'db').replace('127.0.0.1', 'db')
-                    print(f"[DB] Docker 환경 감지 - 호스트를 'db'로 변경")
-
-            # psycopg2는 Prisma 전용 파라미터를 지원하지 않으므로 제거
-            if '?' in database_url:
-                from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-                parsed = urlparse(database_url)
-                # 쿼리 파라미터 파싱
-                query_params = parse_qs(parsed.query)
-
-                # psycopg2가 인식하지 못하는 Prisma 전용 파라미터 제거
-                prisma_only_params = [
-                    'schema',           # Prisma schema
-                    'connection_limit', # Prisma connection pool
-                    'pool_timeout',     # Prisma pool timeout
-                    'connect_timeout'   # Prisma connect timeout
-                ]
-                removed_params = []
-                for param in prisma_only_params:
-                    if param in query_params:
-                        query_params.pop(param)
-                        removed_params.append(param)
-
-                # 새로운 쿼리 문자열 생성
-                new_query = urlencode(query_params, doseq=True)
-                # URL 재조립
-                database_url = urlunparse((
-                    parsed.scheme,
-                    parsed.netloc,
-                    parsed.path,
-                    parsed.params,
-                    new_query,
-                    parsed.fragment
-                ))
-
-                if removed_params:
-                    print(f"[DB] Prisma 전용 파라미터 제거 (psycopg2 호환): {', '.join(removed_params)}")
-                else:
-                    print(f"[DB] URL 파싱 완료 (제거할 파라미터 없음)")
-
-            self.db_conn = psycopg2.connect(database_url)
+            self.db_conn = connect_db(database_url)
             print(f"[DB] PostgreSQL 연결 성공")
             return True
         except Exception as e:
@@ -162,10 +386,10 @@ class NASNaverRealEstateCrawler:
             if elapsed_seconds > 0 and items_collected > 0:
                 speed = round(items_collected / elapsed_seconds, 2)
 
-            # 예상 총 소요 시간 계산 (단지 기준)
-            if progress > 0 and total > 0:
-                avg_time_per_complex = elapsed_seconds / progress
-                estimated_total_seconds = int(avg_time_per_complex * total)
+            # 예상 총 소요 시간 계산 (단지별 예측 비용 기준, 기록이 없으면 단지 수 기준)
+            estimated_total_seconds = estimate_total_seconds(
+                elapsed_seconds, self.completed_cost, self.planned_cost, progress, total
+            )
 
         status_data = {
             "status": status,  # "running", "completed", "error"
@@ -180,7 +404,13 @@ class NASNaverRealEstateCrawler:
             "estimated_total_seconds": estimated_total_seconds,
             # 속도 정보
             "items_collected": items_collected,
-            "speed": speed  # 매물/초
+            "speed": speed,  # 매물/초
+            # 브라우저 메모리 (MB) / 재활용 횟수
+            "browser": dict(self.browser_stats),
+            # 봇 탐지 서킷 브레이커 상태
+            "breaker": self.breaker.snapshot(),
+            # 시간 예산 초과로 다음 실행으로 연기한 단지
+            "deferred_complexes": list(self.deferred_complexes),
         }
 
         # 1. 파일에 저장 (백업용, 기존 방식 유지)
@@ -233,6 +463,13 @@ class NASNaverRealEstateCrawler:
                 print(f"[WARNING] DB 상태 업데이트 실패: {e}")
                 # DB 업데이트 실패는 크롤링 중단 사유가 아니므로 계속 진행
 
+        # 3. 진행 상황 콜백 (워커 프로세스 → 스케줄러 전달용)
+        if self.progress_callback:
+            try:
+                self.progress_callback(status_data)
+            except Exception as e:
+                print(f"[WARNING] 진행 상황 콜백 실패: {e}")
+
     async def setup_browser(self):
         """브라우저 설정 및 초기화"""
         try:
@@ -240,7 +477,7 @@ class NASNaverRealEstateCrawler:
 
             # 1. Playwright 시작
             start = time.time()
-            playwright = await async_playwright().start()
+            self.playwright = await async_playwright().start()
             print(f"⏱️  Playwright 시작: {time.time() - start:.2f}초")
 
             # 브라우저 옵션 설정 (NAS 환경에 최적화)
@@ -302,97 +539,142 @@ class NASNaverRealEstateCrawler:
 
             # 2. Chrome 브라우저 실행
             start = time.time()
-            self.browser = await playwright.chromium.launch(**browser_options)
+            self.browser = await self.playwright.chromium.launch(**browser_options)
             print(f"⏱️  Chromium 실행: {time.time() - start:.2f}초")
 
             # 3. 컨텍스트 생성 (쿠키, 세션 관리)
             start = time.time()
-            self.context = await self.browser.new_context(
-                viewport={'width': 1280, 'height': 720},  # 해상도 축소 (렌더링 부하 감소)
-                user_agent='Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
-                extra_http_headers={
-                    # 핵심 헤더만 전송 (봇 감지 회피 유지하면서 오버헤드 감소)
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    'Accept-Language': 'ko-KR,ko;q=0.9',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                },
-                # 추가 최적화: 자바스크립트는 활성화, 이미지는 비활성화
-                java_script_enabled=True,
-            )
+            self.context = await self._new_context()
             print(f"⏱️  컨텍스트 생성: {time.time() - start:.2f}초")
 
-            # 4. 페이지 생성
+            # 4. 페이지 생성 (봇 감지 회피 스크립트, 리소스 차단, 타임아웃 적용)
             start = time.time()
-            self.page = await self.context.new_page()
+            self.page = await self._new_page()
             print(f"⏱️  페이지 생성: {time.time() - start:.2f}초")
 
-            # 4-1. WebDriver 흔적 제거 (봇 감지 회피)
-            await self.page.add_init_script("""
-                // navigator.webdriver를 false로 설정 (가장 확실한 봇 감지 신호 제거)
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => false
-                });
-
-                // Chrome 자동화 플래그 제거
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5]
-                });
-
-                // 언어 설정
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['ko-KR', 'ko', 'en-US', 'en']
-                });
-            """)
-            print("✅ 봇 감지 회피 스크립트 적용 완료")
-
-            # 5. 불필요한 리소스 차단 (속도 개선, 봇 탐지 회피 고려)
-            start = time.time()
-
-            async def route_handler(route):
-                request = route.request
-                resource_type = request.resource_type
-                url = request.url
-
-                # 🚫 안전하게 차단 가능한 리소스만 차단 (봇 탐지 영향 최소화)
-                blocked_types = {
-                    'image',  # 이미지 (시각적 요소만, 페이지 동작에 무관)
-                    'media',  # 비디오/오디오 (크롤링에 불필요)
-                }
-
-                # 🚫 명백히 불필요한 써드파티 도메인만 차단 (광고, 분석)
-                blocked_domains = [
-                    'googletagmanager.com',
-                    'google-analytics.com',
-                    'doubleclick.net',
-                    'facebook.com/tr',  # Facebook Pixel
-                    'connect.facebook.net/signals',  # Facebook 분석
-                ]
-
-                # 타입 기반 차단
-                if resource_type in blocked_types:
-                    await route.abort()
-                    return
-
-                # 도메인 기반 차단 (정확한 매칭만)
-                if any(blocked in url for blocked in blocked_domains):
-                    await route.abort()
-                    return
-
-                # 나머지는 모두 허용 (CSS, Font, Script 등 보존)
-                await route.continue_()
-
-            await self.page.route("**/*", route_handler)
-            print(f"⏱️  리소스 차단 설정: {time.time() - start:.2f}초")
-
-            # 6. 타임아웃 설정
-            self.page.set_default_timeout(self.timeout)
-
             print("✅ 브라우저 설정 완료")
 
         except Exception as e:
             print(f"❌ 브라우저 설정 실패: {e}")
             raise
 
+    async def _new_context(self, storage_state: Optional[Dict] = None) -> BrowserContext:
+        """브라우저 컨텍스트 생성 (storage_state: 재활용 전 쿠키/로컬스토리지)"""
+        self.complexes_since_context = 0
+        identity = BROWSER_IDENTITIES[self.identity_index]
+        return await self.browser.new_context(
+            viewport=identity['viewport'],  # 해상도 축소 (렌더링 부하 감소)
+            user_agent=identity['user_agent'],
+            extra_http_headers={
+                # 핵심 헤더만 전송 (봇 감지 회피 유지하면서 오버헤드 감소)
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                'Accept-Language': 'ko-KR,ko;q=0.9',
+                'Accept-Encoding': 'gzip, deflate, br',
+            },
+            # 추가 최적화: 자바스크립트는 활성화, 이미지는 비활성화
+            java_script_enabled=True,
+            storage_state=storage_state,
+        )
+
+    async def _new_page(self, main: bool = True) -> Page:
+        """페이지 생성 및 설정 (봇 감지 회피 스크립트, 리소스 차단, 타임아웃)
+        main=False: 구간 크롤링용 보조 페이지 (재활용 카운터/진단 버퍼 미사용)"""
+        page = await self.context.new_page()
+        if main:
+            self.complexes_since_page = 0
+            self.page_trace = self.diagnostics.attach(page)
+
+        # WebDriver 흔적 제거 (봇 감지 회피)
+        await page.add_init_script("""
+            // navigator.webdriver를 false로 설정 (가장 확실한 봇 감지 신호 제거)
+            Object.defineProperty(navigator, 'webdriver', {
+                get: () => false
+            });
+
+            // Chrome 자동화 플래그 제거
+            Object.defineProperty(navigator, 'plugins', {
+                get: () => [1, 2, 3, 4, 5]
+            });
+
+            // 언어 설정
+            Object.defineProperty(navigator, 'languages', {
+                get: () => ['ko-KR', 'ko', 'en-US', 'en']
+            });
+        """)
+
+        # 스크롤 에이전트 설치 (페이지 이동 후에도 자동 재설치)
+        if self.scroll_agent_enabled:
+            await page.expose_binding('__scrollAgentReport', self._on_scroll_agent_report)
+            await page.add_init_script(SCROLL_AGENT_SCRIPT)
+
+        # 불필요한 리소스 차단 (속도 개선, 봇 탐지 회피 고려)
+        await page.route("**/*", self._route_handler)
+        page.set_default_timeout(self.timeout)
+        return page
+
+    def article_query_params(self, overrides: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """매물 목록 API에 덮어쓸 파라미터 (필터 + 증분 크롤링 정렬 + 구간)"""
+        params = self.filters.api_params()
+        if self.article_order:
+            params['order'] = self.article_order
+        params.update(overrides or {})
+        return params
+
+    async def _route_handler(self, route):
+        """리소스 차단 / 트래픽 녹화·재생 라우트 핸들러"""
+        request = route.request
+        resource_type = request.resource_type
+        url = request.url
+
+        # 🚫 안전하게 차단 가능한 리소스만 차단 (봇 탐지 영향 최소화)
+        blocked_types = {
+            'image',  # 이미지 (시각적 요소만, 페이지 동작에 무관)
+            'media',  # 비디오/오디오 (크롤링에 불필요)
+        }
+
+        # 🚫 명백히 불필요한 써드파티 도메인만 차단 (광고, 분석)
+        blocked_domains = [
+            'googletagmanager.com',
+            'google-analytics.com',
+            'doubleclick.net',
+            'facebook.com/tr',  # Facebook Pixel
+            'connect.facebook.net/signals',  # Facebook 분석
+        ]
+
+        # 타입 기반 차단
+        if resource_type in blocked_types:
+            await route.abort()
+            return
+
+        # 도메인 기반 차단 (정확한 매칭만)
+        if any(blocked in url for blocked in blocked_domains):
+            await route.abort()
+            return
+
+        # 크롤링 필터 / 증분 크롤링 정렬을 매물 목록 API 파라미터로 적용 (녹화·재생도 바뀐 URL 기준)
+        rewritten = None
+        if '/api/articles/complex/' in url:
+            params = self.article_query_params()
+            if params:
+                rewritten = with_article_params(url, params)
+
+        # 재생 모드: 녹화된 응답으로 오프라인 fulfill
+        if self.traffic_replayer:
+            await self.traffic_replayer.handle(route, url=rewritten)
+            return
+
+        # 녹화 모드: 실제 응답을 기록하며 전달
+        if self.traffic_recorder:
+            await self.traffic_recorder.handle(route, url=rewritten)
+            return
+
+        if rewritten:
+            await route.continue_(url=rewritten)
+            return
+
+        # 나머지는 모두 허용 (CSS, Font, Script 등 보존)
+        await route.continue_()
+
     async def close_browser(self):
         """브라우저 및 DB 연결 종료"""
         try:
@@ -400,13 +682,46 @@ class NASNaverRealEstateCrawler:
                 await self.context.close()
             if self.browser:
                 await self.browser.close()
+            if self.playwright:
+                await self.playwright.stop()
             print("브라우저 종료 완료")
         except Exception as e:
             print(f"브라우저 종료 중 오류: {e}")
+        finally:
+            self.page = None
+            self.context = None
+            self.browser = None
+            self.playwright = None
+            self.first_request = True
+
+        if self.traffic_replayer:
+            print(f"[REPLAY] 재생 {self.traffic_replayer.hit_count}건, 녹화 없음(차단) {self.traffic_replayer.miss_count}건")
+        elif self.traffic_recorder:
+            print(f"[RECORD] {self.traffic_recorder.recorded_count}건 녹화 완료: {self.traffic_recorder.record_dir}")
 
         # DB 연결 종료
         self._close_db_connection()
 
+    async def is_browser_healthy(self) -> bool:
+        """재사용 전 브라우저/페이지 상태 확인 (연결 끊김, 페이지 닫힘, 응답 없음)"""
+        if not self.browser or not self.page:
+            return False
+        try:
+            if not self.browser.is_connected() or self.page.is_closed():
+                return False
+            await asyncio.wait_for(self.page.evaluate('1'), timeout=5)
+            return True
+        except Exception as e:
+            print(f"[WARNING] 브라우저 상태 확인 실패: {e}")
+            return False
+
+    def _ensure_db_connection(self):
+        """재사용 중인 인스턴스의 DB 연결이 끊어졌으면 재연결"""
+        if self.db_conn is not None and self.db_conn.closed:
+            print("[DB] 연결이 끊어져 재연결합니다.")
+            self.db_conn = None
+            self.db_enabled = self._init_db_connection()
+
     async def fetch_complex_info_only(self, complex_no: str) -> Optional[Dict]:
         """단지 기본 정보만 가져오기 (매물 크롤링 없이)"""
         try:
@@ -471,10 +786,110 @@ class NASNaverRealEstateCrawler:
         except:
             pass
 
-        # 새 페이지 생성
-        self.page = await self.context.new_page()
+        # 새 페이지 생성 (봇 감지 회피 스크립트/리소스 차단 다시 적용)
+        self.page = await self._new_page()
         print("🔄 페이지 컨텍스트 재생성 완료")
 
+    async def recycle_context(self, reason: str):
+        """브라우저 컨텍스트 재생성 (쿠키/로컬스토리지는 유지해 워밍업 생략)"""
+        print(f"♻️  브라우저 컨텍스트 재활용: {reason}")
+        storage_state = None
+        try:
+            storage_state = await self.context.storage_state()
+        except Exception as e:
+            print(f"[WARNING] 세션 상태 저장 실패, 워밍업부터 다시 진행: {e}")
+        try:
+            await self.context.close()
+        except Exception:
+            pass
+
+        self.context = await self._new_context(storage_state)
+        self.page = await self._new_page()
+        if storage_state is None:
+            self.first_request = True
+
+    async def rotate_identity(self):
+        """봇 탐지 차단 후 새 신원(뷰포트/UA/빈 쿠키·스토리지)으로 컨텍스트 교체"""
+        if not self.browser:
+            return
+        self.identity_index = (self.identity_index + 1) % len(BROWSER_IDENTITIES)
+        identity = BROWSER_IDENTITIES[self.identity_index]
+        print(f"🎭 브라우저 신원 교체: {identity['viewport']['width']}x{identity['viewport']['height']}, {identity['user_agent'][13:45]}...")
+        try:
+            await self.context.close()
+        except Exception:
+            pass
+        self.context = await self._new_context()
+        self.page = await self._new_page()
+        self.first_request = True  # 새 세션이므로 워밍업부터
+
+    async def wait_for_breaker(self, progress: int, total: int) -> bool:
+        """차단(open) 중이면 대기 후 신원 교체, 이번 단지가 차단 해제 시험 요청이면 True"""
+        announced = False
+        while True:
+            wait_time = self.breaker.wait_time()
+            if wait_time <= 0:
+                break
+            if not announced:
+                announced = True
+                print(f"🛑 봇 탐지 차단 중: {wait_time:.0f}초 대기 ({self.breaker.last_reason})")
+                self.update_status(
+                    status="running",
+                    progress=progress,
+                    total=total,
+                    message=f"🛑 봇 탐지 차단: {wait_time:.0f}초 대기 후 새 신원으로 재개 (누적 {self.breaker.trips}회)"
+                )
+            await asyncio.sleep(min(wait_time, 30))
+
+        probing = self.breaker.state == HALF_OPEN
+        if self.breaker.trips > self.breaker_trips_seen:
+            self.breaker_trips_seen = self.breaker.trips
+            try:
+                await self.rotate_identity()
+            except Exception as e:
+                print(f"[WARNING] 브라우저 신원 교체 실패: {e}")
+        if probing:
+            print("🔎 차단 해제 확인 (시험 요청)")
+            self.update_status(
+                status="running",
+                progress=progress,
+                total=total,
+                message="🔎 봇 탐지 차단 해제 확인 중..."
+            )
+        return probing
+
+    def sample_browser_memory(self) -> Dict[str, float]:
+        """브라우저(Chromium 전체/렌더러) RSS 측정, browser_stats 갱신"""
+        memory = browser_rss_mb()
+        self.browser_stats['rss_mb'] = round(memory['total'], 1)
+        self.browser_stats['renderer_rss_mb'] = round(memory['renderer'], 1)
+        self.browser_stats['peak_rss_mb'] = max(self.browser_stats['peak_rss_mb'], self.browser_stats['rss_mb'])
+        return memory
+
+    async def browser_watchdog(self):
+        """단지 1개 크롤링 후 호출: 메모리 상한 초과 또는 N개 단지마다 컨텍스트/페이지 재활용"""
+        if not self.browser or not self.context:
+            return
+        self.complexes_since_page += 1
+        self.complexes_since_context += 1
+
+        try:
+            memory = self.sample_browser_memory()
+            if self.browser_max_rss_mb > 0 and memory['total'] > self.browser_max_rss_mb:
+                await self.recycle_context(f"메모리 {memory['total']:.0f}MB > {self.browser_max_rss_mb:.0f}MB")
+                self.browser_stats['context_recycles'] += 1
+                after = self.sample_browser_memory()
+                print(f"   메모리 {memory['total']:.0f}MB → {after['total']:.0f}MB")
+            elif self.context_recycle_every > 0 and self.complexes_since_context >= self.context_recycle_every:
+                await self.recycle_context(f"{self.context_recycle_every}개 단지 처리")
+                self.browser_stats['context_recycles'] += 1
+            elif self.page_recycle_every > 0 and self.complexes_since_page >= self.page_recycle_every:
+                await self.recreate_page()
+                self.browser_stats['page_recycles'] += 1
+        except Exception as e:
+            # 재활용 실패 시 다음 단지의 컨텍스트 에러 복구 로직에 맡김
+            print(f"[WARNING] 브라우저 재활용 실패: {e}")
+
     async def validate_complex_exists(self, complex_no: str) -> bool:
         """단지 번호가 유효한지 간단히 확인 (컨텍스트 에러 복구 포함)"""
         max_attempts = 2
@@ -520,12 +935,13 @@ class NASNaverRealEstateCrawler:
 
         return False
 
-    async def crawl_complex_overview_with_retry(self, complex_no: str) -> Optional[Dict]:
+    async def crawl_complex_overview_with_retry(self, complex_no: str, max_retries: Optional[int] = None) -> Optional[Dict]:
         """재시도 로직이 포함된 단지 개요 크롤링"""
-        for attempt in range(1, self.max_retries + 1):
+        max_retries = max_retries or self.max_retries
+        for attempt in range(1, max_retries + 1):
             try:
                 if attempt > 1:
-                    print(f"[재시도 {attempt}/{self.max_retries}] 단지 개요 크롤링 시작: {complex_no}")
+                    print(f"[재시도 {attempt}/{max_retries}] 단지 개요 크롤링 시작: {complex_no}")
 
                 overview_data = await self.crawl_complex_overview(complex_no)
 
@@ -533,20 +949,21 @@ class NASNaverRealEstateCrawler:
                     return overview_data
 
                 # 데이터가 없으면 재시도
-                if attempt < self.max_retries:
+                if attempt < max_retries:
                     wait_time = self.retry_delay * (2 ** (attempt - 1))  # 지수 백오프: 5s, 10s, 20s
                     print(f"⏳ Overview 데이터 없음. {wait_time}초 후 재시도...")
                     await asyncio.sleep(wait_time)
 
             except Exception as e:
-                print(f"❌ 시도 {attempt}/{self.max_retries} 실패: {e}")
+                print(f"❌ 시도 {attempt}/{max_retries} 실패: {e}")
+                self.last_overview_error = str(e)
 
-                if attempt < self.max_retries:
+                if attempt < max_retries:
                     wait_time = self.retry_delay * (2 ** (attempt - 1))
                     print(f"⏳ {wait_time}초 후 재시도...")
                     await asyncio.sleep(wait_time)
                 else:
-                    print(f"🚫 최대 재시도 횟수 {self.max_retries}회 도달, 포기")
+                    print(f"🚫 최대 재시도 횟수 {max_retries}회 도달, 포기")
                     import traceback
                     traceback.print_exc()
 
@@ -554,6 +971,7 @@ class NASNaverRealEstateCrawler:
 
     async def crawl_complex_overview(self, complex_no: str) -> Optional[Dict]:
         """단지 개요 정보 크롤링 (명시적 API 대기 방식)"""
+        self.last_overview_error = None
         try:
             print(f"단지 개요 정보 크롤링 시작: {complex_no}")
 
@@ -606,14 +1024,10 @@ class NASNaverRealEstateCrawler:
                 except Exception as api_wait_error:
                     # API 응답 대기 실패 (타임아웃 등)
                     print(f"⚠️ Overview API 응답 대기 실패: {api_wait_error}")
+                    self.last_overview_error = f"Overview API 응답 대기 실패: {api_wait_error}"
 
-                    # 스크린샷 저장 시도
-                    screenshot_path = self.output_dir / f"api_timeout_{complex_no}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-                    try:
-                        await self.page.screenshot(path=str(screenshot_path), full_page=True, timeout=5000)
-                        print(f"📸 타임아웃 스크린샷 저장: {screenshot_path}")
-                    except Exception as ss_error:
-                        print(f"[WARNING] 스크린샷 저장 실패: {ss_error}")
+                    # 진단 정보 기록 (백그라운드)
+                    self.diagnostics.capture(self.page_trace, self.page, complex_no, 'api_timeout', str(api_wait_error))
 
                     # URL 확인
                     current_url = self.page.url
@@ -622,9 +1036,15 @@ class NASNaverRealEstateCrawler:
                     # 봇 탐지 패턴 분석
                     if '/404' in current_url:
                         print(f"⚠️ 404 페이지로 리다이렉트 감지! {url} → {current_url}")
+                        self.last_overview_error = f"404 리다이렉트: {current_url}"
+                        if self.breaker.record_signal(f"단지 {complex_no} 404 리다이렉트"):
+                            print(f"🛑 봇 탐지 서킷 브레이커 작동: {self.breaker.cooldown:.0f}초 동안 크롤링 중단")
                     elif f'/complexes/{complex_no}' not in current_url:
                         print(f"⚠️ 봇 탐지로 인한 리다이렉트 감지! {url} → {current_url}")
                         print(f"   단지 ID가 URL에서 제거되었습니다.")
+                        self.last_overview_error = f"봇 탐지 리다이렉트: {current_url}"
+                        if self.breaker.record_signal(f"단지 {complex_no} 리다이렉트"):
+                            print(f"🛑 봇 탐지 서킷 브레이커 작동: {self.breaker.cooldown:.0f}초 동안 크롤링 중단")
                     elif current_url.startswith(f'https://new.land.naver.com/complexes/{complex_no}'):
                         if '?' in current_url:
                             print(f"✅ URL은 정상이나 API 응답 없음: {current_url}")
@@ -637,44 +1057,9 @@ class NASNaverRealEstateCrawler:
 
             if overview_data:
                 print(f"✅ Overview 수집 성공: {overview_data.get('complexName', 'Unknown')}")
-                # 상세 정보 추출
-                result = {
-                    # 기본 정보
-                    'complexName': overview_data.get('complexName', ''),
-                    'complexType': overview_data.get('complexTypeName', ''),
-                    'complexNo': overview_data.get('complexNo', ''),
-                    'totalHousehold': overview_data.get('totalHouseHoldCount'),
-                    'totalDong': overview_data.get('totalDongCount'),
-                    'useApproveYmd': overview_data.get('useApproveYmd', ''),
-
-                    # 좌표 정보
-                    'latitude': overview_data.get('latitude'),
-                    'longitude': overview_data.get('longitude'),
-
-                    # 면적 정보
-                    'minArea': overview_data.get('minArea'),
-                    'maxArea': overview_data.get('maxArea'),
-
-                    # 가격 정보
-                    'minPrice': overview_data.get('minPrice'),
-                    'maxPrice': overview_data.get('maxPrice'),
-                    'minPriceByLetter': overview_data.get('minPriceByLetter', ''),
-                    'maxPriceByLetter': overview_data.get('maxPriceByLetter', ''),
-                    'minLeasePrice': overview_data.get('minLeasePrice'),
-                    'maxLeasePrice': overview_data.get('maxLeasePrice'),
-                    'minLeasePriceByLetter': overview_data.get('minLeasePriceByLetter', ''),
-                    'maxLeasePriceByLetter': overview_data.get('maxLeasePriceByLetter', ''),
-
-                    # 최근 실거래가
-                    'realPrice': overview_data.get('realPrice'),
-
-                    # 평형 정보
-                    'pyeongs': overview_data.get('pyeongs', []),
-
-                    # 동 정보
-                    'dongs': overview_data.get('dongs', []),
-                }
-                return result
+                if self.breaker.record_success():
+                    print("✅ 봇 탐지 차단 해제 (시험 요청 성공)")
+                return self.summarize_overview(overview_data)
             else:
                 print(f"⚠️ Overview 수집 실패")
                 return None
@@ -685,15 +1070,89 @@ class NASNaverRealEstateCrawler:
             traceback.print_exc()
             return None
 
-    async def crawl_complex_articles_with_scroll(self, complex_no: str) -> Optional[Dict]:
-        """무한 스크롤 방식으로 모든 매물 목록 크롤링"""
+    def summarize_overview(self, overview_data: Dict) -> Dict:
+        """단지 개요 API 응답에서 저장할 필드만 추출"""
+        return {
+            # 기본 정보
+            'complexName': overview_data.get('complexName', ''),
+            'complexType': overview_data.get('complexTypeName', ''),
+            'complexNo': overview_data.get('complexNo', ''),
+            'totalHousehold': overview_data.get('totalHouseHoldCount'),
+            'totalDong': overview_data.get('totalDongCount'),
+            'useApproveYmd': overview_data.get('useApproveYmd', ''),
+
+            # 좌표 정보
+            'latitude': overview_data.get('latitude'),
+            'longitude': overview_data.get('longitude'),
+
+            # 주소 및 법정동코드 (5자리, 공공데이터 API용)
+            'address': overview_data.get('address', ''),
+            'lawdCd': self.resolve_lawd_cd(overview_data.get('address')),
+
+            # 면적 정보
+            'minArea': overview_data.get('minArea'),
+            'maxArea': overview_data.get('maxArea'),
+
+            # 가격 정보
+            'minPrice': overview_data.get('minPrice'),
+            'maxPrice': overview_data.get('maxPrice'),
+            'minPriceByLetter': overview_data.get('minPriceByLetter', ''),
+            'maxPriceByLetter': overview_data.get('maxPriceByLetter', ''),
+            'minLeasePrice': overview_data.get('minLeasePrice'),
+            'maxLeasePrice': overview_data.get('maxLeasePrice'),
+            'minLeasePriceByLetter': overview_data.get('minLeasePriceByLetter', ''),
+            'maxLeasePriceByLetter': overview_data.get('maxLeasePriceByLetter', ''),
+
+            # 최근 실거래가
+            'realPrice': overview_data.get('realPrice'),
+
+            # 평형 정보
+            'pyeongs': overview_data.get('pyeongs', []),
+
+            # 동 정보
+            'dongs': overview_data.get('dongs', []),
+        }
+
+    def resolve_lawd_cd(self, address: Optional[str]) -> Optional[str]:
+        """주소에서 법정동코드 5자리 추출 (법정동코드 인덱스 사용)"""
+        if not address:
+            return None
         try:
-            print(f"매물 목록 크롤링 시작 (무한 스크롤): {complex_no}")
+            index = get_dong_code_index()
+            entry = index.resolve_address(address) if index else None
+            return entry['lawdCd'] if entry else None
+        except Exception as e:
+            print(f"[WARNING] 법정동코드 조회 실패: {e}")
+            return None
+
+    async def crawl_complex_articles_with_scroll(self, complex_no: str, page: Optional[Page] = None,
+                                                 slice_name: Optional[str] = None) -> Optional[Dict]:
+        """무한 스크롤 방식으로 모든 매물 목록 크롤링 (page 지정 시 해당 페이지에서 구간 크롤링)"""
+        main_page = page is None
+        page = page or self.page
+        try:
+            print(f"매물 목록 크롤링 시작 (무한 스크롤): {complex_no}" + (f" [{slice_name}]" if slice_name else ""))
             
             # 모든 매물을 저장할 리스트
             all_articles = []
             collected_article_ids = set()  # 중복 제거용
+            grouped_articles: Dict[str, Dict] = {}  # 동일매물 묶기 응답의 대표 매물 (완료 판정용)
             last_api_time = [0]  # API 마지막 감지 시간 (리스트로 클로저 회피)
+            first_response = asyncio.Event()  # 첫 매물 API 응답 수신
+            grouped_response = asyncio.Event()  # 동일매물 묶기 적용된 응답 수신
+            list_complete = asyncio.Event()  # 전체 매물 수집 완료 (totalCount 도달 / 마지막 페이지 / 기존 매물 연속)
+
+            # 증분 크롤링 기준 (직전 스냅샷 매물번호, None이면 전체 크롤링)
+            baseline = None
+            if self.incremental_enabled and main_page and not self.filters.active:
+                baseline = self.stats_store.incremental_baseline(complex_no)
+            known_ids = {str(a.get('articleNo')) for a in baseline} if baseline is not None else None
+            incremental = {'known_run': 0, 'stopped': False}
+            navigation_seconds = 0.0  # 페이지 이동/새로고침 소요 시간 (비용 기록용)
+            scroll_attempts = 0
+            if known_ids is not None:
+                print(f"증분 크롤링: 최신순 조회, 기존 매물 {self.incremental_known_run}건 연속 시 중단 (스냅샷 {len(known_ids)}건)")
+                self.article_order = 'dateDesc'
 
             # API 응답 수집
             async def handle_articles_response(response):
@@ -719,17 +1178,32 @@ class NASNaverRealEstateCrawler:
                             total_count = data.get('totalCount', 0)
 
                             # 중복 제거하며 추가
-                            new_count = 0
-                            for article in article_list:
-                                article_id = article.get('articleNo') or article.get('id')
-                                if article_id and article_id not in collected_article_ids:
-                                    collected_article_ids.add(article_id)
-                                    all_articles.append(article)
-                                    new_count += 1
+                            new_count = merge_articles(article_list, collected_article_ids, all_articles)
 
                             if new_count > 0:
                                 total_info = f", 전체: {total_count}건" if total_count > 0 else ""
                                 print(f"  → {new_count}개 새 매물 추가 (총 {len(all_articles)}개{total_info})")
+
+                            first_response.set()
+                            if same_group:
+                                for article in article_list:
+                                    article_id = article.get('articleNo') or article.get('id')
+                                    if article_id:
+                                        grouped_articles[article_id] = article
+                                grouped_response.set()
+                            if not list_complete.is_set() and article_list_complete(
+                                    all_articles, total_count, data.get('isMoreData', True),
+                                    list(grouped_articles.values()) if same_group else None):
+                                print(f"  → 전체 매물 수집 완료 ({len(all_articles)}개, 서버 기준 {total_count}건)")
+                                list_complete.set()
+                            if known_ids is not None and not list_complete.is_set():
+                                for article in article_list:
+                                    known = str(article.get('articleNo')) in known_ids
+                                    incremental['known_run'] = incremental['known_run'] + 1 if known else 0
+                                if incremental['known_run'] >= self.incremental_known_run:
+                                    print(f"  → 기존 매물 {incremental['known_run']}건 연속 - 증분 수집 완료")
+                                    incremental['stopped'] = True
+                                    list_complete.set()
                             break  # 성공하면 루프 종료
                         except Exception as e:
                             if attempt < max_retries - 1:
@@ -739,14 +1213,16 @@ class NASNaverRealEstateCrawler:
                                 print(f"매물 API 응답 파싱 최종 실패: {e}")
             
             # 응답 핸들러 등록
-            self.page.on('response', handle_articles_response)
+            page.on('response', handle_articles_response)
 
             try:
                 # 1. 메인 페이지에서 localStorage 설정 (중요!)
                 print("🔧 동일매물 묶기 설정 준비 중...")
-                await self.page.goto("https://new.land.naver.com", wait_until='domcontentloaded')
+                nav_started = time.time()
+                await page.goto("https://new.land.naver.com", wait_until='domcontentloaded')
+                navigation_seconds += time.time() - nav_started
                 
-                await self.page.evaluate('''
+                await page.evaluate('''
                     () => {
                         localStorage.setItem('sameAddrYn', 'true');
                         localStorage.setItem('sameAddressGroup', 'true');
@@ -759,7 +1235,9 @@ class NASNaverRealEstateCrawler:
                 # 2. 단지 페이지로 이동 (localStorage 값이 자동 적용됨)
                 url = f"https://new.land.naver.com/complexes/{complex_no}"
                 print(f"URL 접속: {url}")
-                await self.page.goto(url, wait_until='domcontentloaded', timeout=60000)  # 60초로 증가
+                nav_started = time.time()
+                await page.goto(url, wait_until='domcontentloaded', timeout=60000)  # 60초로 증가
+                navigation_seconds += time.time() - nav_started
                 print("✅ 단지 페이지 로딩 완료")
                 await asyncio.sleep(2)
                 
@@ -774,7 +1252,7 @@ class NASNaverRealEstateCrawler:
                     
                     for selector in selectors:
                         try:
-                            element = await self.page.wait_for_selector(selector, timeout=5000)
+                            element = await page.wait_for_selector(selector, timeout=5000)
                             if element:
                                 await element.click()
                                 print(f"매물 탭 클릭 성공")
@@ -787,7 +1265,7 @@ class NASNaverRealEstateCrawler:
                 
                 # 3. localStorage 및 체크박스 상태 검증
                 print("동일매물 묶기 상태 검증 중...")
-                storage_check = await self.page.evaluate('''
+                storage_check = await page.evaluate('''
                     () => {
                         const sameAddrYn = localStorage.getItem('sameAddrYn');
                         const sameAddressGroup = localStorage.getItem('sameAddressGroup');
@@ -822,7 +1300,7 @@ class NASNaverRealEstateCrawler:
                 # 4. 체크박스가 체크되지 않았으면 클릭
                 if storage_check.get('checkboxState') and not storage_check['checkboxState'].get('checked'):
                     print("🔘 체크박스 클릭 중...")
-                    clicked = await self.page.evaluate('''
+                    clicked = await page.evaluate('''
                         () => {
                             const checkboxes = document.querySelectorAll('input[type="checkbox"]');
                             for (const checkbox of checkboxes) {
@@ -840,7 +1318,14 @@ class NASNaverRealEstateCrawler:
                     
                     if clicked:
                         print("[DEBUG] 체크박스 클릭 완료, 데이터 재로딩 대기...")
-                        await asyncio.sleep(7)  # 네이버 부동산 재로딩 시간 고려하여 증가
+                        # 묶기 적용된 응답이 오면 바로 진행 (최대 7초, 네이버 부동산 재로딩 시간 고려)
+                        grouped_response.clear()
+                        list_complete.clear()
+                        incremental.update(known_run=0, stopped=False)
+                        try:
+                            await asyncio.wait_for(grouped_response.wait(), timeout=7)
+                        except asyncio.TimeoutError:
+                            pass
                         print("✅ 동일매물 묶기 활성화 완료")
                     else:
                         print("[DEBUG] 체크박스를 찾지 못함")
@@ -865,7 +1350,9 @@ class NASNaverRealEstateCrawler:
                 while not list_container and container_retry_count < max_container_retries:
                     if container_retry_count > 0:
                         print(f"⚠️  컨테이너를 찾지 못했습니다. 페이지 새로고침 후 재시도 ({container_retry_count}/{max_container_retries})...")
-                        await self.page.reload(wait_until='domcontentloaded', timeout=60000)
+                        nav_started = time.time()
+                        await page.reload(wait_until='domcontentloaded', timeout=60000)
+                        navigation_seconds += time.time() - nav_started
                         await asyncio.sleep(5)  # 로드 후 충분한 대기 시간
 
                         # 매물 탭 다시 클릭
@@ -878,7 +1365,7 @@ class NASNaverRealEstateCrawler:
 
                             for tab_selector in tab_selectors:
                                 try:
-                                    element = await self.page.wait_for_selector(tab_selector, timeout=5000)
+                                    element = await page.wait_for_selector(tab_selector, timeout=5000)
                                     if element:
                                         await element.click()
                                         print(f"매물 탭 다시 클릭 성공")
@@ -891,7 +1378,7 @@ class NASNaverRealEstateCrawler:
 
                     for selector in container_selectors:
                         try:
-                            list_container = await self.page.wait_for_selector(selector, timeout=5000)
+                            list_container = await page.wait_for_selector(selector, timeout=5000)
                             if list_container:
                                 print(f"✅ 매물 목록 컨테이너 발견: {selector}")
                                 break
@@ -906,8 +1393,11 @@ class NASNaverRealEstateCrawler:
                     print(f"   → 이 단지는 매물이 없거나, 네이버 페이지 구조가 변경되었을 수 있습니다.")
                     return None
                 
-                # 4. 초기 데이터 수집 대기
-                await asyncio.sleep(3)
+                # 4. 초기 데이터 수집 대기 (첫 API 응답이 오면 바로 진행, 최대 3초)
+                try:
+                    await asyncio.wait_for(first_response.wait(), timeout=3)
+                except asyncio.TimeoutError:
+                    pass
                 initial_count = len(all_articles)
                 print(f"초기 매물 수: {initial_count}개")
 
@@ -922,123 +1412,18 @@ class NASNaverRealEstateCrawler:
                         print("❌ 여전히 매물이 없습니다. 이 단지는 매물이 없거나 페이지 로딩에 실패했습니다.")
                         return None
                 
-                # 5. 점진적 스크롤로 데이터 수집 (crawler_service.py 방식)
-                print("추가 매물 수집 시작 (점진적 스크롤)...")
-                print(f"[설정] 최대 시도: 100회, 스크롤: 800px, 동적 대기(API감지:0.3초/미감지:1.0초), 종료: 3회 연속 변화 없음")
+                # 5. 점진적 스크롤로 데이터 수집 (페이지 내 스크롤 에이전트, 사용 불가 시 evaluate 반복 방식)
+                #    첫 응답에서 이미 전체를 받았으면 (소규모 단지) 스크롤 생략
                 scroll_attempts = 0
-                max_scroll_attempts = 100  # 최대 100회
-                scroll_end_count = 0  # 스크롤이 안 움직이는 횟수
-                max_scroll_end = 3  # 3회 연속 스크롤 안 되면 종료 (속도 개선)
-                
-                while scroll_attempts < max_scroll_attempts:
-                    prev_count = len(all_articles)
-                    
-                    # 매물 스크롤 진행 상태 업데이트
-                    if scroll_attempts % 3 == 0:  # 3회마다 업데이트 (너무 자주 업데이트하면 부하)
-                        self.update_status(
-                            status="running",
-                            progress=len(all_articles),
-                            total=100,  # 예상 총 매물 수 (실제는 알 수 없음)
-                            current_complex=complex_no,
-                            message=f"🔄 매물 스크롤 중... (시도 {scroll_attempts}회, 수집 {len(all_articles)}개)",
-                            items_collected=len(all_articles)
-                        )
-                    
-                    # 네이버 실제 컨테이너로 스크롤 (800px 고정)
-                    scroll_result = await self.page.evaluate('''
-                        () => {
-                            // 네이버가 실제로 사용하는 셀렉터들
-                            const selectors = [
-                                '.item_list',  // ✅ crawler_service.py에서 사용
-                                'div[class*="list_contents"]',
-                                'div[class*="item_list"]',
-                                'div[class*="article_list"]'
-                            ];
-
-                            let container = null;
-                            for (const selector of selectors) {
-                                container = document.querySelector(selector);
-                                if (container && container.scrollHeight > container.clientHeight) {
-                                    break;
-                                }
-                            }
-
-                            if (!container) {
-                                return { found: false, reason: 'container not found' };
-                            }
-
-                            // 점진적 스크롤 (800px씩 - 이전 500px에서 증가)
-                            const before = container.scrollTop;
-                            container.scrollTop += 800;  // ✅ 한 번에 끝까지 가지 않음
-                            const after = container.scrollTop;
-
-                            const items = container.querySelectorAll('.item_link, .item_inner, [class*="item"]');
-
-                            return {
-                                found: true,
-                                moved: after > before,  // ✅ 실제로 스크롤되었는지
-                                scrollBefore: before,
-                                scrollAfter: after,
-                                scrollDelta: after - before,
-                                scrollHeight: container.scrollHeight,
-                                clientHeight: container.clientHeight,
-                                itemCount: items.length,
-                                containerClass: container.className
-                            };
-                        }
-                    ''')
-                        
-                    if scroll_attempts == 0:
-                        if scroll_result.get('found'):
-                            print(f"[DEBUG] 컨테이너 발견: .{scroll_result.get('containerClass', 'unknown')}")
-                            print(f"  DOM 아이템: {scroll_result.get('itemCount', 0)}개 (동일매물묶기 이전, 참고용)")
-                            print(f"  스크롤 높이: {scroll_result.get('scrollHeight')} / {scroll_result.get('clientHeight')}")
-                            print(f"  💡 실제 수집 개수는 API 응답 기준 (동일매물묶기 이후)")
-                        else:
-                            print(f"[DEBUG] 컨테이너를 찾지 못함: {scroll_result.get('reason', 'unknown')}")
-
-                    # 동적 대기 시간 (API 감지 여부에 따라)
-                    time_since_last_api = time.time() - last_api_time[0]
-
-                    if time_since_last_api < 0.5:  # 최근 0.5초 이내에 API 감지됨
-                        wait_time = 0.3
-                        # print(f"  [대기] API 최근 감지 → {wait_time}초 대기")
-                    else:  # API 감지 안됨
-                        wait_time = 1.0
-                        # print(f"  [대기] API 미감지 → {wait_time}초 대기")
+                if list_complete.is_set():
+                    print(f"✅ 첫 응답으로 전체 매물 수집 완료 - 스크롤 생략")
+                else:
+                    scroll_attempts = None
+                    if self.scroll_agent_enabled:
+                        scroll_attempts = await self._scroll_with_agent(page, complex_no, all_articles, list_complete)
+                    if scroll_attempts is None:
+                        scroll_attempts = await self._scroll_with_evaluate(page, complex_no, all_articles, last_api_time, list_complete)
 
-                    await asyncio.sleep(wait_time)
-                    
-                    current_count = len(all_articles)
-                    new_items = current_count - prev_count
-                    
-                    scroll_attempts += 1
-                    
-                    # 종료 조건: 스크롤 끝 + 데이터 증가 없음 (둘 다 충족해야 함)
-                    scroll_ended = scroll_result.get('found') and not scroll_result.get('moved')
-                    no_new_data = new_items == 0
-                    
-                    if scroll_ended and no_new_data:
-                        scroll_end_count += 1
-                        print(f"시도 {scroll_attempts}회: 스크롤 끝 & 데이터 없음 ({scroll_end_count}/{max_scroll_end}) - 총 {current_count}개")
-                        print(f"  → 스크롤: {scroll_result.get('scrollAfter')} / {scroll_result.get('scrollHeight')}")
-                        
-                        if scroll_end_count >= max_scroll_end:
-                            print(f"⏹️  수집 종료 ({max_scroll_end}회 연속 변화 없음)")
-                            print(f"📊 최종: {current_count}개 수집 (DOM: {scroll_result.get('itemCount', 0)}개는 동일매물묶기 이전)")
-                            break
-                    else:
-                        # 스크롤이 끝이어도 데이터가 증가하면 계속 시도
-                        if new_items > 0:
-                            scroll_end_count = 0  # 데이터 증가하면 리셋
-                            print(f"시도 {scroll_attempts}회: +{scroll_result.get('scrollDelta', 0)}px 스크롤 → 🎉 {new_items}개 추가 (총 {current_count}개)")
-                        elif scroll_ended:
-                            # 스크롤 끝이지만 데이터 증가 대기 중
-                            print(f"시도 {scroll_attempts}회: 스크롤 끝 도달, API 응답 대기 중... (총 {current_count}개)")
-                        else:
-                            scroll_end_count = 0  # 스크롤 중이면 리셋
-                            print(f"시도 {scroll_attempts}회: +{scroll_result.get('scrollDelta', 0)}px 스크롤 중... (총 {current_count}개, 대기 중)")
-                
                 if len(all_articles) > initial_count:
                     print(f"🎉 수집 완료: 초기 {initial_count}개 → 최종 {len(all_articles)}개 (총 {scroll_attempts}회 시도)")
                 else:
@@ -1049,16 +1434,11 @@ class NASNaverRealEstateCrawler:
                 error_msg = str(e)
                 print(f"스크롤 크롤링 중 오류: {e}")
 
-                # 에러 발생 시 스크린샷 저장 (별도 타임아웃 5초)
-                screenshot_path = self.output_dir / f"scroll_error_screenshot_{complex_no}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-                try:
-                    await self.page.screenshot(path=str(screenshot_path), full_page=True, timeout=5000)
-                    print(f"🖼️  에러 스크린샷 저장: {screenshot_path}")
-                except Exception as ss_error:
-                    print(f"[WARNING] 스크린샷 저장 실패: {ss_error}")
+                # 진단 정보 기록 (백그라운드, 페이지 재생성 전에 버퍼 복사)
+                self.diagnostics.capture(self.page_trace if main_page else None, page, complex_no, 'scroll_error', error_msg)
 
-                # 컨텍스트 파괴 에러인 경우 페이지 재생성
-                if "Execution context was destroyed" in error_msg or "Target page" in error_msg:
+                # 컨텍스트 파괴 에러인 경우 페이지 재생성 (구간 크롤링 페이지는 호출자가 닫음)
+                if main_page and ("Execution context was destroyed" in error_msg or "Target page" in error_msg):
                     print("⚠️ 페이지 컨텍스트 에러 - 페이지 재생성")
                     await self.recreate_page()
 
@@ -1067,18 +1447,37 @@ class NASNaverRealEstateCrawler:
                     print(f"⚠️  에러 발생했지만 {len(all_articles)}개 매물은 수집 완료")
             finally:
                 # 응답 핸들러 제거 (에러 발생해도 반드시 실행)
+                if main_page:
+                    self.article_order = None
                 try:
-                    self.page.remove_listener('response', handle_articles_response)
+                    page.remove_listener('response', handle_articles_response)
                     print(f"[DEBUG] Articles 핸들러 제거 완료")
                 except Exception as e:
                     print(f"[WARNING] 핸들러 제거 실패: {e}")
 
+            crawl_mode = 'full'
+            carried_nos = []
+            if incremental['stopped']:
+                # 스크롤하지 않은 나머지(기존 매물)는 직전 스냅샷에서 매물번호만 이어받음
+                # (스냅샷은 가격 필드만 있으므로 매물 상세는 DB의 기존 행을 유지)
+                collected = {str(no) for no in collected_article_ids}
+                carried_nos = [str(a['articleNo']) for a in baseline
+                               if a.get('articleNo') and str(a['articleNo']) not in collected]
+                print(f"증분 크롤링: 신규/갱신 {len(all_articles)}개 + 기존 매물 유지 {len(carried_nos)}개")
+                crawl_mode = 'incremental'
+
             if all_articles:
-                return {
+                result = {
                     'articleList': all_articles,
-                    'totalCount': len(all_articles),
-                    'isMoreData': False
+                    'totalCount': len(all_articles) + len(carried_nos),
+                    'isMoreData': False,
+                    'crawlMode': crawl_mode,
+                    'navigationSeconds': round(navigation_seconds, 1),
+                    'scrollAttempts': scroll_attempts or 0
                 }
+                if crawl_mode == 'incremental':
+                    result['carriedArticleNos'] = carried_nos
+                return result
             else:
                 print("⚠️  매물 데이터를 수집하지 못했습니다.")
                 return None
@@ -1087,16 +1486,335 @@ class NASNaverRealEstateCrawler:
             print(f"매물 목록 크롤링 실패: {e}")
             return None
 
+    async def _on_scroll_agent_report(self, source, report: Dict):
+        """페이지 내 스크롤 에이전트 종료/정체 보고 (expose_binding)"""
+        future = self.scroll_agent_futures.get(source.get('page'))
+        if future and not future.done():
+            future.set_result(report)
+
+    async def _scroll_with_agent(self, page: Page, complex_no: str, all_articles: List[Dict],
+                                 list_complete: asyncio.Event) -> Optional[int]:
+        """페이지 내 스크롤 에이전트로 스크롤 (종료/정체 시에만 보고 받음), 시도 횟수 반환 (에이전트 사용 불가 시 None)"""
+        options = {
+            'step': 800,
+            'maxAttempts': 100,
+            'maxIdle': 3,
+            'stallLimit': 15,
+            'fastWait': 300,
+            'slowWait': 1000,
+        }
+        future = asyncio.get_running_loop().create_future()
+        self.scroll_agent_futures[page] = future
+
+        # 페이지가 이동/크래시/닫히면 에이전트도 사라지므로 보고를 기다리지 않고 컨텍스트 파괴 오류로 중단
+        # (호출자의 페이지 재생성 / context_destroyed 재시도 경로를 타도록 같은 메시지 사용)
+        def abort(reason: str):
+            if not future.done():
+                future.set_exception(RuntimeError(f"Execution context was destroyed: 스크롤 중 페이지 {reason}"))
+
+        def on_close(_=None):
+            abort('닫힘')
+
+        def on_crash(_=None):
+            abort('크래시')
+
+        def on_navigated(frame):
+            if frame == page.main_frame:
+                abort('이동')
+
+        page_events = [('close', on_close), ('crash', on_crash), ('framenavigated', on_navigated)]
+        for event, handler in page_events:
+            page.on(event, handler)
+
+        def cleanup():
+            self.scroll_agent_futures.pop(page, None)
+            if future.done() and not future.cancelled():
+                future.exception()  # 받지 않은 예외 경고 방지
+            for event, handler in page_events:
+                try:
+                    page.remove_listener(event, handler)
+                except Exception:
+                    pass
+
+        try:
+            started = await page.evaluate(SCROLL_AGENT_START_SCRIPT, options)
+        except Exception as e:
+            print(f"[WARNING] 스크롤 에이전트 시작 실패, 기존 방식으로 진행: {e}")
+            started = False
+        if not started:
+            cleanup()
+            return None
+
+        print(f"추가 매물 수집 시작 (페이지 내 스크롤 에이전트, 최대 {options['maxAttempts']}회)...")
+        # 최악의 경우(매 시도 느린 대기)보다 여유 있게 대기, 중간에는 상태만 갱신
+        deadline = time.time() + options['maxAttempts'] * options['slowWait'] / 1000 + 30
+        report = None
+        try:
+            while time.time() < deadline:
+                # 전체 매물 수에 도달하면 에이전트 종료를 기다리지 않고 바로 중단
+                complete_task = asyncio.ensure_future(list_complete.wait())
+                done, _ = await asyncio.wait([future, complete_task], timeout=3,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                complete_task.cancel()
+                if future in done:
+                    report = future.result()
+                    break
+                if list_complete.is_set():
+                    report = {'reason': 'complete', 'attempts': None}
+                    try:
+                        await page.evaluate(SCROLL_AGENT_STOP_SCRIPT)
+                    except Exception:
+                        pass
+                    break
+                if not done:
+                    self.update_status(
+                        status="running",
+                        progress=len(all_articles),
+                        total=100,  # 예상 총 매물 수 (실제는 알 수 없음)
+                        current_complex=complex_no,
+                        message=f"🔄 매물 스크롤 중... (수집 {len(all_articles)}개)",
+                        items_collected=len(all_articles)
+                    )
+        finally:
+            cleanup()
+
+        if report is None:
+            print("⚠️  스크롤 에이전트 응답 없음 (시간 초과) - 현재까지 수집한 매물로 진행")
+            return 0
+
+        # 마지막 API 응답 처리 대기
+        if report['reason'] != 'complete':
+            await asyncio.sleep(0.3)
+        reasons = {
+            'complete': '전체 매물 수 도달',
+            'end': '스크롤 끝 & 데이터 없음',
+            'stalled': '새 데이터 없이 스크롤만 진행 (정체)',
+            'max_attempts': '최대 시도 횟수 도달',
+            'no_container': '스크롤 컨테이너 없음',
+            'error': f"에이전트 오류: {report.get('error')}",
+        }
+        print(f"⏹️  수집 종료: {reasons.get(report.get('reason'), report.get('reason'))} "
+              f"(시도 {report.get('attempts') or '-'}회, 총 {len(all_articles)}개)")
+        return report.get('attempts') or 0
+
+    async def _scroll_with_evaluate(self, page: Page, complex_no: str, all_articles: List[Dict], last_api_time: List[float],
+                                    list_complete: asyncio.Event) -> int:
+        """점진적 스크롤 (crawler_service.py 방식, 매 시도마다 page.evaluate 호출), 시도 횟수 반환"""
+        print("추가 매물 수집 시작 (점진적 스크롤)...")
+        print(f"[설정] 최대 시도: 100회, 스크롤: 800px, 동적 대기(API감지:0.3초/미감지:1.0초), 종료: 3회 연속 변화 없음")
+        scroll_attempts = 0
+        max_scroll_attempts = 100  # 최대 100회
+        scroll_end_count = 0  # 스크롤이 안 움직이는 횟수
+        max_scroll_end = 3  # 3회 연속 스크롤 안 되면 종료 (속도 개선)
+        
+        while scroll_attempts < max_scroll_attempts:
+            if list_complete.is_set():
+                print(f"⏹️  수집 종료: 전체 매물 수 도달 (총 {len(all_articles)}개, {scroll_attempts}회 시도)")
+                break
+            prev_count = len(all_articles)
+            
+            # 매물 스크롤 진행 상태 업데이트
+            if scroll_attempts % 3 == 0:  # 3회마다 업데이트 (너무 자주 업데이트하면 부하)
+                self.update_status(
+                    status="running",
+                    progress=len(all_articles),
+                    total=100,  # 예상 총 매물 수 (실제는 알 수 없음)
+                    current_complex=complex_no,
+                    message=f"🔄 매물 스크롤 중... (시도 {scroll_attempts}회, 수집 {len(all_articles)}개)",
+                    items_collected=len(all_articles)
+                )
+            
+            # 네이버 실제 컨테이너로 스크롤 (800px 고정)
+            scroll_result = await page.evaluate('''
+                () => {
+                    // 네이버가 실제로 사용하는 셀렉터들
+                    const selectors = [
+                        '.item_list',  // ✅ crawler_service.py에서 사용
+                        'div[class*="list_contents"]',
+                        'div[class*="item_list"]',
+                        'div[class*="article_list"]'
+                    ];
+
+                    let container = null;
+                    for (const selector of selectors) {
+                        container = document.querySelector(selector);
+                        if (container && container.scrollHeight > container.clientHeight) {
+                            break;
+                        }
+                    }
+
+                    if (!container) {
+                        return { found: false, reason: 'container not found' };
+                    }
+
+                    // 점진적 스크롤 (800px씩 - 이전 500px에서 증가)
+                    const before = container.scrollTop;
+                    container.scrollTop += 800;  // ✅ 한 번에 끝까지 가지 않음
+                    const after = container.scrollTop;
+
+                    const items = container.querySelectorAll('.item_link, .item_inner, [class*="item"]');
+
+                    return {
+                        found: true,
+                        moved: after > before,  // ✅ 실제로 스크롤되었는지
+                        scrollBefore: before,
+                        scrollAfter: after,
+                        scrollDelta: after - before,
+                        scrollHeight: container.scrollHeight,
+                        clientHeight: container.clientHeight,
+                        itemCount: items.length,
+                        containerClass: container.className
+                    };
+                }
+            ''')
+                
+            if scroll_attempts == 0:
+                if scroll_result.get('found'):
+                    print(f"[DEBUG] 컨테이너 발견: .{scroll_result.get('containerClass', 'unknown')}")
+                    print(f"  DOM 아이템: {scroll_result.get('itemCount', 0)}개 (동일매물묶기 이전, 참고용)")
+                    print(f"  스크롤 높이: {scroll_result.get('scrollHeight')} / {scroll_result.get('clientHeight')}")
+                    print(f"  💡 실제 수집 개수는 API 응답 기준 (동일매물묶기 이후)")
+                else:
+                    print(f"[DEBUG] 컨테이너를 찾지 못함: {scroll_result.get('reason', 'unknown')}")
+
+            # 동적 대기 시간 (API 감지 여부에 따라)
+            time_since_last_api = time.time() - last_api_time[0]
+
+            if time_since_last_api < 0.5:  # 최근 0.5초 이내에 API 감지됨
+                wait_time = 0.3
+                # print(f"  [대기] API 최근 감지 → {wait_time}초 대기")
+            else:  # API 감지 안됨
+                wait_time = 1.0
+                # print(f"  [대기] API 미감지 → {wait_time}초 대기")
+
+            await asyncio.sleep(wait_time)
+            
+            current_count = len(all_articles)
+            new_items = current_count - prev_count
+            
+            scroll_attempts += 1
+            
+            # 종료 조건: 스크롤 끝 + 데이터 증가 없음 (둘 다 충족해야 함)
+            scroll_ended = scroll_result.get('found') and not scroll_result.get('moved')
+            no_new_data = new_items == 0
+            
+            if scroll_ended and no_new_data:
+                scroll_end_count += 1
+                print(f"시도 {scroll_attempts}회: 스크롤 끝 & 데이터 없음 ({scroll_end_count}/{max_scroll_end}) - 총 {current_count}개")
+                print(f"  → 스크롤: {scroll_result.get('scrollAfter')} / {scroll_result.get('scrollHeight')}")
+                
+                if scroll_end_count >= max_scroll_end:
+                    print(f"⏹️  수집 종료 ({max_scroll_end}회 연속 변화 없음)")
+                    print(f"📊 최종: {current_count}개 수집 (DOM: {scroll_result.get('itemCount', 0)}개는 동일매물묶기 이전)")
+                    break
+            else:
+                # 스크롤이 끝이어도 데이터가 증가하면 계속 시도
+                if new_items > 0:
+                    scroll_end_count = 0  # 데이터 증가하면 리셋
+                    print(f"시도 {scroll_attempts}회: +{scroll_result.get('scrollDelta', 0)}px 스크롤 → 🎉 {new_items}개 추가 (총 {current_count}개)")
+                elif scroll_ended:
+                    # 스크롤 끝이지만 데이터 증가 대기 중
+                    print(f"시도 {scroll_attempts}회: 스크롤 끝 도달, API 응답 대기 중... (총 {current_count}개)")
+                else:
+                    scroll_end_count = 0  # 스크롤 중이면 리셋
+                    print(f"시도 {scroll_attempts}회: +{scroll_result.get('scrollDelta', 0)}px 스크롤 중... (총 {current_count}개, 대기 중)")
+
+        return scroll_attempts
+
+    def article_slices_for(self, complex_no: str) -> Optional[List[Dict]]:
+        """대형 단지면 구간 목록, 아니면 None (한 페이지에서 전체 스크롤)"""
+        if self.shard_min_articles <= 0 or self.traffic_replayer or self.traffic_recorder:
+            return None
+        # 증분 크롤링 대상이면 구간 없이 최신 매물만 확인하는 편이 빠름
+        if (self.incremental_enabled and not self.filters.active
+                and self.stats_store.incremental_baseline(complex_no) is not None):
+            return None
+        snapshot = self.stats_store.load_snapshot(complex_no)
+        previous = (snapshot or {}).get('articles', [])
+        if len(previous) < self.shard_min_articles:
+            return None
+
+        # 거래유형 필터가 있으면 필터와 겹치는 구간만 (1개 이하면 나눌 필요 없음)
+        slices = []
+        for article_slice in plan_article_slices(previous):
+            trade_types = self.filters.restrict_trade_types(article_slice['params']['tradeType'])
+            if trade_types:
+                article_slice['params']['tradeType'] = trade_types
+                slices.append(article_slice)
+        return slices if len(slices) > 1 else None
+
+    async def crawl_article_slice(self, complex_no: str, article_slice: Dict,
+                                  semaphore: asyncio.Semaphore) -> Optional[Dict]:
+        """보조 페이지에서 구간 1개 크롤링 (매물 목록 API 파라미터를 라우트에서 고정)"""
+        async with semaphore:
+            page = await self._new_page(main=False)
+            try:
+                params = self.article_query_params(article_slice['params'])
+
+                async def apply_slice(route):
+                    await route.continue_(url=with_article_params(route.request.url, params))
+
+                await page.route("**/api/articles/complex/**", apply_slice)
+                return await self.crawl_complex_articles_with_scroll(complex_no, page=page, slice_name=article_slice['name'])
+            finally:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+
+    async def crawl_complex_articles_sharded(self, complex_no: str, slices: List[Dict]) -> Optional[Dict]:
+        """대형 단지를 구간별 병렬 페이지로 크롤링 후 매물번호 기준 병합
+        직전에 매물이 있던 구간이 실패하면 누락을 막기 위해 기존 방식(전체 스크롤)으로 다시 수집"""
+        plan = ', '.join(f"{article_slice['name']}({article_slice['expected']})" for article_slice in slices)
+        print(f"대형 단지 구간 크롤링: {plan}, 동시 {self.shard_pages}개 페이지")
+        started = time.time()
+        semaphore = asyncio.Semaphore(self.shard_pages)
+        # 페이지 수보다 구간이 많으면 매물이 많은 구간부터 시작 (LPT, 마지막에 큰 구간 하나만 남지 않도록)
+        launch_order = sorted(range(len(slices)), key=lambda i: slices[i]['expected'], reverse=True)
+        launched = await asyncio.gather(
+            *(self.crawl_article_slice(complex_no, slices[i], semaphore) for i in launch_order),
+            return_exceptions=True
+        )
+        results = [None] * len(slices)
+        for i, result in zip(launch_order, launched):
+            results[i] = result
+
+        all_articles = []
+        collected_article_ids = set()
+        for article_slice, result in zip(slices, results):
+            if isinstance(result, Exception) or not result:
+                if article_slice['expected'] > 0:
+                    print(f"⚠️  구간 '{article_slice['name']}' 수집 실패 - 전체 스크롤로 재수집")
+                    return await self.crawl_complex_articles_with_scroll(complex_no)
+                continue
+            merge_articles(result.get('articleList', []), collected_article_ids, all_articles)
+
+        print(f"🎉 구간 크롤링 완료: {len(all_articles)}개 ({time.time() - started:.1f}초)")
+        if not all_articles:
+            return None
+        completed = [r for r in results if isinstance(r, dict)]
+        return {
+            'articleList': all_articles,
+            'totalCount': len(all_articles),
+            'isMoreData': False,
+            'crawlMode': 'full',
+            'navigationSeconds': max((r.get('navigationSeconds', 0) for r in completed), default=0),
+            'scrollAttempts': sum(r.get('scrollAttempts', 0) for r in completed)
+        }
+
     async def crawl_complex_articles(self, complex_no: str, page_num: int = 1) -> Optional[Dict]:
         """단지 매물 목록 크롤링"""
-        # 무한 스크롤 방식으로 모든 매물 수집
+        # 무한 스크롤 방식으로 모든 매물 수집 (대형 단지는 구간별 병렬 수집)
         if page_num == 1:
+            slices = self.article_slices_for(complex_no)
+            if slices:
+                return await self.crawl_complex_articles_sharded(complex_no, slices)
             return await self.crawl_complex_articles_with_scroll(complex_no)
         else:
             return None
 
-    async def crawl_complex_data(self, complex_no: str) -> Dict:
-        """단지 전체 데이터 크롤링 (재시도 로직 및 에러 복구 포함)"""
+    async def crawl_complex_data(self, complex_no: str, inline_retry: bool = True) -> Dict:
+        """단지 전체 데이터 크롤링 (inline_retry=False면 재시도 없이 1회만 시도, 재시도는 호출자의 지연 재시도 큐가 담당)"""
         print(f"\n{'='*60}")
         print(f"단지 번호 {complex_no} 크롤링 시작")
 
@@ -1107,8 +1825,11 @@ class NASNaverRealEstateCrawler:
                 'crawler_version': '1.0.2'  # 컨텍스트 복구 로직 추가
             }
         }
+        if self.filters.active:
+            complex_data['crawling_info']['filters'] = self.filters.describe()
 
-        max_attempts = 2  # 전체 크롤링 재시도 횟수
+        max_attempts = 2 if inline_retry else 1  # 전체 크롤링 재시도 횟수
+        started = time.time()
 
         for attempt in range(1, max_attempts + 1):
             try:
@@ -1169,9 +1890,11 @@ class NASNaverRealEstateCrawler:
 
                 # 1. 단지 개요 정보 (재시도 로직 포함) - 신규 단지만
                 if not skip_overview:
-                    overview = await self.crawl_complex_overview_with_retry(complex_no)
+                    overview = await self.crawl_complex_overview_with_retry(complex_no, None if inline_retry else 1)
                     if overview:
                         complex_data['overview'] = overview
+                    else:
+                        complex_data['overview_error'] = self.last_overview_error or 'Overview 데이터 없음'
                 else:
                     overview = complex_data.get('overview')  # 기존 데이터 사용
 
@@ -1262,6 +1985,8 @@ class NASNaverRealEstateCrawler:
                 # 2. 매물 목록 (무한 스크롤 방식)
                 articles = await self.crawl_complex_articles(complex_no, 1)
                 if articles:
+                    # 가격 문자열 → 원 단위 숫자 (Node 쪽 매물별 파싱 생략용)
+                    normalize_article_prices(articles.get('articleList', []))
                     complex_data['articles'] = articles
                     article_count = len(articles.get('articleList', []))
                     print(f"매물 수: {article_count}개")
@@ -1269,6 +1994,7 @@ class NASNaverRealEstateCrawler:
                     print(f"⚠️ 매물 정보를 가져오지 못했습니다.")
 
                 print(f"단지 {complex_no} 크롤링 완료")
+                complex_data['crawling_info']['duration_seconds'] = round(time.time() - started, 1)
                 return complex_data  # 성공 시 즉시 반환
 
             except Exception as e:
@@ -1293,86 +2019,134 @@ class NASNaverRealEstateCrawler:
         complex_data['error'] = '모든 재시도 실패'
         return complex_data
 
+    @staticmethod
+    def _retryable_failure(complex_data: Dict) -> Optional[str]:
+        """재시도할 만한 실패 사유 (존재하지 않는 단지 등 재시도해도 소용없는 경우 None)"""
+        if complex_data.get('skipped'):
+            return None
+        if 'error' in complex_data:
+            return complex_data['error']
+        if 'overview' not in complex_data and complex_data.get('overview_error'):
+            return complex_data['overview_error']
+        return None
+
+    @staticmethod
+    def _better_result(previous: Optional[Dict], current: Dict) -> Dict:
+        """재시도 전후 결과 중 더 완전한 쪽 (재시도가 더 나쁘면 이전 부분 결과 유지)"""
+        if previous is None:
+            return current
+        def score(r):
+            return ('error' not in r) + ('articles' in r) + ('overview' in r)
+        return current if score(current) >= score(previous) else previous
+
     async def crawl_multiple_complexes(self, complex_numbers: List[str]) -> List[Dict]:
-        """여러 단지 크롤링"""
-        results = []
+        """여러 단지 크롤링 (실패 단지는 지연 재시도 큐로 미루고 다음 단지 진행, 결과는 입력 순서)"""
+        deferred = self.retry_mode != 'inline'
+        retry_queue = RetryQueue.from_env(self.retry_delay) if deferred else None
+        pending = deque(complex_numbers)
+        results: Dict[str, Dict] = {}
         total = len(complex_numbers)
-        
-        for i, complex_no in enumerate(complex_numbers, 1):
-            print(f"\n진행률: {i}/{total}")
-            
-            # 현재까지 수집된 전체 매물 수 계산
-            total_items_so_far = 0
-            for r in results:
-                if 'articles' in r and 'articleList' in r['articles']:
-                    total_items_so_far += len(r['articles']['articleList'])
-            
+        done = 0
+
+        while pending or retry_queue:
+            # 백오프가 끝난 재시도 단지를 우선 처리, 없으면 다음 신규 단지
+            complex_no = retry_queue.pop_ready() if retry_queue else None
+            if complex_no is None:
+                if not pending:
+                    wait_time = retry_queue.next_ready_in()
+                    if self.deadline is not None and time.time() + wait_time > self.deadline:
+                        print(f"⏱️  시간 예산 부족 - 재시도 대기 중인 {len(retry_queue)}개 단지는 실패로 종료")
+                        break
+                    print(f"⏳ 재시도 대기 중: {len(retry_queue)}개 단지, {wait_time:.1f}초 후 재개")
+                    await asyncio.sleep(wait_time)
+                    continue
+                complex_no = pending.popleft()
+
+            # 시간 예산: 이 단지를 마칠 시간이 없으면 아직 시작하지 않은 단지는 다음 실행으로 연기
+            # (봇 탐지 차단 대기 시간 포함, 첫 단지는 예산보다 커도 시작 - 계획 단계에서 단독 배정)
+            breaker_wait = self.breaker.cooldown_left()
+            if not self.time_left_for(complex_no, wait=breaker_wait, first=not results):
+                remaining = ([] if complex_no in results else [complex_no]) + list(pending)
+                reason = f"봇 탐지 차단 대기({breaker_wait:.0f}초) 후 " if breaker_wait > 0 else ""
+                print(f"⏱️  {reason}시간 예산 도달 - {len(remaining)}개 단지 다음 실행으로 연기")
+                for no in remaining:
+                    results[no] = self._deferred_result(no)
+                self.deferred_complexes.extend(remaining)
+                break
+
+            # 봇 탐지 차단 중이면 대기 (대기 후 신원 교체)
+            probing = await self.wait_for_breaker(done, total)
+
+            retry_count = retry_queue.retry_count(complex_no) if retry_queue is not None else 0
+            print(f"\n진행률: {done + 1}/{total}" + (f" (재시도 {retry_count}회차)" if retry_count else ""))
+
             # 단지 개요 수집 전 상태 업데이트
             self.update_status(
                 status="running",
-                progress=i - 1,
+                progress=done,
                 total=total,
                 current_complex=complex_no,
-                message=f"📋 단지 정보 수집 중... ({i}/{total})",
-                items_collected=total_items_so_far
+                message=f"📋 단지 정보 수집 중... ({done + 1}/{total})",
+                items_collected=count_articles(list(results.values()))
             )
-            
+
             try:
-                complex_data = await self.crawl_complex_data(complex_no)
-                results.append(complex_data)
-                
-                # 크롤링 완료 후 상태 업데이트
-                article_count = 0
-                if 'articles' in complex_data and 'articleList' in complex_data['articles']:
-                    article_count = len(complex_data['articles']['articleList'])
-                
-                # 전체 매물 수 재계산
-                total_items_so_far = 0
-                for r in results:
-                    if 'articles' in r and 'articleList' in r['articles']:
-                        total_items_so_far += len(r['articles']['articleList'])
-                
-                self.update_status(
-                    status="running",
-                    progress=i,
-                    total=total,
-                    current_complex=complex_no,
-                    message=f"✅ 완료: {complex_data.get('overview', {}).get('complexName', complex_no)} ({article_count}개 매물)",
-                    items_collected=total_items_so_far
-                )
-                
-                # 단지 간 요청 간격 조절
-                if i < total:
-                    await asyncio.sleep(self.request_delay * 2)
-                    
+                complex_data = await self.crawl_complex_data(complex_no, inline_retry=not deferred)
             except Exception as e:
                 print(f"단지 {complex_no} 크롤링 실패: {e}")
-                results.append({
+                complex_data = {
                     'complex_no': complex_no,
                     'error': str(e),
                     'crawling_date': get_kst_now().isoformat()
-                })
-                
-                # 실패 시에도 전체 매물 수 계산
-                total_items_so_far = 0
-                for r in results:
-                    if 'articles' in r and 'articleList' in r['articles']:
-                        total_items_so_far += len(r['articles']['articleList'])
-                
-                # 실패 시에도 상태 업데이트
-                self.update_status(
-                    status="running",
-                    progress=i,
-                    total=total,
-                    current_complex=complex_no,
-                    message=f"❌ 실패: {complex_no} - {str(e)[:50]}",
-                    items_collected=total_items_so_far
-                )
-        
-        return results
+                }
+            results[complex_no] = self._better_result(results.get(complex_no), complex_data)
+            if probing:
+                # DB에 있는 단지는 개요 수집을 건너뛰어 개요 성공 경로의 복구가 없으므로,
+                # 탐지 신호 없이(여전히 half_open) 수집을 마치면 여기서 시험 요청 성공 처리
+                if self._retryable_failure(complex_data) is None and self.breaker.record_success():
+                    print("✅ 봇 탐지 차단 해제 (시험 요청 성공)")
+                self.breaker.release_probe()
+
+            # 실패 시 재시도 큐에 넣고 바로 다음 단지로 (오류 유형별 예산 초과 시 실패 확정)
+            failure = self._retryable_failure(complex_data) if deferred else None
+            delay = retry_queue.push(complex_no, failure) if failure else None
+            if delay is not None:
+                error_class = classify_error(failure)
+                print(f"🔁 단지 {complex_no} 재시도 예약 ({error_class}, {delay:.0f}초 후): {failure[:80]}")
+                message = f"🔁 재시도 예약: {complex_no} ({error_class})"
+                if error_class == 'context_destroyed':
+                    try:
+                        await self.recreate_page()
+                    except Exception as e:
+                        print(f"[WARNING] 페이지 재생성 실패: {e}")
+            else:
+                done += 1
+                self.completed_cost += self.complex_costs.get(complex_no, 0.0)
+                final = results[complex_no]
+                if 'error' in final:
+                    message = f"❌ 실패: {complex_no} - {str(final['error'])[:50]}"
+                else:
+                    article_count = len(final.get('articles', {}).get('articleList', []))
+                    message = f"✅ 완료: {final.get('overview', {}).get('complexName', complex_no)} ({article_count}개 매물)"
 
-    def save_data(self, data: Any, filename_prefix: str = "naver_complex"):
-        """데이터 저장"""
+            self.update_status(
+                status="running",
+                progress=done,
+                total=total,
+                current_complex=complex_no,
+                message=message,
+                items_collected=count_articles(list(results.values()))
+            )
+
+            # 단지 간 요청 간격 조절 (메모리 감시 / 페이지·컨텍스트 재활용 포함)
+            if pending or retry_queue:
+                await self.browser_watchdog()
+                await asyncio.sleep(self.request_delay * 2)
+
+        return [results[no] for no in complex_numbers]
+
+    def save_data(self, data: Any, filename_prefix: str = "naver_complex") -> Optional[Path]:
+        """데이터 저장 (저장한 JSON 파일 경로 반환, 실패 시 None)"""
         timestamp = get_kst_now().strftime("%Y%m%d_%H%M%S")
 
         try:
@@ -1397,6 +2171,7 @@ class NASNaverRealEstateCrawler:
             with open(json_filename, 'w', encoding='utf-8') as f:
                 json.dump(data, f, ensure_ascii=False, indent=2)
             print(f"JSON 데이터 저장: {json_filename}")
+            self.last_output_file = json_filename
 
             # CSV 저장 (리스트 데이터인 경우)
             if isinstance(data, list) and data and isinstance(data[0], dict):
@@ -1426,25 +2201,81 @@ class NASNaverRealEstateCrawler:
                     df.to_csv(csv_filename, index=False, encoding='utf-8-sig')
                     print(f"CSV 데이터 저장: {csv_filename}")
 
+            return json_filename
+
         except Exception as e:
             print(f"데이터 저장 중 오류: {e}")
+            return None
 
-    async def run_crawling(self, complex_numbers: List[str]):
-        """크롤링 실행"""
-        import time
+    async def prepare_browser(self, keep_browser: bool = False):
+        """브라우저 설정 (유지 중인 브라우저가 정상이면 재사용)"""
+        if keep_browser and await self.is_browser_healthy():
+            print("♻️  기존 브라우저 재사용")
+            self._ensure_db_connection()
+            return
 
+        if self.browser:
+            await self.close_browser()
+            self._ensure_db_connection()
+        setup_start = time.time()
+        print("⏱️  브라우저 설정 시작...")
+        await self.setup_browser()
+        setup_duration = time.time() - setup_start
+        print(f"⏱️  브라우저 설정 총 소요시간: {setup_duration:.2f}초")
+
+    def time_left_for(self, complex_no: str, wait: float = 0.0, first: bool = False) -> bool:
+        """시간 예산 안에 (wait초 대기 후) 이 단지 크롤링을 마칠 수 있는지 (예산 없으면 항상 True)
+        first=True면 실행의 첫 단지 - 예산보다 큰 단지도 마감 전에 시작할 수 있으면 진행"""
+        if self.deadline is None:
+            return True
+        start = time.time() + wait
+        if first:
+            return start < self.deadline
+        cost = self.complex_costs.get(complex_no) or estimate_duration(None)
+        return start + cost <= self.deadline
+
+    @staticmethod
+    def _deferred_result(complex_no: str) -> Dict:
+        return {
+            'complex_no': complex_no,
+            'error': '시간 예산 초과 - 다음 실행으로 연기',
+            'deferred': True,
+            'crawling_date': get_kst_now().isoformat()
+        }
+
+    def plan_time_budget(self, complex_numbers: List[str]) -> List[str]:
+        """시간 예산에 맞춰 크롤링 순서 계획, 예산 밖 단지는 연기 목록에 추가 (크롤링할 단지 반환)"""
+        budget = self.time_budget - TIME_BUDGET_RESERVE_SECONDS
+        self.deadline = time.time() + budget
+        planned, deferred = plan_time_budget(self.stats_store, complex_numbers, budget)
+        self.deferred_complexes.extend(deferred)
+        estimated = sum(self.complex_costs[no] for no in planned)
+        print(f"⏱️  시간 예산 {self.time_budget:.0f}초: {len(planned)}개 단지 계획 (예상 {estimated:.0f}초), "
+              f"{len(deferred)}개 다음 실행으로 연기")
+        return planned
+
+    async def crawl_targets(self, complex_numbers: List[str]) -> List[Dict]:
+        """대상 단지 크롤링 (결과는 입력 순서)"""
+        if len(complex_numbers) == 1:
+            return [await self.crawl_complex_data(complex_numbers[0])]
+        return await self.crawl_multiple_complexes(complex_numbers)
+
+    async def run_crawling(self, complex_numbers: List[str], keep_browser: bool = False):
+        """크롤링 실행 (keep_browser=True면 종료 후에도 브라우저/DB 연결 유지, 다음 실행에서 재사용)"""
         # 상태 파일 및 시작 시간 설정
         timestamp = get_kst_now().strftime("%Y%m%d_%H%M%S")
         self.status_file = self.output_dir / f"crawl_status_{timestamp}.json"
         self.start_time = get_kst_now()  # 시작 시간 기록
+        self.last_output_file = None
+        self.diagnostics.start_run()
+        self.deadline = None
+        self.deferred_complexes = []
+        self.complex_costs = estimate_costs(self.stats_store, complex_numbers)
+        self.planned_cost = sum(self.complex_costs.values())
+        self.completed_cost = 0.0
 
         try:
-            # 브라우저 설정
-            setup_start = time.time()
-            print("⏱️  브라우저 설정 시작...")
-            await self.setup_browser()
-            setup_duration = time.time() - setup_start
-            print(f"⏱️  브라우저 설정 총 소요시간: {setup_duration:.2f}초")
+            await self.prepare_browser(keep_browser)
 
             # 크롤링 시작 상태 업데이트
             self.update_status(
@@ -1455,15 +2286,32 @@ class NASNaverRealEstateCrawler:
                 items_collected=0
             )
             
-            # 크롤링 실행
-            if len(complex_numbers) == 1:
-                data = await self.crawl_complex_data(complex_numbers[0])
-                results = [data]
-            else:
-                results = await self.crawl_multiple_complexes(complex_numbers)
+            # 크롤링 실행 (시간 예산이 있으면 싸고 급한 단지부터, 예산 밖 단지는 연기)
+            targets = self.plan_time_budget(complex_numbers) if self.time_budget > 0 else complex_numbers
+            self.planned_cost = sum(self.complex_costs.get(no, 0.0) for no in targets)
+            results = await self.crawl_targets(targets) if targets else []
+            results += [self._deferred_result(no) for no in complex_numbers if no not in targets]
             
             # 데이터 저장
             self.save_data(results, f"complexes_{len(complex_numbers)}")
+
+            # 주변 단지 조회용 공간 인덱스 증분 갱신
+            try:
+                changed = update_spatial_index(results)
+                if changed:
+                    print(f"📍 공간 인덱스 갱신: {changed}개 단지")
+            except Exception as e:
+                print(f"[WARNING] 공간 인덱스 갱신 실패: {e}")
+
+            # 단지별 매물 변동 통계 갱신 (스케줄러의 적응형 재크롤링 우선순위용)
+            # 필터 적용 크롤링은 단지 전체 매물이 아니므로 스냅샷을 덮어쓰지 않음
+            if self.filters.active:
+                print("📊 필터 적용 크롤링 - 매물 변동 통계 갱신 생략")
+            else:
+                try:
+                    self.stats_store.record_results(results)
+                except Exception as e:
+                    print(f"[WARNING] 매물 변동 통계 갱신 실패: {e}")
             
             # 결과 요약
             print(f"\n{'='*60}")
@@ -1473,24 +2321,40 @@ class NASNaverRealEstateCrawler:
             
             # 성공: articles가 있고 articleList에 매물이 있는 경우
             success_count = len([r for r in results if 'articles' in r and r.get('articles', {}).get('articleList')])
-            # 실패: error가 있거나 매물이 없는 경우
-            error_count = len(results) - success_count
-            print(f"성공: {success_count}개, 실패: {error_count}개")
+            # 실패: error가 있거나 매물이 없는 경우 (시간 예산으로 연기한 단지 제외)
+            deferred_count = len(self.deferred_complexes)
+            error_count = len(results) - success_count - deferred_count
+            print(f"성공: {success_count}개, 실패: {error_count}개" + (f", 연기: {deferred_count}개" if deferred_count else ""))
+            if deferred_count:
+                print(f"⏱️  다음 실행으로 연기된 단지: {','.join(self.deferred_complexes)}")
+            if self.browser:
+                self.sample_browser_memory()
+                stats = self.browser_stats
+                elapsed_minutes = max((get_kst_now() - self.start_time).total_seconds() / 60, 1e-6)
+                print(f"처리 속도: {len(results) / elapsed_minutes:.1f}단지/분, "
+                      f"브라우저 메모리: 현재 {stats['rss_mb']:.0f}MB (렌더러 {stats['renderer_rss_mb']:.0f}MB), "
+                      f"최대 {stats['peak_rss_mb']:.0f}MB, 재활용: 페이지 {stats['page_recycles']}회 / 컨텍스트 {stats['context_recycles']}회")
             
             # 전체 수집된 매물 수 계산
-            total_items = 0
-            for r in results:
-                if 'articles' in r and 'articleList' in r['articles']:
-                    total_items += len(r['articles']['articleList'])
+            total_items = count_articles(results)
             
-            # 크롤링 완료 상태 업데이트
-            self.update_status(
-                status="completed",
-                progress=len(complex_numbers),
-                total=len(complex_numbers),
-                message=f"✅ 크롤링 완료! 성공: {success_count}, 실패: {error_count}",
-                items_collected=total_items
-            )
+            # 크롤링 완료 상태 업데이트 (연기한 단지가 있으면 부분 완료)
+            if deferred_count:
+                self.update_status(
+                    status="partial",
+                    progress=len(complex_numbers) - deferred_count,
+                    total=len(complex_numbers),
+                    message=f"⏱️ 시간 예산 도달! 성공: {success_count}, 실패: {error_count}, 연기: {deferred_count}",
+                    items_collected=total_items
+                )
+            else:
+                self.update_status(
+                    status="completed",
+                    progress=len(complex_numbers),
+                    total=len(complex_numbers),
+                    message=f"✅ 크롤링 완료! 성공: {success_count}, 실패: {error_count}",
+                    items_collected=total_items
+                )
             
             return results
             
@@ -1508,7 +2372,9 @@ class NASNaverRealEstateCrawler:
             
             raise
         finally:
-            await self.close_browser()
+            await self.diagnostics.flush()
+            if not keep_browser:
+                await self.close_browser()
 
 
 async def fetch_info_only(complex_no: str) -> Optional[Dict]:
@@ -1533,22 +2399,39 @@ async def fetch_info_only(complex_no: str) -> Optional[Dict]:
         print(f"[fetch_info_only] 브라우저 종료 완료", flush=True)
 
 
+def pop_time_budget(args: List[str]) -> Tuple[Optional[float], List[str]]:
+    """명령행에서 --time-budget=초 옵션 분리, (시간 예산, 나머지 인자) 반환"""
+    time_budget = None
+    remaining = []
+    for arg in args:
+        if arg == '--time-budget':
+            raise ValueError("--time-budget 옵션은 --time-budget=초 형식으로 지정해야 합니다")
+        if arg.startswith('--time-budget='):
+            time_budget = float(arg.split('=', 1)[1])
+        else:
+            remaining.append(arg)
+    return time_budget, remaining
+
+
 async def main():
     """메인 함수"""
     import sys
 
     # 명령행 인자 처리
     # Usage:
-    #   - Full crawl: python nas_playwright_crawler.py "22065,12345" [crawl_id]
+    #   - Full crawl: python nas_playwright_crawler.py "22065,12345" [crawl_id] [--trade-types=A1,B1 --price-max=90000 ...]
+    #                 [--time-budget=초]  (시간 예산 안에서 계획, 못 한 단지는 연기하고 부분 완료로 종료)
     #   - Info only: python nas_playwright_crawler.py --info-only 22065
+    filters, args = CrawlFilters.from_args(sys.argv[1:])
+    time_budget, args = pop_time_budget(args)
 
-    if len(sys.argv) > 1 and sys.argv[1] == '--info-only':
+    if len(args) > 0 and args[0] == '--info-only':
         # 정보만 가져오기 모드
-        if len(sys.argv) < 3:
+        if len(args) < 2:
             print("Usage: python nas_playwright_crawler.py --info-only <complex_no>")
             sys.exit(1)
 
-        complex_no = sys.argv[2].strip()
+        complex_no = args[1].strip()
         print(f"📋 단지 정보만 조회: {complex_no}")
 
         info = await fetch_info_only(complex_no)
@@ -1566,18 +2449,20 @@ async def main():
     crawl_id = None
     complex_numbers = ['22065']  # 기본값
 
-    if len(sys.argv) > 1:
-        complex_numbers = sys.argv[1].split(',')
+    if len(args) > 0:
+        complex_numbers = args[0].split(',')
         complex_numbers = [num.strip() for num in complex_numbers if num.strip()]
 
-    if len(sys.argv) > 2:
-        crawl_id = sys.argv[2].strip()
+    if len(args) > 1:
+        crawl_id = args[1].strip()
         print(f"🔗 Crawl ID: {crawl_id}")
 
     print(f"📋 크롤링 대상 단지: {complex_numbers}")
+    if filters.active:
+        print(f"🔎 크롤링 필터: {filters.describe()}")
 
     # 크롤러 인스턴스 생성 (crawl_id 전달)
-    crawler = NASNaverRealEstateCrawler(crawl_id=crawl_id)
+    crawler = NASNaverRealEstateCrawler(crawl_id=crawl_id, filters=filters, time_budget=time_budget)
 
     # 크롤링 실행
     await crawler.run_crawling(complex_numbers)
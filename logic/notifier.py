@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스케줄러 알림 발송기
+알림을 큐에 넣기만 하고 즉시 반환하며, 백그라운드 작업이 발송을 담당한다.
+
+- NOTIFY_BATCH_SECONDS 동안 들어온 알림은 하나의 요약 메시지로 묶어 발송
+- 웹훅은 하나의 aiohttp 세션(커넥션 풀)을 재사용
+- SMTP는 블로킹 라이브러리이므로 스레드에서 실행 (이벤트 루프 차단 없음)
+- 채널별로 지수 백오프 재시도 (NOTIFY_MAX_RETRIES)
+"""
+
+import asyncio
+import os
+import smtplib
+from datetime import datetime
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from typing import List, Optional, Tuple
+
+import aiohttp
+from loguru import logger
+
+
+class NotificationDispatcher:
+    """배치/재시도를 지원하는 비동기 알림 발송기"""
+
+    def __init__(self):
+        self.batch_window = float(os.getenv('NOTIFY_BATCH_SECONDS', '30'))
+        self.max_retries = int(os.getenv('NOTIFY_MAX_RETRIES', '3'))
+        self.retry_delay = 2.0
+
+        self.email_enabled = os.getenv('EMAIL_NOTIFICATIONS', 'false').lower() == 'true'
+        self.webhook_url = os.getenv('WEBHOOK_URL')
+
+        self.queue: Optional[asyncio.Queue] = None
+        self.task: Optional[asyncio.Task] = None
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.email_enabled or bool(self.webhook_url)
+
+    def notify(self, title: str, message: str):
+        """알림 등록 (발송을 기다리지 않음)"""
+        if not self.enabled:
+            return
+        if self.task is None:
+            self.queue = asyncio.Queue()
+            self.task = asyncio.create_task(self._run())
+        self.queue.put_nowait((title, message, datetime.now()))
+
+    async def _run(self):
+        while True:
+            events = [await self.queue.get()]
+
+            # 배치 창 동안 추가로 들어온 알림 수집
+            deadline = asyncio.get_running_loop().time() + self.batch_window
+            while True:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    events.append(await asyncio.wait_for(self.queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            title, message = self._digest(events)
+            await self._dispatch(title, message)
+            for _ in events:
+                self.queue.task_done()
+
+    @staticmethod
+    def _digest(events: List[Tuple[str, str, datetime]]) -> Tuple[str, str]:
+        """알림 여러 건을 하나의 메시지로 요약"""
+        if len(events) == 1:
+            title, message, _ = events[0]
+            return title, message
+
+        failed = len([e for e in events if '실패' in e[0]])
+        title = f"알림 {len(events)}건" + (f" (실패 {failed}건)" if failed else "")
+        lines = [f"• [{at.strftime('%H:%M:%S')}] {t}: {m}" for t, m, at in events]
+        return title, '\n'.join(lines)
+
+    async def _dispatch(self, title: str, message: str):
+        channels = []
+        if self.email_enabled:
+            channels.append(('이메일', lambda: asyncio.to_thread(self._send_email, title, message)))
+        if self.webhook_url:
+            channels.append(('웹훅', lambda: self._send_webhook(title, message)))
+
+        await asyncio.gather(*[self._with_retry(name, send) for name, send in channels])
+
+    async def _with_retry(self, channel: str, send):
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                await send()
+                logger.info(f"{channel} 알림 발송 완료")
+                return
+            except Exception as e:
+                if attempt == self.max_retries:
+                    logger.error(f"{channel} 알림 발송 실패 ({attempt}회 시도): {e}")
+                    return
+                delay = self.retry_delay * (2 ** (attempt - 1))
+                logger.warning(f"{channel} 알림 발송 실패, {delay:.0f}초 후 재시도: {e}")
+                await asyncio.sleep(delay)
+
+    def _send_email(self, title: str, message: str):
+        """이메일 발송 (블로킹, 스레드에서 실행)"""
+        smtp_server = os.getenv('SMTP_SERVER')
+        smtp_port = int(os.getenv('SMTP_PORT', '587'))
+        smtp_username = os.getenv('SMTP_USERNAME')
+        smtp_password = os.getenv('SMTP_PASSWORD')
+        notification_email = os.getenv('NOTIFICATION_EMAIL')
+
+        if not all([smtp_server, smtp_username, smtp_password, notification_email]):
+            logger.warning("이메일 설정이 불완전합니다.")
+            return
+
+        msg = MIMEMultipart()
+        msg['From'] = smtp_username
+        msg['To'] = notification_email
+        msg['Subject'] = f"[부동산 크롤러] {title}"
+
+        body = f"""
+        부동산 크롤러 알림
+
+        제목: {title}
+        메시지: {message}
+        시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+        """
+        msg.attach(MIMEText(body, 'plain'))
+
+        with smtplib.SMTP(smtp_server, smtp_port, timeout=30) as server:
+            server.starttls()
+            server.login(smtp_username, smtp_password)
+            server.send_message(msg)
+
+    async def _send_webhook(self, title: str, message: str):
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=4, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=15)
+            )
+
+        payload = {
+            "text": f"[부동산 크롤러] {title}",
+            "blocks": [
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": f"*{title}*\n{message}\n시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+                    }
+                }
+            ]
+        }
+
+        async with self.session.post(self.webhook_url, json=payload) as response:
+            if response.status >= 300:
+                raise RuntimeError(f"HTTP {response.status}")
+
+    async def close(self, timeout: float = 60):
+        """대기 중인 알림을 발송한 뒤 종료"""
+        if self.task:
+            try:
+                await asyncio.wait_for(self.queue.join(), timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"미발송 알림 {self.queue.qsize()}건을 버리고 종료합니다.")
+            self.task.cancel()
+            self.task = None
+        if self.session and not self.session.closed:
+            await self.session.close()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+매물 가격 정규화
+네이버 부동산 가격 문자열("3억 5,000", "8,500")을 원 단위 정수로 변환
+
+lib/price-utils.ts의 parsePriceToWonBigInt와 동일한 규칙을 따르며,
+크롤링 결과에 숫자 가격을 미리 넣어두어 Node 쪽에서 매물마다 파싱하지 않도록 한다.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+EOK = 100_000_000  # 1억
+MAN = 10_000  # 1만
+
+_EOK_PATTERN = r'(\d+)억'
+_MAN_AFTER_EOK_PATTERN = r'억([\d,]+)'
+_MAN_ONLY_PATTERN = r'^([\d,]+)$'
+
+_EOK_RE = re.compile(_EOK_PATTERN)
+_MAN_AFTER_EOK_RE = re.compile(_MAN_AFTER_EOK_PATTERN)
+_MAN_ONLY_RE = re.compile(_MAN_ONLY_PATTERN)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# 가격 문자열 → 원 단위 캐시 (매물 가격은 종류가 적고 반복이 많음)
+_price_cache: Dict[str, Optional[int]] = {}
+_PRICE_CACHE_MAX = 50_000
+
+
+def _is_empty(value) -> bool:
+    return value is None or value == '' or value == '-' or (isinstance(value, float) and np.isnan(value))
+
+
+def parse_price_to_won(price_str: Optional[str]) -> Optional[int]:
+    """
+    가격 문자열 1건을 원 단위로 변환
+    예: "3억 5,000" -> 350000000, "8,500" -> 85000000, "" / "-" -> None
+    """
+    if _is_empty(price_str):
+        return None
+
+    cached = _price_cache.get(price_str)
+    if cached is not None or price_str in _price_cache:
+        return cached
+
+    clean_str = _WHITESPACE_RE.sub('', str(price_str))
+    eok_match = _EOK_RE.search(clean_str)
+    eok = int(eok_match.group(1)) if eok_match else 0
+
+    man = 0
+    man_match = _MAN_AFTER_EOK_RE.search(clean_str)
+    if man_match:
+        man = int(man_match.group(1).replace(',', '') or 0)
+    elif not eok_match:
+        only_number = _MAN_ONLY_RE.match(clean_str)
+        if only_number:
+            man = int(only_number.group(1).replace(',', '') or 0)
+
+    won = eok * EOK + man * MAN
+    _remember(price_str, won)
+    return won
+
+
+def _remember(price_str: str, won: Optional[int]):
+    if len(_price_cache) >= _PRICE_CACHE_MAX:
+        _price_cache.clear()
+    _price_cache[price_str] = won
+
+
+def _digits_to_int(series: pd.Series) -> pd.Series:
+    """'1,500' 형태의 추출 결과를 정수로 (없으면 0)"""
+    digits = series.astype('string').str.replace(',', '', regex=False)
+    return pd.to_numeric(digits, errors='coerce').fillna(0).astype(np.int64)
+
+
+def parse_prices_to_won(values: Iterable[Optional[str]]) -> List[Optional[int]]:
+    """
+    가격 문자열 배열을 한 번에 원 단위로 변환 (pandas 벡터화)
+    고유 문자열로 인코딩(factorize)한 뒤 캐시에 없는 것만 정규식으로 일괄 파싱하고,
+    코드 배열 인덱싱으로 전체 결과를 조립한다.
+    """
+    codes, uniques = pd.factorize(np.asarray(list(values), dtype=object))
+    if len(codes) == 0:
+        return []
+
+    uniques = list(uniques)
+    uncached = [u for u in uniques if not _is_empty(u) and u not in _price_cache]
+
+    if uncached:
+        raw = pd.Series(uncached, dtype=object)
+        clean = raw.astype(str).str.replace(_WHITESPACE_RE.pattern, '', regex=True)
+
+        eok_str = clean.str.extract(_EOK_PATTERN, expand=False)
+        man_after_eok = clean.str.extract(_MAN_AFTER_EOK_PATTERN, expand=False)
+        man_only = clean.str.extract(_MAN_ONLY_PATTERN, expand=False)
+
+        # '억' 뒤 숫자가 우선, '억'이 전혀 없을 때만 순수 숫자를 만원 단위로 사용
+        man_str = man_after_eok.where(man_after_eok.notna(), man_only.where(eok_str.isna()))
+
+        won = _digits_to_int(eok_str) * EOK + _digits_to_int(man_str) * MAN
+        for price_str, value in zip(uncached, won.tolist()):
+            _remember(price_str, int(value))
+
+    # 마지막 원소(None)는 factorize가 결측값에 부여하는 코드 -1에 대응
+    lookup = np.array(
+        [None if _is_empty(u) else _price_cache.get(u) for u in uniques] + [None],
+        dtype=object,
+    )
+    return lookup[codes].tolist()
+
+
+def normalize_article_prices(articles: List[Dict]) -> List[Dict]:
+    """
+    매물 목록에 원 단위 숫자 가격을 추가 (in-place)
+    - dealOrWarrantPrcWon: 매매가/보증금
+    - rentPrcWon: 월세 (없으면 None)
+    """
+    if not articles:
+        return articles
+
+    deal_won = parse_prices_to_won(a.get('dealOrWarrantPrc') for a in articles)
+    rent_won = parse_prices_to_won((a.get('rentPrc') or None) for a in articles)
+
+    for article, deal, rent in zip(articles, deal_won, rent_won):
+        article['dealOrWarrantPrcWon'] = deal
+        article['rentPrcWon'] = rent
+
+    return articles
+
+
+def clear_price_cache():
+    """가격 캐시 초기화 (테스트/장시간 실행용)"""
+    _price_cache.clear()
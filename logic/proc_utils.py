@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+프로세스 메모리 측정 유틸리티 (/proc 기반, Linux 전용)
+Playwright 드라이버(node)와 Chromium은 현재 프로세스의 자식 프로세스로 실행되므로
+프로세스 트리 전체 RSS로 브라우저 메모리 사용량을 추정한다.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PROC = Path('/proc')
+
+
+def _read_ppid_map() -> Dict[int, int]:
+    """pid → ppid"""
+    ppids = {}
+    for entry in PROC.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / 'stat').read_text()
+        except OSError:
+            continue
+        # comm에 공백/괄호가 있을 수 있으므로 마지막 ')' 이후를 파싱
+        fields = stat[stat.rfind(')') + 2:].split()
+        ppids[int(entry.name)] = int(fields[1])
+    return ppids
+
+
+def descendant_pids(root_pid: Optional[int] = None) -> List[int]:
+    """root_pid와 모든 자손 프로세스 pid"""
+    root_pid = root_pid or os.getpid()
+    children: Dict[int, List[int]] = {}
+    for pid, ppid in _read_ppid_map().items():
+        children.setdefault(ppid, []).append(pid)
+
+    pids = [root_pid]
+    i = 0
+    while i < len(pids):
+        pids.extend(children.get(pids[i], []))
+        i += 1
+    return pids
+
+
+def process_rss_mb(pid: int) -> float:
+    try:
+        for line in (PROC / str(pid) / 'status').read_text().splitlines():
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return 0.0
+
+
+def process_tree_rss_mb(root_pid: Optional[int] = None) -> float:
+    """프로세스 트리 전체 RSS (MB), /proc이 없으면 0"""
+    if not PROC.exists():
+        return 0.0
+    return sum(process_rss_mb(pid) for pid in descendant_pids(root_pid))
+
+
+def browser_rss_mb(root_pid: Optional[int] = None) -> Dict[str, float]:
+    """현재 프로세스가 띄운 브라우저 메모리 (MB) - 전체 자식 프로세스 / 렌더러 프로세스"""
+    if not PROC.exists():
+        return {'total': 0.0, 'renderer': 0.0}
+    root_pid = root_pid or os.getpid()
+    total = renderer = 0.0
+    for pid in descendant_pids(root_pid)[1:]:
+        rss = process_rss_mb(pid)
+        total += rss
+        try:
+            if b'--type=renderer' in (PROC / str(pid) / 'cmdline').read_bytes():
+                renderer += rss
+        except OSError:
+            pass
+    return {'total': total, 'renderer': renderer}
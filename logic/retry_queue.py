@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+실패 단지 지연 재시도 큐
+실패한 단지를 그 자리에서 기다리며 재시도하지 않고 큐에 넣어두었다가,
+백오프 시간이 지나면 정상 단지 사이에 끼워 넣거나 본 크롤링이 끝난 뒤 처리한다.
+
+오류 유형별 재시도 예산 (RETRY_BUDGET_*):
+    timeout            API 응답/페이지 로딩 시간 초과
+    bot_redirect       봇 탐지로 인한 리다이렉트 (백오프 4배)
+    context_destroyed  페이지 컨텍스트 파괴 (Execution context was destroyed 등)
+    other              그 밖의 오류
+"""
+
+import heapq
+import itertools
+import os
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+ERROR_CLASSES = ('timeout', 'bot_redirect', 'context_destroyed', 'other')
+
+DEFAULT_BUDGETS = {
+    'timeout': 2,
+    'bot_redirect': 1,
+    'context_destroyed': 2,
+    'other': 1,
+}
+
+# 오류 유형별 백오프 배율 (봇 탐지는 충분히 쉬었다가 재시도)
+BACKOFF_SCALE = {
+    'timeout': 1.0,
+    'bot_redirect': 4.0,
+    'context_destroyed': 0.5,
+    'other': 1.0,
+}
+
+
+def classify_error(message: Optional[str]) -> str:
+    """오류 메시지 → 오류 유형"""
+    text = (message or '').lower()
+    if 'execution context was destroyed' in text or 'target page' in text or 'target closed' in text:
+        return 'context_destroyed'
+    if '리다이렉트' in text or 'redirect' in text or '봇 탐지' in text:
+        return 'bot_redirect'
+    if 'timeout' in text or '시간 초과' in text:
+        return 'timeout'
+    return 'other'
+
+
+class RetryQueue:
+    """백오프 시간이 지난 단지부터 꺼내는 재시도 큐"""
+
+    def __init__(self, base_delay: float, budgets: Optional[Dict[str, int]] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.base_delay = base_delay
+        self.budgets = dict(DEFAULT_BUDGETS, **(budgets or {}))
+        self.clock = clock
+        self.heap: List[Tuple[float, int, str]] = []
+        self.seq = itertools.count()
+        self.attempts: Dict[str, Dict[str, int]] = {}  # 단지번호 → 오류 유형별 재시도 횟수
+
+    @classmethod
+    def from_env(cls, base_delay: float) -> 'RetryQueue':
+        budgets = {
+            error_class: int(os.getenv(f"RETRY_BUDGET_{error_class.upper()}", str(default)))
+            for error_class, default in DEFAULT_BUDGETS.items()
+        }
+        return cls(base_delay, budgets)
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def push(self, complex_no: str, error: str) -> Optional[float]:
+        """재시도 예약, 대기 시간(초) 반환 (해당 유형의 예산을 다 썼으면 None)"""
+        error_class = classify_error(error)
+        counts = self.attempts.setdefault(complex_no, {})
+        used = counts.get(error_class, 0)
+        if used >= self.budgets.get(error_class, 0):
+            return None
+
+        counts[error_class] = used + 1
+        delay = self.base_delay * BACKOFF_SCALE[error_class] * (2 ** used)
+        heapq.heappush(self.heap, (self.clock() + delay, next(self.seq), complex_no))
+        return delay
+
+    def pop_ready(self) -> Optional[str]:
+        """백오프가 끝난 단지 (없으면 None)"""
+        if self.heap and self.heap[0][0] <= self.clock():
+            return heapq.heappop(self.heap)[2]
+        return None
+
+    def next_ready_in(self) -> float:
+        """다음 재시도까지 남은 시간 (초)"""
+        if not self.heap:
+            return 0.0
+        return max(0.0, self.heap[0][0] - self.clock())
+
+    def retry_count(self, complex_no: str) -> int:
+        return sum(self.attempts.get(complex_no, {}).values())
@@ -6,18 +6,26 @@ NAS 환경용 네이버 부동산 크롤러 스케줄러
 """
 
 import asyncio
+import math
 import os
+import re
 import sys
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from dotenv import load_dotenv
 from loguru import logger
 
+from complex_stats import ComplexStatsStore
+from cost_model import estimate_costs, lpt_partition
+from crawler_pool import CrawlerPool
+from notifier import NotificationDispatcher
+from worker_pool import CrawlWorkerPool, summarize_results
+
 # 환경변수 로드
 load_dotenv('config.env')
 
@@ -30,6 +38,30 @@ logger.add(
 )
 
 
+# 표준 cron 요일 번호(0,7=일요일) → APScheduler 요일 이름 (APScheduler는 숫자 0을 월요일로 해석)
+CRON_DAY_NAMES = ['sun', 'mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']
+
+
+def build_cron_trigger(cron_expr: str, timezone=None, jitter: Optional[int] = None) -> CronTrigger:
+    """5필드 cron 표현식으로 CronTrigger 생성 (형식 오류 시 ValueError)"""
+    cron_parts = cron_expr.split()
+    if len(cron_parts) != 5:
+        raise ValueError(f"잘못된 cron 형식: {cron_expr}")
+
+    minute, hour, day, month, day_of_week = cron_parts
+    day_of_week = re.sub(r'(?<!/)\b\d+\b', lambda m: CRON_DAY_NAMES[int(m.group()) % 8], day_of_week)
+
+    return CronTrigger(
+        minute=minute,
+        hour=hour,
+        day=day,
+        month=month,
+        day_of_week=day_of_week,
+        timezone=timezone,
+        jitter=jitter or None
+    )
+
+
 class CrawlerScheduler:
     """크롤러 스케줄링 관리 클래스"""
     
@@ -38,6 +70,30 @@ class CrawlerScheduler:
         self.crawler_module = None
         self.complex_numbers = self._parse_complex_numbers()
         self.schedule_cron = os.getenv('SCHEDULE', '0 9 * * *')  # 기본값: 매일 오전 9시
+
+        # 샤드 병렬 실행 설정
+        self.parallelism = max(1, int(os.getenv('CRAWL_PARALLELISM', '1')))
+        self.shard_size = int(os.getenv('CRAWL_SHARD_SIZE', '0'))  # 0: 병렬도에 맞춰 자동 분할
+        self.shard_stagger = float(os.getenv('SHARD_START_STAGGER', '2.0'))  # 샤드 간 시작 간격 (초)
+        self.schedule_jitter = int(os.getenv('SCHEDULE_JITTER_SECONDS', '0'))
+        self.misfire_grace = int(os.getenv('SCHEDULE_MISFIRE_GRACE', '300'))
+        self.shard_semaphore: Optional[asyncio.Semaphore] = None
+
+        # 크롤러 실행 방식
+        #   inprocess: 스케줄러 프로세스에서 실행, 실행 간 브라우저 유지 (CRAWLER_REUSE=false면 매번 새로 생성)
+        #   subprocess: 워커 프로세스 풀에서 실행 (브라우저 크래시/메모리 누수 격리)
+        self.execution_mode = os.getenv('CRAWLER_EXECUTION_MODE', 'inprocess').lower()
+        self.crawler_pool: Optional[CrawlerPool] = None
+        self.worker_pool: Optional[CrawlWorkerPool] = None
+        if self.execution_mode == 'subprocess':
+            self.worker_pool = CrawlWorkerPool(self.parallelism)
+        elif os.getenv('CRAWLER_REUSE', 'true').lower() == 'true':
+            self.crawler_pool = CrawlerPool(lambda: self.crawler_module())
+
+        self.notifier = NotificationDispatcher()
+
+        # 실행당 크롤링할 최대 단지 수 (0: 전체), 변동 가능성이 높은 단지부터 선택
+        self.crawl_budget = int(os.getenv('CRAWL_BUDGET', '0'))
         
         # 로그 디렉토리 생성
         Path('logs').mkdir(exist_ok=True)
@@ -45,148 +101,131 @@ class CrawlerScheduler:
         logger.info(f"스케줄러 초기화 완료")
         logger.info(f"크롤링 대상 단지: {self.complex_numbers}")
         logger.info(f"스케줄 설정: {self.schedule_cron}")
+        logger.info(f"병렬도: {self.parallelism}, 샤드 크기: {self.shard_size or '자동'}")
 
     def _parse_complex_numbers(self) -> List[str]:
         """환경변수에서 단지 번호들 파싱"""
         complex_numbers_str = os.getenv('COMPLEX_NUMBERS', '22065')
         return [num.strip() for num in complex_numbers_str.split(',') if num.strip()]
 
+    def _make_shards(self, complex_numbers: Optional[List[str]] = None) -> List[List[str]]:
+        """단지 목록을 샤드로 분할
+        자동 분할이면 단지별 예측 비용(과거 소요 시간)으로 병렬도만큼 균등 분배 (LPT), 샤드 크기 지정 시 단지 수 기준"""
+        complex_numbers = self.complex_numbers if complex_numbers is None else complex_numbers
+        if not complex_numbers:
+            return []
+        if self.shard_size <= 0 and self.parallelism > 1:
+            costs = estimate_costs(ComplexStatsStore(), complex_numbers)
+            shards = lpt_partition(complex_numbers, costs, self.parallelism)
+            loads = ', '.join(f"{sum(costs[no] for no in shard):.0f}초" for shard in shards)
+            logger.info(f"샤드 예상 소요 시간: {loads}")
+            return shards
+        size = self.shard_size if self.shard_size > 0 else math.ceil(len(complex_numbers) / self.parallelism)
+        return [complex_numbers[i:i + size] for i in range(0, len(complex_numbers), size)]
+
+    def plan_complexes(self, complex_numbers: List[str]) -> List[str]:
+        """크롤링 예산 내에서 변동 가능성이 높은 단지 선택 (경과 시간 × 매물 변동률 순)"""
+        if self.crawl_budget <= 0:
+            return complex_numbers
+
+        selected, skipped = ComplexStatsStore().select(complex_numbers, self.crawl_budget)
+        if skipped:
+            logger.info(f"크롤링 예산 {self.crawl_budget}개: {len(selected)}개 선택, {len(skipped)}개 다음 실행으로 연기")
+        return selected
+
+    async def run_shard(self, index: int, total: int, shard: List[str],
+                        semaphore: asyncio.Semaphore) -> Optional[List[Dict]]:
+        """샤드 하나 실행 (샤드마다 별도 크롤러/브라우저 사용), 단지별 요약 반환 (실패 시 None)"""
+        # 브라우저가 동시에 뜨지 않도록 시작 시점을 어긋나게 함 (상태 파일명 충돌 방지 포함)
+        await asyncio.sleep(index * self.shard_stagger)
+
+        async with semaphore:
+            label = f"샤드 {index + 1}/{total}"
+            start = time.time()
+            try:
+                logger.info(f"[{label}] 크롤링 시작: {shard}")
+                if self.worker_pool:
+                    results = await self.worker_pool.run(
+                        shard,
+                        on_progress=lambda st: logger.debug(f"[{label}] {st.get('progress')}/{st.get('total')} {st.get('message')}")
+                    )
+                elif self.crawler_pool:
+                    results = summarize_results(await self.crawler_pool.run(shard))
+                else:
+                    crawler = self.crawler_module()
+                    results = summarize_results(await crawler.run_crawling(shard))
+                elapsed = time.time() - start
+
+                logger.info(f"[{label}] 크롤링 완료 ({elapsed:.1f}초)")
+                await self.send_notification(
+                    f"크롤링 완료 ({label})",
+                    f"{len(shard)}개 단지 중 {len([r for r in results if 'error' not in r])}개 성공 ({elapsed:.1f}초)"
+                )
+                return results
+
+            except Exception as e:
+                logger.error(f"[{label}] 크롤링 실행 중 오류: {e}")
+                await self.send_notification(f"크롤링 실패 ({label})", f"크롤링 중 오류가 발생했습니다: {str(e)}")
+                return None
+
+    async def run_sharded(self, complex_numbers: List[str]) -> List[Optional[List[Dict]]]:
+        """단지 목록을 샤드로 나눠 병렬 실행 (샤드별 결과 목록 반환)"""
+        # 크롤러 모듈 동적 임포트 (워커 모드에서는 워커 프로세스가 임포트)
+        if not self.crawler_module and not self.worker_pool:
+            from hybrid_crawler import create_crawler
+            self.crawler_module = create_crawler  # CRAWLER_BACKEND에 따라 브라우저/하이브리드
+
+        # 동시에 여러 실행이 겹쳐도 전체 브라우저 수는 병렬도 이내로 유지
+        if self.shard_semaphore is None:
+            self.shard_semaphore = asyncio.Semaphore(self.parallelism)
+
+        shards = self._make_shards(complex_numbers)
+        return await asyncio.gather(*[
+            self.run_shard(i, len(shards), shard, self.shard_semaphore) for i, shard in enumerate(shards)
+        ])
+
     async def run_crawler(self):
-        """크롤러 실행"""
+        """크롤러 실행 (샤드 단위 병렬)"""
         try:
             logger.info("스케줄된 크롤링 시작")
             
-            # 크롤러 모듈 동적 임포트
-            if not self.crawler_module:
-                from nas_playwright_crawler import NASNaverRealEstateCrawler
-                self.crawler_module = NASNaverRealEstateCrawler
-            
-            # 크롤러 인스턴스 생성 및 실행
-            crawler = self.crawler_module()
-            await crawler.run_crawling(self.complex_numbers)
-            
-            logger.info("스케줄된 크롤링 완료")
+            outcomes = await self.run_sharded(self.plan_complexes(self.complex_numbers))
+            succeeded = len([o for o in outcomes if o is not None])
             
-            # 알림 발송 (설정된 경우)
-            await self.send_notification("크롤링 완료", f"{len(self.complex_numbers)}개 단지 크롤링이 완료되었습니다.")
+            logger.info(f"스케줄된 크롤링 완료: 샤드 {succeeded}/{len(outcomes)} 성공")
             
         except Exception as e:
             logger.error(f"크롤링 실행 중 오류: {e}")
             await self.send_notification("크롤링 실패", f"크롤링 중 오류가 발생했습니다: {str(e)}")
 
     async def send_notification(self, title: str, message: str):
-        """알림 발송"""
+        """알림 발송 (큐에 등록만 하고 즉시 반환, 실제 발송은 백그라운드)"""
         try:
-            # 이메일 알림
-            if os.getenv('EMAIL_NOTIFICATIONS', 'false').lower() == 'true':
-                await self.send_email_notification(title, message)
-            
-            # 웹훅 알림
-            webhook_url = os.getenv('WEBHOOK_URL')
-            if webhook_url:
-                await self.send_webhook_notification(title, message)
-                
+            self.notifier.notify(title, message)
         except Exception as e:
-            logger.error(f"알림 발송 실패: {e}")
-
-    async def send_email_notification(self, title: str, message: str):
-        """이메일 알림 발송"""
-        try:
-            import smtplib
-            from email.mime.text import MIMEText
-            from email.mime.multipart import MIMEMultipart
-            
-            smtp_server = os.getenv('SMTP_SERVER')
-            smtp_port = int(os.getenv('SMTP_PORT', '587'))
-            smtp_username = os.getenv('SMTP_USERNAME')
-            smtp_password = os.getenv('SMTP_PASSWORD')
-            notification_email = os.getenv('NOTIFICATION_EMAIL')
-            
-            if not all([smtp_server, smtp_username, smtp_password, notification_email]):
-                logger.warning("이메일 설정이 불완전합니다.")
-                return
-            
-            msg = MIMEMultipart()
-            msg['From'] = smtp_username
-            msg['To'] = notification_email
-            msg['Subject'] = f"[부동산 크롤러] {title}"
-            
-            body = f"""
-            부동산 크롤러 알림
-            
-            제목: {title}
-            메시지: {message}
-            시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-            """
-            
-            msg.attach(MIMEText(body, 'plain'))
-            
-            # SMTP 서버 연결 및 메일 발송
-            server = smtplib.SMTP(smtp_server, smtp_port)
-            server.starttls()
-            server.login(smtp_username, smtp_password)
-            server.send_message(msg)
-            server.quit()
-            
-            logger.info("이메일 알림 발송 완료")
-            
-        except Exception as e:
-            logger.error(f"이메일 알림 발송 실패: {e}")
-
-    async def send_webhook_notification(self, title: str, message: str):
-        """웹훅 알림 발송"""
-        try:
-            import aiohttp
-            
-            webhook_url = os.getenv('WEBHOOK_URL')
-            
-            payload = {
-                "text": f"[부동산 크롤러] {title}",
-                "blocks": [
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": f"*{title}*\n{message}\n시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-                        }
-                    }
-                ]
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(webhook_url, json=payload) as response:
-                    if response.status == 200:
-                        logger.info("웹훅 알림 발송 완료")
-                    else:
-                        logger.error(f"웹훅 알림 발송 실패: {response.status}")
-                        
-        except Exception as e:
-            logger.error(f"웹훅 알림 발송 실패: {e}")
+            logger.error(f"알림 등록 실패: {e}")
 
     def setup_schedule(self):
         """스케줄 설정"""
         try:
             # cron 형식 파싱
-            cron_parts = self.schedule_cron.split()
-            if len(cron_parts) != 5:
-                logger.error(f"잘못된 cron 형식: {self.schedule_cron}")
+            try:
+                trigger = build_cron_trigger(self.schedule_cron, jitter=self.schedule_jitter)
+            except ValueError as e:
+                logger.error(str(e))
                 return
             
-            minute, hour, day, month, day_of_week = cron_parts
-            
             # 스케줄 추가
             self.scheduler.add_job(
                 self.run_crawler,
-                CronTrigger(
-                    minute=minute,
-                    hour=hour,
-                    day=day,
-                    month=month,
-                    day_of_week=day_of_week
-                ),
+                trigger,
                 id='naver_crawler_job',
                 name='네이버 부동산 크롤러',
-                replace_existing=True
+                replace_existing=True,
+                # 이전 실행이 끝나기 전에 다음 트리거가 오면 겹쳐 실행하지 않고 한 번으로 합침
+                max_instances=1,
+                coalesce=True,
+                misfire_grace_time=self.misfire_grace
             )
             
             logger.info(f"스케줄 설정 완료: {self.schedule_cron}")
@@ -212,6 +251,10 @@ class CrawlerScheduler:
             # 스케줄러가 실행 중인 동안 대기
             while True:
                 await asyncio.sleep(60)  # 1분마다 체크
+
+                # 오래 쓰지 않은 크롤러의 브라우저 종료
+                if self.crawler_pool:
+                    await self.crawler_pool.close_idle()
                 
                 # 스케줄러 상태 확인
                 if not self.scheduler.running:
@@ -226,6 +269,11 @@ class CrawlerScheduler:
             # 스케줄러 종료
             if self.scheduler.running:
                 self.scheduler.shutdown()
+            if self.crawler_pool:
+                await self.crawler_pool.close_all()
+            if self.worker_pool:
+                await self.worker_pool.close_all()
+            await self.notifier.close()
             logger.info("스케줄러 종료됨")
 
 
@@ -233,7 +281,12 @@ async def main():
     """메인 함수"""
     logger.info("부동산 크롤러 스케줄러 시작")
     
-    scheduler = CrawlerScheduler()
+    # db: schedules 테이블의 활성 스케줄 전체 실행, env: SCHEDULE/COMPLEX_NUMBERS 단일 스케줄
+    if os.getenv('SCHEDULER_MODE', 'env').lower() == 'db':
+        from db_scheduler import DBScheduler
+        scheduler = DBScheduler()
+    else:
+        scheduler = CrawlerScheduler()
     await scheduler.run()
 
 
@@ -7,17 +7,22 @@ NAS 환경에서 안정적으로 동작하는 버전
 
 import asyncio
 import json
+import math
 import os
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 import aiohttp
 import pandas as pd
 from dotenv import load_dotenv
 from loguru import logger
 
+from crawl_filters import CrawlFilters
+from http_cache import HttpResponseCache
+from price_normalizer import normalize_article_prices
+
 # 환경변수 로드
 load_dotenv('config.env')
 
@@ -33,7 +38,7 @@ logger.add(
 class SimpleNaverRealEstateCrawler:
     """간단한 네이버 부동산 크롤러 (Playwright 없이)"""
     
-    def __init__(self):
+    def __init__(self, filters: Optional[CrawlFilters] = None):
         self.session = None
         self.output_dir = Path(os.getenv('OUTPUT_DIR', './crawled_data'))
         self.output_dir.mkdir(exist_ok=True)
@@ -41,10 +46,34 @@ class SimpleNaverRealEstateCrawler:
         # 크롤링 설정
         self.request_delay = float(os.getenv('REQUEST_DELAY', '2.0'))
         self.timeout = int(os.getenv('TIMEOUT', '30000'))
+
+        # 동시성 설정 (페이지 요청은 전체 단지 합산 기준으로 제한)
+        self.page_concurrency = int(os.getenv('SIMPLE_PAGE_CONCURRENCY', '4'))
+        self.complex_concurrency = int(os.getenv('SIMPLE_COMPLEX_CONCURRENCY', '3'))
+        self.max_pages = int(os.getenv('SIMPLE_MAX_PAGES', '100'))
+        self.page_semaphore: Optional[asyncio.Semaphore] = None
+        self.pages_fetched = 0
+
+        # 크롤링 필터 (거래유형/가격/면적, 매물 목록 API 파라미터로 적용, 명령행에서 요청한 경우만)
+        self.filters = filters or CrawlFilters()
+
+        # 디스크 응답 캐시 (개요는 길게, 매물은 짧게 유지)
+        self.http_cache: Optional[HttpResponseCache] = None
+        if os.getenv('HTTP_CACHE', 'true').lower() == 'true':
+            self.http_cache = HttpResponseCache(
+                Path(os.getenv('HTTP_CACHE_DIR') or self.output_dir / 'http_cache'),
+                ttls={
+                    'overview': float(os.getenv('HTTP_CACHE_TTL_OVERVIEW', '86400')),
+                    'articles': float(os.getenv('HTTP_CACHE_TTL_ARTICLES', '300')),
+                },
+                max_bytes=int(float(os.getenv('HTTP_CACHE_MAX_MB', '200')) * 1024 * 1024),
+                max_stale=float(os.getenv('HTTP_CACHE_MAX_STALE', '86400'))
+            )
         
         logger.info(f"간단한 크롤러 초기화 완료")
         logger.info(f"출력 디렉토리: {self.output_dir}")
         logger.info(f"요청 간격: {self.request_delay}초")
+        logger.info(f"동시 요청: 페이지 {self.page_concurrency}개, 단지 {self.complex_concurrency}개")
 
     async def setup_session(self):
         """HTTP 세션 설정"""
@@ -65,10 +94,20 @@ class SimpleNaverRealEstateCrawler:
             }
             
             timeout = aiohttp.ClientTimeout(total=self.timeout / 1000)
+            # 같은 호스트로 반복 요청하므로 keep-alive 연결 재사용 + DNS 캐시
+            connector = aiohttp.TCPConnector(
+                limit=self.page_concurrency * 2,
+                limit_per_host=self.page_concurrency,
+                ttl_dns_cache=300,
+                keepalive_timeout=30,
+                enable_cleanup_closed=True,
+            )
             self.session = aiohttp.ClientSession(
                 headers=headers,
-                timeout=timeout
+                timeout=timeout,
+                connector=connector
             )
+            self.page_semaphore = asyncio.Semaphore(self.page_concurrency)
             
             logger.info("HTTP 세션 설정 완료")
             
@@ -82,6 +121,38 @@ class SimpleNaverRealEstateCrawler:
             await self.session.close()
             logger.info("HTTP 세션 종료 완료")
 
+    async def _get_json(self, endpoint: str, url: str, params: Dict) -> Tuple[Optional[Any], int]:
+        """GET 요청 (캐시 적용), (JSON 데이터, HTTP 상태) 반환"""
+        entry = None
+        if self.http_cache:
+            entry, fresh = self.http_cache.lookup(endpoint, url, params)
+            if fresh:
+                return entry['data'], 200
+
+        headers = self.http_cache.conditional_headers(entry) if self.http_cache else {}
+        try:
+            async with self.session.get(url, params=params, headers=headers) as response:
+                if response.status == 304 and entry:
+                    return self.http_cache.revalidated(url, params, entry), 200
+                if response.status != 200:
+                    if response.status == 429 or response.status >= 500:
+                        stale = self.http_cache.stale(entry) if self.http_cache else None
+                        if stale is not None:
+                            logger.warning(f"HTTP {response.status} - 만료된 캐시 응답 사용: {url}")
+                            return stale, 200
+                    return None, response.status
+
+                data = await response.json()
+                if self.http_cache:
+                    self.http_cache.store(url, params, data, response.headers)
+                return data, 200
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            stale = self.http_cache.stale(entry) if self.http_cache else None
+            if stale is None:
+                raise
+            logger.warning(f"요청 실패 ({e}) - 만료된 캐시 응답 사용: {url}")
+            return stale, 200
+
     async def get_complex_overview(self, complex_no: str) -> Optional[Dict]:
         """단지 개요 정보 크롤링"""
         try:
@@ -90,14 +161,13 @@ class SimpleNaverRealEstateCrawler:
             url = f"https://new.land.naver.com/api/complexes/overview/{complex_no}"
             params = {"complexNo": complex_no}
             
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"단지 개요 정보 조회 성공: {data.get('complexName', 'Unknown')}")
-                    return data
-                else:
-                    logger.error(f"단지 개요 API 호출 실패: {response.status}")
-                    return None
+            data, status = await self._get_json('overview', url, params)
+            if data is not None:
+                logger.info(f"단지 개요 정보 조회 성공: {data.get('complexName', 'Unknown')}")
+                return data
+            else:
+                logger.error(f"단지 개요 API 호출 실패: {status}")
+                return None
                     
         except Exception as e:
             logger.error(f"단지 개요 크롤링 실패: {e}")
@@ -136,21 +206,82 @@ class SimpleNaverRealEstateCrawler:
                 'type': 'list',
                 'order': 'rank'
             }
+            params.update(self.filters.api_params())
             
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    article_count = len(data.get('articleList', []))
-                    logger.info(f"매물 목록 API 호출 성공: {article_count}개 매물")
-                    return data
-                else:
-                    logger.error(f"매물 목록 API 호출 실패: {response.status}")
-                    return None
+            async with self.page_semaphore:
+                data, status = await self._get_json('articles', url, params)
+            if data is not None:
+                self.pages_fetched += 1
+                article_count = len(data.get('articleList', []))
+                logger.info(f"매물 목록 API 호출 성공: {article_count}개 매물")
+                return data
+            else:
+                logger.error(f"매물 목록 API 호출 실패: {status}")
+                return None
                     
         except Exception as e:
             logger.error(f"매물 목록 크롤링 실패: {e}")
             return None
 
+    async def get_all_complex_articles(self, complex_no: str) -> Optional[Dict]:
+        """단지 매물 목록 전체 페이지 크롤링 (페이지는 동시 요청, 매물번호 기준 중복 제거)"""
+        first = await self.get_complex_articles(complex_no, 1)
+        if not first:
+            return None
+
+        pages = [first]
+        failed_pages = []
+        page_size = len(first.get('articleList', []))
+        total_count = first.get('totalCount')
+
+        if first.get('isMoreData') and page_size:
+            if total_count:
+                # 전체 매물 수를 알면 남은 페이지를 한 번에 요청
+                last_page = min(math.ceil(total_count / page_size), self.max_pages)
+                page_nums = list(range(2, last_page + 1))
+                responses = await asyncio.gather(*[self.get_complex_articles(complex_no, p) for p in page_nums])
+                for page_num, data in zip(page_nums, responses):
+                    if data:
+                        pages.append(data)
+                    else:
+                        failed_pages.append(page_num)
+            else:
+                # 전체 수를 모르면 동시 요청 수만큼씩 묶어서 isMoreData가 끝날 때까지 요청
+                page_num = 2
+                more = True
+                while more and page_num <= self.max_pages:
+                    page_nums = list(range(page_num, min(page_num + self.page_concurrency, self.max_pages + 1)))
+                    responses = await asyncio.gather(*[self.get_complex_articles(complex_no, p) for p in page_nums])
+                    for p, data in zip(page_nums, responses):
+                        if not data:
+                            failed_pages.append(p)
+                            continue
+                        pages.append(data)
+                        if not data.get('isMoreData') or not data.get('articleList'):
+                            more = False
+                    page_num = page_nums[-1] + 1
+
+        article_list = []
+        seen = set()
+        for data in pages:
+            for article in data.get('articleList', []):
+                article_no = article.get('articleNo')
+                if article_no and article_no in seen:
+                    continue
+                seen.add(article_no)
+                article_list.append(article)
+
+        if failed_pages:
+            logger.warning(f"단지 {complex_no}: {len(failed_pages)}개 페이지 수집 실패 {failed_pages}")
+
+        result = dict(first)
+        result['articleList'] = article_list
+        result['isMoreData'] = False
+        result['pageCount'] = len(pages)
+        if failed_pages:
+            result['failedPages'] = failed_pages
+        return result
+
     async def crawl_complex_data(self, complex_no: str) -> Dict:
         """단지 전체 데이터 크롤링"""
         logger.info(f"\n{'='*60}")
@@ -164,6 +295,8 @@ class SimpleNaverRealEstateCrawler:
                 'crawler_version': 'simple-1.0.0'
             }
         }
+        if self.filters.active:
+            complex_data['crawling_info']['filters'] = self.filters.describe()
         
         try:
             # 1. 단지 개요 정보
@@ -177,12 +310,13 @@ class SimpleNaverRealEstateCrawler:
             # 요청 간격 조절
             await asyncio.sleep(self.request_delay)
             
-            # 2. 매물 목록
-            articles = await self.get_complex_articles(complex_no, 1)
+            # 2. 매물 목록 (전체 페이지)
+            articles = await self.get_all_complex_articles(complex_no)
             if articles:
+                normalize_article_prices(articles.get('articleList', []))
                 complex_data['articles'] = articles
                 article_count = len(articles.get('articleList', []))
-                logger.info(f"매물 수: {article_count}개")
+                logger.info(f"매물 수: {article_count}개 ({articles['pageCount']}페이지)")
             
             logger.info(f"단지 {complex_no} 크롤링 완료")
             
@@ -192,30 +326,39 @@ class SimpleNaverRealEstateCrawler:
         
         return complex_data
 
-    async def crawl_multiple_complexes(self, complex_numbers: List[str]) -> List[Dict]:
-        """여러 단지 크롤링"""
-        results = []
-        
-        for i, complex_no in enumerate(complex_numbers, 1):
-            logger.info(f"\n진행률: {i}/{len(complex_numbers)}")
-            
-            try:
-                complex_data = await self.crawl_complex_data(complex_no)
-                results.append(complex_data)
-                
-                # 단지 간 요청 간격 조절
-                if i < len(complex_numbers):
-                    await asyncio.sleep(self.request_delay * 2)
-                    
-            except Exception as e:
-                logger.error(f"단지 {complex_no} 크롤링 실패: {e}")
-                results.append({
-                    'complex_no': complex_no,
-                    'error': str(e),
-                    'crawling_date': datetime.now().isoformat()
-                })
-        
-        return results
+    async def crawl_multiple_complexes(self, complex_numbers: List[str],
+                                       deadline: Optional[float] = None) -> List[Dict]:
+        """여러 단지 동시 크롤링 (SIMPLE_COMPLEX_CONCURRENCY개씩, 결과는 입력 순서 유지)
+        deadline(epoch 초)이 지나면 아직 시작하지 않은 단지는 deferred 결과로 반환"""
+        semaphore = asyncio.Semaphore(self.complex_concurrency)
+        total = len(complex_numbers)
+        done = 0
+
+        async def crawl_one(complex_no: str) -> Dict:
+            nonlocal done
+            async with semaphore:
+                if deadline is not None and time.time() >= deadline:
+                    logger.warning(f"단지 {complex_no}: 시간 예산 초과 - 다음 실행으로 연기")
+                    return {
+                        'complex_no': complex_no,
+                        'error': '시간 예산 초과 - 다음 실행으로 연기',
+                        'deferred': True,
+                        'crawling_date': datetime.now().isoformat()
+                    }
+                try:
+                    return await self.crawl_complex_data(complex_no)
+                except Exception as e:
+                    logger.error(f"단지 {complex_no} 크롤링 실패: {e}")
+                    return {
+                        'complex_no': complex_no,
+                        'error': str(e),
+                        'crawling_date': datetime.now().isoformat()
+                    }
+                finally:
+                    done += 1
+                    logger.info(f"\n진행률: {done}/{total}")
+
+        return await asyncio.gather(*[crawl_one(no) for no in complex_numbers])
 
     def save_data(self, data: Any, filename_prefix: str = "simple_complex"):
         """데이터 저장"""
@@ -260,6 +403,8 @@ class SimpleNaverRealEstateCrawler:
 
     async def run_crawling(self, complex_numbers: List[str]):
         """크롤링 실행"""
+        start = time.time()
+        self.pages_fetched = 0
         try:
             # HTTP 세션 설정
             await self.setup_session()
@@ -283,6 +428,12 @@ class SimpleNaverRealEstateCrawler:
             success_count = len([r for r in results if 'overview' in r])
             error_count = len([r for r in results if 'error' in r])
             logger.info(f"성공: {success_count}개, 실패: {error_count}개")
+
+            elapsed = time.time() - start
+            pages_per_sec = self.pages_fetched / elapsed if elapsed > 0 else 0.0
+            logger.info(f"총 소요시간: {elapsed:.1f}초, 매물 페이지 {self.pages_fetched}개 ({pages_per_sec:.2f} pages/s)")
+            if self.http_cache:
+                self.http_cache.log_stats()
             
             return results
             
@@ -297,17 +448,20 @@ async def main():
     """메인 함수"""
     import sys
     
+    # 명령행 인자 처리 (필터 옵션 분리)
+    filters, args = CrawlFilters.from_args(sys.argv[1:])
+
     # 크롤러 인스턴스 생성
-    crawler = SimpleNaverRealEstateCrawler()
-    
-    # 명령행 인자 처리
-    if len(sys.argv) > 1 and sys.argv[1] not in ['--help', '-h']:
-        complex_numbers = sys.argv[1].split(',')
+    crawler = SimpleNaverRealEstateCrawler(filters=filters)
+
+    if len(args) > 0 and args[0] not in ['--help', '-h']:
+        complex_numbers = args[0].split(',')
         complex_numbers = [num.strip() for num in complex_numbers if num.strip()]
-    elif len(sys.argv) > 1 and sys.argv[1] in ['--help', '-h']:
-        print("사용법: python simple_crawler.py [단지번호]")
+    elif len(args) > 0 and args[0] in ['--help', '-h']:
+        print("사용법: python simple_crawler.py [단지번호] [--trade-types=A1,B1] [--price-min=만원] [--price-max=만원] [--area-min=㎡] [--area-max=㎡]")
         print("예시: python simple_crawler.py 22065")
         print("예시: python simple_crawler.py 22065,12345,67890")
+        print("예시: python simple_crawler.py 22065 --trade-types=매매 --price-max=90000")
         return
     else:
         # 기본값: 동탄시범다은마을월드메르디앙반도유보라
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+단지 좌표 공간 인덱스
+크롤링된 단지 개요의 위도/경도를 균일 격자(grid)로 색인하여
+k-최근접 / 반경 내 단지 조회를 전체 스캔 없이 처리한다.
+
+- 격자 셀 크기 기본 0.01° (위도 방향 약 1.1km)
+- 디스크에는 단지 좌표만 JSON으로 저장하고, 격자는 로드 시 재구성
+- 크롤링이 끝날 때마다 결과의 단지만 증분 갱신
+
+사용법:
+    python spatial_index.py rebuild                 # 저장된 크롤링 결과 전체로 재구성
+    python spatial_index.py nearest <단지번호|위도,경도> [k]
+    python spatial_index.py radius <위도,경도> <반경km>
+"""
+
+import json
+import math
+import os
+import sys
+from collections import defaultdict
+from datetime import datetime
+from heapq import nsmallest
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = 111.32
+INDEX_VERSION = 1
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """두 좌표 간 대원 거리 (km)"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lng2 - lng1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def _to_float(value) -> Optional[float]:
+    try:
+        result = float(value)
+    except (TypeError, ValueError):
+        return None
+    return result if math.isfinite(result) and result != 0 else None
+
+
+class ComplexSpatialIndex:
+    """격자 기반 단지 공간 인덱스"""
+
+    def __init__(self, cell_size: float = 0.01):
+        self.cell_size = cell_size
+        self.complexes: Dict[str, Dict] = {}
+        self.cells: Dict[Tuple[int, int], set] = defaultdict(set)
+        # 링 탐색 종료용 셀 범위 (min_i, min_j, max_i, max_j), 삭제 시에는 줄이지 않음
+        self.bounds: Optional[Tuple[int, int, int, int]] = None
+        self.dirty = False
+
+    def __len__(self) -> int:
+        return len(self.complexes)
+
+    def _cell(self, lat: float, lng: float) -> Tuple[int, int]:
+        return (math.floor(lat / self.cell_size), math.floor(lng / self.cell_size))
+
+    def _add_to_cell(self, complex_no: str, lat: float, lng: float):
+        i, j = self._cell(lat, lng)
+        self.cells[(i, j)].add(complex_no)
+        if self.bounds is None:
+            self.bounds = (i, j, i, j)
+        else:
+            min_i, min_j, max_i, max_j = self.bounds
+            self.bounds = (min(min_i, i), min(min_j, j), max(max_i, i), max(max_j, j))
+
+    def upsert(self, complex_no: str, lat, lng, name: Optional[str] = None) -> bool:
+        """단지 좌표 추가/갱신 (변경되었으면 True)"""
+        lat, lng = _to_float(lat), _to_float(lng)
+        if lat is None or lng is None:
+            return False
+
+        complex_no = str(complex_no)
+        existing = self.complexes.get(complex_no)
+        if existing and existing['lat'] == lat and existing['lng'] == lng and (not name or existing.get('name') == name):
+            return False
+
+        if existing:
+            self.cells[self._cell(existing['lat'], existing['lng'])].discard(complex_no)
+
+        self.complexes[complex_no] = {
+            'lat': lat,
+            'lng': lng,
+            'name': name or (existing or {}).get('name', ''),
+            'updated_at': datetime.now().isoformat(timespec='seconds'),
+        }
+        self._add_to_cell(complex_no, lat, lng)
+        self.dirty = True
+        return True
+
+    def remove(self, complex_no: str) -> bool:
+        existing = self.complexes.pop(str(complex_no), None)
+        if not existing:
+            return False
+        self.cells[self._cell(existing['lat'], existing['lng'])].discard(str(complex_no))
+        self.dirty = True
+        return True
+
+    def _ring(self, center: Tuple[int, int], r: int) -> Iterable[Tuple[int, int]]:
+        """중심 셀에서 체비쇼프 거리 r인 셀들"""
+        ci, cj = center
+        if r == 0:
+            yield center
+            return
+        for dj in range(-r, r + 1):
+            yield (ci - r, cj + dj)
+            yield (ci + r, cj + dj)
+        for di in range(-r + 1, r):
+            yield (ci + di, cj - r)
+            yield (ci + di, cj + r)
+
+    def _result(self, complex_no: str, distance: float) -> Dict:
+        info = self.complexes[complex_no]
+        return {
+            'complexNo': complex_no,
+            'complexName': info.get('name', ''),
+            'latitude': info['lat'],
+            'longitude': info['lng'],
+            'distanceKm': round(distance, 3),
+        }
+
+    def nearest(self, lat: float, lng: float, k: int = 5, max_radius_km: Optional[float] = None,
+                exclude: Optional[str] = None) -> List[Dict]:
+        """좌표 기준 가까운 단지 k개 (거리순)"""
+        if not self.complexes or k <= 0:
+            return []
+
+        center = self._cell(lat, lng)
+        # 링 r+1 안의 점은 최소 r칸 이상 떨어져 있으므로 이 값으로 탐색 종료를 판단
+        cell_km = self.cell_size * KM_PER_DEGREE_LAT * min(1.0, max(0.01, math.cos(math.radians(lat))))
+        min_i, min_j, max_i, max_j = self.bounds
+        max_ring = max(abs(min_i - center[0]), abs(max_i - center[0]),
+                       abs(min_j - center[1]), abs(max_j - center[1]))
+
+        candidates: List[Tuple[float, str]] = []
+        for r in range(max_ring + 1):
+            for cell in self._ring(center, r):
+                for complex_no in self.cells.get(cell, ()):
+                    if complex_no == exclude:
+                        continue
+                    info = self.complexes[complex_no]
+                    candidates.append((haversine_km(lat, lng, info['lat'], info['lng']), complex_no))
+
+            ring_min_km = r * cell_km
+            if max_radius_km is not None and ring_min_km > max_radius_km:
+                break
+            if len(candidates) >= k and nsmallest(k, candidates)[-1][0] <= ring_min_km:
+                break
+
+        if max_radius_km is not None:
+            candidates = [c for c in candidates if c[0] <= max_radius_km]
+        return [self._result(no, dist) for dist, no in nsmallest(k, candidates)]
+
+    def within_radius(self, lat: float, lng: float, radius_km: float) -> List[Dict]:
+        """좌표 기준 반경 내 단지 (거리순)"""
+        if not self.complexes:
+            return []
+
+        lat_span = radius_km / KM_PER_DEGREE_LAT
+        lng_span = radius_km / (KM_PER_DEGREE_LAT * max(0.01, math.cos(math.radians(lat))))
+        i0, j0 = self._cell(lat - lat_span, lng - lng_span)
+        i1, j1 = self._cell(lat + lat_span, lng + lng_span)
+
+        matches = []
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                for complex_no in self.cells.get((i, j), ()):
+                    info = self.complexes[complex_no]
+                    distance = haversine_km(lat, lng, info['lat'], info['lng'])
+                    if distance <= radius_km:
+                        matches.append((distance, complex_no))
+
+        return [self._result(no, dist) for dist, no in sorted(matches)]
+
+    def nearest_to_complex(self, complex_no: str, k: int = 5) -> List[Dict]:
+        info = self.complexes.get(str(complex_no))
+        if not info:
+            return []
+        return self.nearest(info['lat'], info['lng'], k=k, exclude=str(complex_no))
+
+    def update_from_results(self, results: List[Dict]) -> int:
+        """크롤링 결과(단지 개요)로 증분 갱신, 변경된 단지 수 반환"""
+        changed = 0
+        for item in results:
+            overview = item.get('overview') or {}
+            complex_no = overview.get('complexNo') or item.get('crawling_info', {}).get('complex_no')
+            if not complex_no:
+                continue
+            if self.upsert(complex_no, overview.get('latitude'), overview.get('longitude'),
+                           overview.get('complexName')):
+                changed += 1
+        return changed
+
+    def save(self, path: Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            'version': INDEX_VERSION,
+            'cell_size': self.cell_size,
+            'complexes': self.complexes,
+        }
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: Path) -> 'ComplexSpatialIndex':
+        path = Path(path)
+        if not path.exists():
+            return cls()
+
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        index = cls(cell_size=data.get('cell_size', 0.01))
+        for complex_no, info in data.get('complexes', {}).items():
+            index.complexes[complex_no] = info
+            index._add_to_cell(complex_no, info['lat'], info['lng'])
+        return index
+
+
+def default_index_path() -> Path:
+    return Path(os.getenv('OUTPUT_DIR', './crawled_data')) / 'complex_spatial_index.json'
+
+
+def update_spatial_index(results: List[Dict], path: Optional[Path] = None) -> int:
+    """크롤링 결과로 디스크의 공간 인덱스를 증분 갱신"""
+    path = Path(path) if path else default_index_path()
+    index = ComplexSpatialIndex.load(path)
+    changed = index.update_from_results(results)
+    if index.dirty:
+        index.save(path)
+    return changed
+
+
+def rebuild_from_crawl_files(output_dir: Path, path: Optional[Path] = None) -> ComplexSpatialIndex:
+    """저장된 크롤링 결과 파일 전체로 인덱스 재구성 (오래된 파일부터 적용)"""
+    index = ComplexSpatialIndex()
+    files = sorted(Path(output_dir).glob('complexes_*.json'), key=lambda p: p.stat().st_mtime)
+    for file in files:
+        try:
+            with open(file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, list):
+                index.update_from_results(data)
+        except Exception as e:
+            print(f"[WARNING] 크롤링 결과 읽기 실패 ({file.name}): {e}")
+    index.save(Path(path) if path else default_index_path())
+    return index
+
+
+def _parse_point(text: str) -> Tuple[float, float]:
+    lat, lng = text.split(',')
+    return float(lat), float(lng)
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] in ['--help', '-h']:
+        print(__doc__)
+        return
+
+    command = sys.argv[1]
+    path = default_index_path()
+
+    if command == 'rebuild':
+        index = rebuild_from_crawl_files(path.parent, path)
+        print(f"✅ 공간 인덱스 재구성 완료: {len(index)}개 단지 → {path}")
+        return
+
+    index = ComplexSpatialIndex.load(path)
+    if command == 'nearest' and len(sys.argv) > 2:
+        k = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+        if ',' in sys.argv[2]:
+            results = index.nearest(*_parse_point(sys.argv[2]), k=k)
+        else:
+            results = index.nearest_to_complex(sys.argv[2], k=k)
+    elif command == 'radius' and len(sys.argv) > 3:
+        results = index.within_radius(*_parse_point(sys.argv[2]), float(sys.argv[3]))
+    else:
+        print(__doc__)
+        sys.exit(1)
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
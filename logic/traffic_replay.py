@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤링 네트워크 트래픽 녹화/재생
+실제 크롤링 트래픽을 한 번 녹화해두고, 이후에는 오프라인으로 재생하여
+스크롤 루프/대기/파싱 최적화를 반복 가능한 조건에서 프로파일링하기 위한 모듈
+
+녹화 디렉토리 구조:
+    <dir>/index.jsonl        요청 1건당 1줄 (method, url, status, headers, body, elapsed)
+    <dir>/bodies/<sha1>      응답 본문 (내용 해시 기준 중복 제거)
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+# 본문을 디코딩된 상태로 저장하므로 재생 시 제거해야 하는 헤더
+_STRIPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding'}
+
+
+def _strip_query(url: str) -> str:
+    """쿼리스트링을 제외한 URL (느슨한 매칭용)"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+
+class TrafficRecorder:
+    """route_handler를 통과하는 요청/응답을 픽스처 디렉토리에 기록"""
+
+    def __init__(self, record_dir: Path):
+        self.record_dir = Path(record_dir)
+        self.bodies_dir = self.record_dir / 'bodies'
+        self.bodies_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.record_dir / 'index.jsonl'
+        self.recorded_count = 0
+
+    async def handle(self, route, url: Optional[str] = None):
+        """실제 네트워크로 요청을 보내고 응답을 기록한 뒤 그대로 전달 (url: 파라미터를 바꿔 보낼 URL)"""
+        request = route.request
+        start = time.time()
+        response = await route.fetch(url=url)
+        body = await response.body()
+        elapsed = time.time() - start
+
+        body_hash = hashlib.sha1(body).hexdigest()
+        body_path = self.bodies_dir / body_hash
+        if not body_path.exists():
+            body_path.write_bytes(body)
+
+        entry = {
+            'method': request.method,
+            'url': url or request.url,
+            'resource_type': request.resource_type,
+            'status': response.status,
+            'headers': {
+                k: v for k, v in response.headers.items() if k.lower() not in _STRIPPED_HEADERS
+            },
+            'body': body_hash,
+            'elapsed': round(elapsed, 4),
+            'recorded_at': start,
+        }
+        # 크롤러가 중간에 죽어도 녹화분이 남도록 요청마다 append
+        with open(self.index_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self.recorded_count += 1
+
+        await route.fulfill(response=response, body=body)
+
+
+class TrafficReplayer:
+    """녹화된 픽스처로 요청을 fulfill (네트워크 접근 없음)"""
+
+    def __init__(self, replay_dir: Path, latency_scale: float = 1.0):
+        self.replay_dir = Path(replay_dir)
+        self.bodies_dir = self.replay_dir / 'bodies'
+        # 녹화 당시 응답 시간에 곱하는 배율 (0: 지연 없음, 0.5: 빠른 네트워크, 2.0: 느린 네트워크)
+        self.latency_scale = max(0.0, latency_scale)
+        self.exact: Dict[tuple, List[dict]] = defaultdict(list)
+        self.loose: Dict[tuple, List[dict]] = defaultdict(list)
+        # 테이블별 재생 위치 (쿼리 없는 URL은 두 테이블의 키가 같으므로 공유하면 서로 위치를 건너뜀)
+        self._exact_cursor: Dict[tuple, int] = defaultdict(int)
+        self._loose_cursor: Dict[tuple, int] = defaultdict(int)
+        self.hit_count = 0
+        self.miss_count = 0
+        self._load_index()
+
+    def _load_index(self):
+        index_file = self.replay_dir / 'index.jsonl'
+        if not index_file.exists():
+            raise FileNotFoundError(f"녹화 인덱스가 없습니다: {index_file}")
+
+        with open(index_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                self.exact[(entry['method'], entry['url'])].append(entry)
+                self.loose[(entry['method'], _strip_query(entry['url']))].append(entry)
+
+    @property
+    def entry_count(self) -> int:
+        return sum(len(entries) for entries in self.exact.values())
+
+    @staticmethod
+    def _next_entry(key: tuple, table: Dict[tuple, List[dict]], cursors: Dict[tuple, int]) -> Optional[dict]:
+        """같은 요청이 여러 번 녹화된 경우 녹화 순서대로 반환 (소진되면 마지막 응답 반복)"""
+        entries = table.get(key)
+        if not entries:
+            return None
+        cursor = cursors[key]
+        cursors[key] = cursor + 1
+        return entries[min(cursor, len(entries) - 1)]
+
+    def find(self, method: str, url: str) -> Optional[dict]:
+        entry = self._next_entry((method, url), self.exact, self._exact_cursor)
+        if entry is None:
+            # 타임스탬프 등 쿼리만 다른 요청은 경로 기준으로 매칭
+            entry = self._next_entry((method, _strip_query(url)), self.loose, self._loose_cursor)
+        return entry
+
+    async def handle(self, route, url: Optional[str] = None):
+        """녹화된 응답으로 fulfill, 녹화에 없는 요청은 오프라인 에러로 중단 (url: 파라미터를 바꾼 요청 URL)"""
+        request = route.request
+        entry = self.find(request.method, url or request.url)
+        if entry is None:
+            self.miss_count += 1
+            await route.abort('internetdisconnected')
+            return
+
+        self.hit_count += 1
+        if self.latency_scale > 0 and entry.get('elapsed'):
+            await asyncio.sleep(entry['elapsed'] * self.latency_scale)
+
+        body = (self.bodies_dir / entry['body']).read_bytes()
+        await route.fulfill(status=entry['status'], headers=entry['headers'], body=body)
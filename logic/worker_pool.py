@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤링 워커 프로세스 풀 (CRAWLER_EXECUTION_MODE=subprocess)
+스케줄러 프로세스 대신 별도 워커 프로세스(crawl_worker.py)에서 Chromium을 실행해
+브라우저 메모리 누수나 크래시가 스케줄러를 멈추지 않도록 한다.
+
+프로토콜: stdin/stdout 한 줄 JSON (워커의 print 로그는 stderr로 전달됨)
+    → {"type": "crawl", "id": ..., "complex_numbers": [...]}
+    ← {"type": "ready", "pid": ...}
+    ← {"type": "progress", "id": ..., "status": {...update_status 내용}}
+    ← {"type": "result", "id": ..., "results": [요약...], "output_file": ...}
+    ← {"type": "error", "id": ..., "error": ...}
+
+워커 재시작: 비정상 종료, 작업 시간 초과(WORKER_JOB_TIMEOUT), 작업 취소,
+           프로세스 트리 RSS가 WORKER_MAX_RSS_MB 초과 (작업 중 WORKER_RSS_SAMPLE_SECONDS초마다 / 작업 후 확인)
+"""
+
+import asyncio
+import itertools
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from loguru import logger
+
+from proc_utils import process_tree_rss_mb
+
+WORKER_SCRIPT = Path(__file__).resolve().parent / 'crawl_worker.py'
+
+
+def summarize_results(results: List[Dict]) -> List[Dict]:
+    """크롤링 결과 → 단지별 요약 (단지번호, 매물 수, 오류)"""
+    summary = []
+    for item in results or []:
+        complex_no = item.get('crawling_info', {}).get('complex_no') or item.get('complex_no')
+        entry = {
+            'complex_no': complex_no,
+            'article_count': len(item.get('articles', {}).get('articleList', [])),
+        }
+        if 'error' in item:
+            entry['error'] = item['error']
+        summary.append(entry)
+    return summary
+
+
+class WorkerError(Exception):
+    """워커 프로세스 작업 실패"""
+
+
+class WorkerProcess:
+    """crawl_worker.py 서브프로세스 1개"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.jobs_done = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+
+    async def start(self):
+        self.process = None
+        self.jobs_done = 0
+        try:
+            self.process = await asyncio.create_subprocess_exec(
+                sys.executable, '-u', str(WORKER_SCRIPT),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=None,  # 크롤러 로그는 그대로 스케줄러 stderr로 출력
+                limit=16 * 1024 * 1024,
+            )
+            message = await self._read_message(timeout=60)
+            if not message or message.get('type') != 'ready':
+                raise WorkerError(f"{self.name} 시작 실패: {message}")
+        except BaseException:
+            # 준비 신호 없이 떠 있는 프로세스가 alive로 남아 작업을 받지 않도록 정리
+            if self.alive:
+                self.kill()
+                await self.process.wait()
+            self.process = None
+            raise
+        logger.info(f"[{self.name}] 워커 시작 (pid {self.process.pid})")
+
+    async def _read_message(self, timeout: Optional[float] = None) -> Optional[Dict]:
+        while True:
+            line = await asyncio.wait_for(self.process.stdout.readline(), timeout=timeout)
+            if not line:
+                return None  # 워커 종료 (EOF)
+            try:
+                return json.loads(line)
+            except ValueError:
+                logger.warning(f"[{self.name}] 알 수 없는 출력 무시: {line[:200]!r}")
+
+    async def run(self, job_id: str, complex_numbers: List[str], timeout: float,
+                  on_progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+        request = {'type': 'crawl', 'id': job_id, 'complex_numbers': complex_numbers}
+        self.process.stdin.write((json.dumps(request, ensure_ascii=False) + '\n').encode('utf-8'))
+        await self.process.stdin.drain()
+
+        deadline = asyncio.get_running_loop().time() + timeout
+        while True:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                raise asyncio.TimeoutError()
+            message = await self._read_message(timeout=remaining)
+            if message is None:
+                raise WorkerError(f"{self.name} 비정상 종료 (exit {await self.process.wait()})")
+            if message.get('id') != job_id:
+                continue
+            if message['type'] == 'progress':
+                if on_progress:
+                    on_progress(message['status'])
+            elif message['type'] == 'result':
+                self.jobs_done += 1
+                return message
+            elif message['type'] == 'error':
+                self.jobs_done += 1
+                raise WorkerError(message.get('error', 'unknown error'))
+
+    def rss_mb(self) -> float:
+        return process_tree_rss_mb(self.process.pid) if self.alive else 0.0
+
+    async def stop(self, timeout: float = 30):
+        """정상 종료 요청 (stdin EOF), 시간 내 종료되지 않으면 강제 종료"""
+        if not self.alive:
+            return
+        try:
+            self.process.stdin.close()
+            await asyncio.wait_for(self.process.wait(), timeout=timeout)
+        except (asyncio.TimeoutError, Exception):
+            self.kill()
+            await self.process.wait()
+
+    def kill(self):
+        if self.alive:
+            # 워커가 띄운 Chromium까지 함께 정리되도록 자식 프로세스도 종료
+            from proc_utils import descendant_pids
+            for pid in reversed(descendant_pids(self.process.pid)):
+                try:
+                    os.kill(pid, 9)
+                except ProcessLookupError:
+                    pass
+
+
+class CrawlWorkerPool:
+    """고정 크기 워커 프로세스 풀"""
+
+    def __init__(self, size: int):
+        self.size = max(1, size)
+        self.max_rss_mb = float(os.getenv('WORKER_MAX_RSS_MB', '2000'))
+        self.job_timeout = float(os.getenv('WORKER_JOB_TIMEOUT', '3600'))
+        self.rss_sample_seconds = float(os.getenv('WORKER_RSS_SAMPLE_SECONDS', '10'))
+        self.idle: Optional[asyncio.Queue] = None
+        self.workers: List[WorkerProcess] = []
+        self.job_ids = itertools.count(1)
+
+    async def _ensure_started(self):
+        if self.idle is not None:
+            return
+        self.idle = asyncio.Queue()
+        for i in range(self.size):
+            worker = WorkerProcess(f"worker-{i + 1}")
+            self.workers.append(worker)
+            await self.idle.put(worker)  # 실제 프로세스는 첫 작업 때 시작
+
+    def _over_memory(self, worker: WorkerProcess) -> Optional[str]:
+        rss_mb = worker.rss_mb()
+        if self.max_rss_mb > 0 and rss_mb > self.max_rss_mb:
+            return f"메모리 {rss_mb:.0f}MB > {self.max_rss_mb:.0f}MB"
+        return None
+
+    async def _run_job(self, worker: WorkerProcess, job_id: str, complex_numbers: List[str],
+                       on_progress: Optional[Callable[[Dict], None]]) -> Dict:
+        """작업 실행 중 메모리를 주기적으로 확인, 상한 초과 시 워커를 종료하고 WorkerError"""
+        job = asyncio.ensure_future(worker.run(job_id, complex_numbers, self.job_timeout, on_progress))
+        try:
+            while True:
+                done, _ = await asyncio.wait([job], timeout=self.rss_sample_seconds)
+                if job in done:
+                    return job.result()
+                over = self._over_memory(worker)
+                if over:
+                    worker.kill()
+                    await worker.process.wait()
+                    raise WorkerError(f"{worker.name} {over} (작업 중단)")
+        finally:
+            if not job.done():
+                job.cancel()
+                try:
+                    await job
+                except (asyncio.CancelledError, Exception):
+                    pass
+
+    async def run(self, complex_numbers: List[str],
+                  on_progress: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+        """워커에서 크롤링 실행, 단지별 요약 목록 반환"""
+        await self._ensure_started()
+        worker = await self.idle.get()
+        restart_reason = None
+        try:
+            if not worker.alive:
+                await worker.start()
+
+            job_id = f"job-{next(self.job_ids)}"
+            message = await self._run_job(worker, job_id, complex_numbers, on_progress)
+
+            restart_reason = self._over_memory(worker)
+            return message.get('results', [])
+
+        except asyncio.TimeoutError:
+            restart_reason = f"작업 시간 초과 ({self.job_timeout:.0f}초)"
+            raise WorkerError(f"{worker.name} {restart_reason}")
+        except WorkerError as e:
+            if not worker.alive:
+                restart_reason = str(e)
+            raise
+        except asyncio.CancelledError:
+            # 작업 중인 워커를 그대로 돌려놓으면 다음 작업이 이전 작업 출력과 섞이므로 종료 후 재시작
+            restart_reason = "작업 취소"
+            raise
+        finally:
+            if restart_reason:
+                logger.warning(f"[{worker.name}] 워커 재시작: {restart_reason}")
+                worker.kill()
+                if worker.process:
+                    await worker.process.wait()
+            await self.idle.put(worker)
+
+    async def close_all(self):
+        await asyncio.gather(*[worker.stop() for worker in self.workers], return_exceptions=True)
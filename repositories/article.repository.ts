@@ -78,6 +78,24 @@ export class ArticleRepository extends BaseRepository<Article> {
     });
   }
 
+  /**
+   * 단지 매물 중 지정한 매물번호를 제외하고 삭제 (증분 크롤링에서 이어받은 매물 유지)
+   */
+  async deleteByComplexIdExcept(complexId: string, keepArticleNos: string[]) {
+    return this.prisma.article.deleteMany({
+      where: { complexId, articleNo: { notIn: keepArticleNos } },
+    });
+  }
+
+  /**
+   * 단지 매물 중 지정한 매물번호만 삭제 (필터 크롤링에서 수집된 매물만 교체)
+   */
+  async deleteByComplexIdAndArticleNos(complexId: string, articleNos: string[]) {
+    return this.prisma.article.deleteMany({
+      where: { complexId, articleNo: { in: articleNos } },
+    });
+  }
+
   /**
    * 매물 일괄 생성 (중복 스킵)
    */
@@ -0,0 +1,57 @@
+#!/bin/bash
+
+# 크롤러 핫패스 마이크로벤치마크 실행 스크립트
+# 사용법:
+#   ./scripts/run-benchmarks.sh save      # 현재 결과를 기준선(baseline)으로 저장
+#   ./scripts/run-benchmarks.sh compare   # 기준선 대비 비교 (평균 15% 이상 느려지면 실패)
+#   ./scripts/run-benchmarks.sh           # 비교 없이 실행만
+
+set -e
+
+CYAN='\033[0;36m'
+GREEN='\033[0;32m'
+RED='\033[0;31m'
+NC='\033[0m' # No Color
+
+cd "$(dirname "$0")/.."
+
+STORAGE="file://tests/benchmarks/.baseline"
+THRESHOLD="${BENCHMARK_FAIL_THRESHOLD:-mean:15%}"
+MODE="${1:-run}"
+
+COMMON_ARGS=(
+    tests/benchmarks
+    -m slow
+    --benchmark-only
+    --benchmark-storage="$STORAGE"
+    --benchmark-columns=min,mean,max,rounds
+    --benchmark-sort=name
+)
+
+echo -e "${CYAN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━${NC}"
+echo -e "${CYAN}  크롤러 벤치마크 (${MODE})${NC}"
+echo -e "${CYAN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━${NC}"
+
+case "$MODE" in
+    save)
+        python -m pytest "${COMMON_ARGS[@]}" --benchmark-save=baseline
+        echo -e "${GREEN}✅ 기준선 저장 완료: tests/benchmarks/.baseline${NC}"
+        ;;
+    compare)
+        if ! ls tests/benchmarks/.baseline/*/*_baseline.json >/dev/null 2>&1; then
+            echo -e "${RED}❌ 기준선이 없습니다. 먼저 '$0 save'를 실행하세요.${NC}"
+            exit 1
+        fi
+        python -m pytest "${COMMON_ARGS[@]}" \
+            --benchmark-compare \
+            --benchmark-compare-fail="$THRESHOLD"
+        echo -e "${GREEN}✅ 기준선 대비 회귀 없음 (임계값: ${THRESHOLD})${NC}"
+        ;;
+    run)
+        python -m pytest "${COMMON_ARGS[@]}"
+        ;;
+    *)
+        echo "사용법: $0 [save|compare]"
+        exit 1
+        ;;
+esac
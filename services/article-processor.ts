@@ -6,7 +6,7 @@
  * - 매물 변경 감지 (신규/삭제/가격변경)
  */
 
-import { parsePriceToWonBigInt } from '@/lib/price-utils';
+import { resolvePriceWonBigInt } from '@/lib/price-utils';
 import { createLogger } from '@/lib/logger';
 
 const logger = createLogger('ARTICLE_PROCESSOR');
@@ -78,10 +78,13 @@ export function prepareArticleCreateData(
           tradeTypeName: article.tradeTypeName,
           dealOrWarrantPrc: article.dealOrWarrantPrc,
           rentPrc: article.rentPrc || null,
-          // 숫자 가격 컬럼 (성능 최적화용)
-          dealOrWarrantPrcWon: parsePriceToWonBigInt(article.dealOrWarrantPrc),
+          // 숫자 가격 컬럼 (성능 최적화용, 크롤러가 계산한 값 우선)
+          dealOrWarrantPrcWon: resolvePriceWonBigInt(
+            article.dealOrWarrantPrcWon,
+            article.dealOrWarrantPrc
+          ),
           rentPrcWon: article.rentPrc
-            ? parsePriceToWonBigInt(article.rentPrc)
+            ? resolvePriceWonBigInt(article.rentPrcWon, article.rentPrc)
             : null,
           area1: parseFloat(article.area1) || 0,
           area2: article.area2 ? parseFloat(article.area2) : null,
@@ -114,6 +117,65 @@ export function prepareArticleCreateData(
   return articles;
 }
 
+/**
+ * 기존 매물 삭제 범위
+ * - fullComplexIds: 전체 크롤링 단지 (기존 매물 전체 삭제 후 재생성)
+ * - incremental: 증분 크롤링 단지 (스크롤하지 않은 기존 매물 carriedArticleNos는 유지)
+ * - filtered: 필터(거래유형/가격/면적) 크롤링 단지 (이번에 수집된 매물만 교체, 필터 밖 매물은 유지)
+ */
+export interface ArticleDeletePlan {
+  fullComplexIds: string[];
+  incremental: { complexId: string; keepArticleNos: string[] }[];
+  filtered: { complexId: string; articleNos: string[] }[];
+}
+
+/**
+ * 크롤링 결과별로 기존 매물 삭제 범위를 계산합니다.
+ * 증분/필터 크롤링은 단지 매물 일부만 결과에 담기므로 전체 삭제하면 나머지 매물이 사라집니다.
+ *
+ * @param crawlData - 크롤링 데이터 배열
+ * @param complexNoToIdMap - complexNo -> complexId 매핑
+ * @returns 삭제 범위
+ */
+export function planArticleDeletes(
+  crawlData: any[],
+  complexNoToIdMap: Map<string, string>
+): ArticleDeletePlan {
+  const incremental = new Map<string, string[]>();
+  const filtered = new Map<string, string[]>();
+
+  for (const data of crawlData) {
+    if (!data.overview || !data.articles) {
+      continue;
+    }
+
+    const complexNo = data.overview.complexNo || data.crawling_info?.complex_no;
+    const complexId = complexNo ? complexNoToIdMap.get(complexNo) : undefined;
+    if (!complexId) {
+      continue;
+    }
+
+    if (data.crawling_info?.filters) {
+      const articleNos = (data.articles.articleList || []).map((a: any) => String(a.articleNo));
+      filtered.set(complexId, articleNos);
+    } else if (data.articles.crawlMode === 'incremental') {
+      incremental.set(complexId, (data.articles.carriedArticleNos || []).map(String));
+    }
+  }
+
+  return {
+    // 매물 수집에 실패한 단지도 기존과 같이 전체 삭제 대상
+    fullComplexIds: Array.from(complexNoToIdMap.values()).filter(
+      (id) => !incremental.has(id) && !filtered.has(id)
+    ),
+    incremental: Array.from(incremental, ([complexId, keepArticleNos]) => ({
+      complexId,
+      keepArticleNos,
+    })),
+    filtered: Array.from(filtered, ([complexId, articleNos]) => ({ complexId, articleNos })),
+  };
+}
+
 /**
  * 중복된 articleNo를 제거합니다.
  *
@@ -84,7 +84,7 @@ export function prepareComplexUpsertData(
       sidoCode: null,
       sigunguCode: null,
       dongCode: null,
-      lawdCd: null,
+      lawdCd: overview?.lawdCd || null, // 크롤러가 법정동코드 인덱스로 추출한 값
       pyeongs: overview?.pyeongs || [],
       userId,
     });
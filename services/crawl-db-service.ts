@@ -21,6 +21,7 @@ import {
   prepareArticleCreateData,
   deduplicateArticles,
   calculateArticleStats,
+  planArticleDeletes,
 } from './article-processor';
 
 const logger = createLogger('CRAWL_DB_SERVICE');
@@ -132,10 +133,26 @@ export async function saveCrawlResultsToDB(
     await updateCrawlStep(crawlId, 'Saving article data');
 
     // 기존 매물 삭제 (repository 사용)
-    const complexIds = Array.from(complexNoToIdMap.values());
-    await articleRepository.deleteByComplexIds(complexIds);
+    // 전체 크롤링 단지는 전체 삭제, 증분 크롤링 단지는 이어받은 매물(carriedArticleNos)만 남김,
+    // 필터 크롤링 단지는 이번에 수집된 매물만 교체 (필터 밖 매물 유지)
+    const deletePlan = planArticleDeletes(crawlData, complexNoToIdMap);
+    if (deletePlan.fullComplexIds.length > 0) {
+      await articleRepository.deleteByComplexIds(deletePlan.fullComplexIds);
+    }
+    for (const { complexId, keepArticleNos } of deletePlan.incremental) {
+      await articleRepository.deleteByComplexIdExcept(complexId, keepArticleNos);
+    }
+    for (const { complexId, articleNos } of deletePlan.filtered) {
+      if (articleNos.length > 0) {
+        await articleRepository.deleteByComplexIdAndArticleNos(complexId, articleNos);
+      }
+    }
 
-    logger.info('Deleted old articles', { complexIds: complexIds.length });
+    logger.info('Deleted old articles', {
+      fullComplexes: deletePlan.fullComplexIds.length,
+      incrementalComplexes: deletePlan.incremental.length,
+      filteredComplexes: deletePlan.filtered.length,
+    });
 
     // 새 매물 삽입 (repository 사용)
     if (articles.length > 0) {
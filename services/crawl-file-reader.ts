@@ -148,6 +148,58 @@ export function validateCrawlData(data: any[]): {
   return { valid, invalid };
 }
 
+export interface CrawlerStatus {
+  status: string;
+  deferredComplexes: string[];
+}
+
+/**
+ * 크롤러 최종 상태 파일(crawl_status_*.json)을 읽습니다.
+ * 시간 예산으로 연기한 단지가 있으면 크롤러가 status=partial과 deferred_complexes를 기록합니다.
+ *
+ * @param baseDir - 베이스 디렉토리
+ * @param since - 이 시각 이후에 갱신된 상태 파일만 사용 (이전 실행의 상태 파일 무시)
+ * @returns 크롤러 상태, 없으면 null
+ */
+export async function loadLatestCrawlStatus(
+  baseDir: string,
+  since?: Date
+): Promise<CrawlerStatus | null> {
+  const crawledDataDir = path.join(baseDir, 'crawled_data');
+
+  try {
+    const files = await fs.readdir(crawledDataDir);
+    const statusFiles = await Promise.all(
+      files
+        .filter(f => f.startsWith('crawl_status_') && f.endsWith('.json'))
+        .map(async f => {
+          const filePath = path.join(crawledDataDir, f);
+          const stats = await fs.stat(filePath);
+          return { filePath, mtime: stats.mtime };
+        })
+    );
+
+    const latest = statusFiles
+      .filter(f => !since || f.mtime.getTime() >= since.getTime())
+      .sort((a, b) => b.mtime.getTime() - a.mtime.getTime())[0];
+    if (!latest) {
+      return null;
+    }
+
+    const status = JSON.parse(await fs.readFile(latest.filePath, 'utf-8'));
+    return {
+      status: status.status,
+      deferredComplexes: (status.deferred_complexes || []).map(String),
+    };
+  } catch (error: any) {
+    logger.warn('Failed to read crawler status file', {
+      crawledDataDir,
+      error: error.message,
+    });
+    return null;
+  }
+}
+
 /**
  * 최신 크롤링 결과를 읽고 유효성 검증까지 수행합니다. (헬퍼 함수)
  *
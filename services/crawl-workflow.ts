@@ -16,6 +16,7 @@ import { calculateDynamicTimeout } from '@/lib/timeoutCalculator';
 import { prisma } from '@/lib/prisma';
 import { executePythonCrawler } from './crawler-executor';
 import { saveCrawlResultsToDB } from './crawl-db-service';
+import { loadLatestCrawlStatus } from './crawl-file-reader';
 import { sendAlertsForChanges } from './alert-service';
 import { CrawlExecutionOptions, CrawlStatus } from './types';
 
@@ -29,6 +30,8 @@ export interface CrawlWorkflowResult {
   duration: number;
   status: CrawlStatus;
   errors: string[];
+  /** 시간 예산 초과로 다음 실행으로 연기된 단지 */
+  deferredComplexes: string[];
 }
 
 /**
@@ -246,19 +249,41 @@ export async function executeCrawlWorkflow(
       baseDir,
     });
 
+    // 크롤러 최종 상태 (시간 예산으로 연기한 단지가 있으면 partial)
+    const crawlerStatus = await loadLatestCrawlStatus(baseDir, new Date(startTime));
+    const deferredComplexes = crawlerStatus?.deferredComplexes ?? [];
+
     const duration = Date.now() - startTime;
     const status: CrawlStatus =
-      dbResult.errors.length > 0 ? 'partial' : 'success';
+      dbResult.errors.length > 0 ||
+      crawlerStatus?.status === 'partial' ||
+      deferredComplexes.length > 0
+        ? 'partial'
+        : 'success';
+
+    const messages = [...dbResult.errors];
+    if (deferredComplexes.length > 0) {
+      messages.unshift(
+        `시간 예산 초과로 ${deferredComplexes.length}개 단지 연기: ${deferredComplexes.join(',')}`
+      );
+      logger.warn('Complexes deferred by time budget', {
+        crawlId,
+        deferredCount: deferredComplexes.length,
+        deferredComplexes,
+      });
+    }
 
     // 5. 히스토리 최종 업데이트
     await updateCrawlHistory(crawlId, {
       successCount: dbResult.totalComplexes,
-      errorCount: complexNos.length - dbResult.totalComplexes,
+      errorCount: Math.max(
+        0,
+        complexNos.length - dbResult.totalComplexes - deferredComplexes.length
+      ),
       totalArticles: dbResult.totalArticles,
       duration: Math.floor(duration / 1000),
       status,
-      errorMessage:
-        dbResult.errors.length > 0 ? dbResult.errors.join(', ') : null,
+      errorMessage: messages.length > 0 ? messages.join(', ') : null,
       currentStep: 'Completed',
     });
 
@@ -269,7 +294,7 @@ export async function executeCrawlWorkflow(
         status === 'success' ? 'success' : 'failed',
         duration,
         dbResult.totalArticles,
-        dbResult.errors.length > 0 ? dbResult.errors.slice(0, 3).join(', ') : null
+        messages.length > 0 ? messages.slice(0, 3).join(', ') : null
       );
     }
 
@@ -293,6 +318,7 @@ export async function executeCrawlWorkflow(
       totalArticles: dbResult.totalArticles,
       duration,
       status,
+      deferredCount: deferredComplexes.length,
     });
 
     return {
@@ -303,6 +329,7 @@ export async function executeCrawlWorkflow(
       duration,
       status,
       errors: dbResult.errors,
+      deferredComplexes,
     };
   } catch (error: any) {
     const duration = Date.now() - startTime;
@@ -317,6 +344,7 @@ export async function executeCrawlWorkflow(
       duration,
       status: 'failed',
       errors: [error.message],
+      deferredComplexes: [],
     };
   }
 }
@@ -44,14 +44,23 @@ export async function executePythonCrawler(
     timeout,
   });
 
+  // 타임아웃으로 강제 종료되기 전에 크롤러가 스스로 멈추도록 시간 예산 전달 (종료/정리 여유 30초)
+  // 예산 안에서 싸고 급한 단지부터 크롤링하고, 못 한 단지는 연기 후 부분 완료(partial)로 종료
+  const timeBudgetSeconds = Math.max(60, Math.floor(timeout / 1000) - 30);
+
+  // CRAWLER_BACKEND=hybrid: HTTP 우선, 실패한 단지만 브라우저로 크롤링
+  const crawlerScript =
+    process.env.CRAWLER_BACKEND === 'hybrid' ? 'hybrid_crawler.py' : 'nas_playwright_crawler.py';
+
   return new Promise((resolve) => {
     const pythonProcess = spawn(
       'python3',
       [
         '-u', // unbuffered output
-        `${baseDir}/logic/nas_playwright_crawler.py`,
+        `${baseDir}/logic/${crawlerScript}`,
         complexNos,
         crawlId,
+        `--time-budget=${timeBudgetSeconds}`,
       ],
       {
         cwd: baseDir,
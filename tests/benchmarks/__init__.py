@@ -0,0 +1 @@
+# 크롤러 핫패스 마이크로벤치마크
@@ -0,0 +1,11 @@
+"""
+벤치마크 픽스처 (데이터 생성 함수는 factories.py)
+"""
+import pytest
+
+from tests.benchmarks.factories import SIZES
+
+
+@pytest.fixture(params=SIZES, ids=lambda n: f"{n // 1000}k")
+def listing_count(request):
+    return request.param
@@ -0,0 +1,99 @@
+"""
+벤치마크용 합성 데이터 생성
+실제 네이버 부동산 매물 API 응답과 같은 형태의 매물/단지 데이터를 생성
+"""
+import random
+
+SIZES = [1_000, 10_000, 100_000]
+
+TRADE_TYPES = [("매매", "A1"), ("전세", "B1"), ("월세", "B2")]
+
+
+def _format_price(man: int) -> str:
+    """만원 단위 금액을 네이버 표기("3억 5,000")로 변환"""
+    eok, rest = divmod(man, 10000)
+    if eok and rest:
+        return f"{eok}억 {rest:,}"
+    if eok:
+        return f"{eok}억"
+    return f"{rest:,}"
+
+
+def make_articles(count: int, seed: int = 42) -> list:
+    """매물 목록 생성 (가격 문자열은 실제처럼 반복이 많도록 5백만원 단위)"""
+    rng = random.Random(seed)
+    articles = []
+    for i in range(count):
+        trade_name, trade_code = TRADE_TYPES[i % 3]
+        deal_man = rng.randrange(10_000, 300_000, 500)
+        articles.append(
+            {
+                "articleNo": str(2_400_000_000 + i),
+                "articleName": "테스트단지",
+                "realEstateTypeName": "아파트",
+                "tradeTypeName": trade_name,
+                "tradeTypeCode": trade_code,
+                "dealOrWarrantPrc": _format_price(deal_man),
+                "rentPrc": str(rng.randrange(50, 300, 10)) if trade_code == "B2" else "",
+                "area1": rng.choice([59, 74, 84, 101, 114]),
+                "area2": rng.choice([44, 59, 74, 84]),
+                "floorInfo": f"{rng.randint(1, 30)}/30",
+                "direction": rng.choice(["남향", "동향", "서향", "남동향"]),
+                "articleConfirmYmd": "20251019",
+                "buildingName": f"{rng.randint(101, 120)}동",
+                "sameAddrCnt": rng.randint(1, 5),
+                "realtorName": "테스트공인중개사",
+                "tagList": ["25년이내", "대단지"],
+                "latitude": "37.2" + str(rng.randint(1000, 9999)),
+                "longitude": "127.0" + str(rng.randint(1000, 9999)),
+            }
+        )
+    return articles
+
+
+def make_api_pages(articles: list, page_size: int = 20, duplicate_ratio: float = 0.2) -> list:
+    """
+    스크롤 중 수신되는 API 응답 페이지 목록 생성
+    동일 페이지 재요청을 흉내내어 일부 매물이 중복으로 다시 들어오도록 구성
+    """
+    rng = random.Random(7)
+    pages = []
+    for start in range(0, len(articles), page_size):
+        page = list(articles[start:start + page_size])
+        if start and rng.random() < duplicate_ratio:
+            page = articles[start - page_size // 2:start] + page
+        pages.append(page)
+    return pages
+
+
+def make_results(total_articles: int, per_complex: int = 500) -> list:
+    """crawl_multiple_complexes 결과 형태의 단지 목록 생성"""
+    articles = make_articles(total_articles)
+    results = []
+    for idx, start in enumerate(range(0, total_articles, per_complex)):
+        complex_no = str(10_000 + idx)
+        results.append(
+            {
+                "crawling_info": {
+                    "complex_no": complex_no,
+                    "crawling_date": "2025-10-19T09:00:00+09:00",
+                    "crawler_version": "1.0.2",
+                },
+                "overview": {
+                    "complexNo": complex_no,
+                    "complexName": f"테스트단지{idx}",
+                    "totalHousehold": 1000,
+                    "totalDong": 10,
+                    "latitude": 37.2,
+                    "longitude": 127.0,
+                    "minArea": 59,
+                    "maxArea": 114,
+                },
+                "articles": {
+                    "articleList": articles[start:start + per_complex],
+                    "totalCount": len(articles[start:start + per_complex]),
+                    "isMoreData": False,
+                },
+            }
+        )
+    return results
@@ -0,0 +1,117 @@
+"""
+크롤러 CPU 핫패스 마이크로벤치마크 (pytest-benchmark)
+
+실행:
+    ./scripts/run-benchmarks.sh save      # 기준선 저장
+    ./scripts/run-benchmarks.sh compare   # 기준선 대비 회귀 확인
+"""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("playwright")
+pytest.importorskip("pandas")
+pytest.importorskip("psycopg2")
+
+from nas_playwright_crawler import (  # noqa: E402
+    NASNaverRealEstateCrawler,
+    count_articles,
+    get_kst_now,
+    merge_articles,
+)
+from price_normalizer import clear_price_cache, parse_price_to_won, parse_prices_to_won  # noqa: E402
+from tests.benchmarks.factories import make_api_pages, make_articles, make_results  # noqa: E402
+
+pytestmark = pytest.mark.slow
+
+
+@pytest.fixture
+def crawler(tmp_path, monkeypatch):
+    """DB 없이 파일 모드로 동작하는 크롤러 (출력은 임시 디렉토리)"""
+    monkeypatch.setenv("OUTPUT_DIR", str(tmp_path))
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    monkeypatch.delenv("RECORD_TRAFFIC_DIR", raising=False)
+    monkeypatch.delenv("REPLAY_TRAFFIC_DIR", raising=False)
+    return NASNaverRealEstateCrawler()
+
+
+class TestArticleMergeBenchmark:
+    """handle_articles_response의 매물 중복 제거/병합"""
+
+    def test_merge_api_pages(self, benchmark, listing_count):
+        pages = make_api_pages(make_articles(listing_count))
+
+        def run():
+            collected_ids = set()
+            all_articles = []
+            for page in pages:
+                merge_articles(page, collected_ids, all_articles)
+            return all_articles
+
+        merged = benchmark(run)
+        assert len(merged) == listing_count
+
+
+class TestTotalRecomputationBenchmark:
+    """crawl_multiple_complexes의 단지별 전체 매물 수 재계산"""
+
+    def test_recount_per_complex(self, benchmark, listing_count):
+        results = make_results(listing_count, per_complex=100)
+
+        def run():
+            # 단지 하나가 끝날 때마다 그때까지의 결과 전체를 다시 세는 패턴
+            total = 0
+            for i in range(1, len(results) + 1):
+                total = count_articles(results[:i])
+            return total
+
+        assert benchmark(run) == listing_count
+
+
+class TestSaveDataBenchmark:
+    """save_data의 JSON/CSV 저장"""
+
+    def test_save_data(self, benchmark, crawler, listing_count):
+        results = make_results(listing_count)
+        benchmark.pedantic(crawler.save_data, args=(results, "bench"), rounds=3, iterations=1)
+        assert list(crawler.output_dir.glob("bench_*.json"))
+
+
+class TestUpdateStatusBenchmark:
+    """update_status의 상태 직렬화 (파일 모드)"""
+
+    def test_update_status(self, benchmark, crawler, tmp_path):
+        crawler.status_file = tmp_path / "crawl_status_bench.json"
+        crawler.start_time = get_kst_now()
+
+        benchmark(
+            crawler.update_status,
+            status="running",
+            progress=50,
+            total=100,
+            current_complex="22065",
+            message="🔄 매물 스크롤 중... (시도 30회, 수집 600개)",
+            items_collected=600,
+        )
+        assert crawler.status_file.exists()
+
+
+class TestPriceParsingBenchmark:
+    """매물 가격 문자열 파싱 (캐시를 비운 상태에서 측정)"""
+
+    def test_parse_prices_scalar(self, benchmark, listing_count):
+        prices = [a["dealOrWarrantPrc"] for a in make_articles(listing_count)]
+
+        def run():
+            clear_price_cache()
+            return [parse_price_to_won(p) for p in prices]
+
+        assert len(benchmark(run)) == listing_count
+
+    def test_parse_prices_vectorized(self, benchmark, listing_count):
+        prices = [a["dealOrWarrantPrc"] for a in make_articles(listing_count)]
+
+        def run():
+            clear_price_cache()
+            return parse_prices_to_won(prices)
+
+        assert len(benchmark(run)) == listing_count
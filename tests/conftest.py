@@ -0,0 +1,10 @@
+"""
+pytest 공통 설정
+크롤러 모듈은 logic/ 안에서 서로를 최상위 모듈로 임포트하므로 경로에 추가
+"""
+import sys
+from pathlib import Path
+
+LOGIC_DIR = Path(__file__).resolve().parent.parent / "logic"
+if str(LOGIC_DIR) not in sys.path:
+    sys.path.insert(0, str(LOGIC_DIR))
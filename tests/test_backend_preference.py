@@ -0,0 +1,31 @@
+"""
+backend_preference 테스트 (HTTP 실패 시 브라우저 우선 / 재검사 주기)
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from backend_preference import BackendPreferenceStore
+
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def backend_store(tmp_path, monkeypatch):
+    monkeypatch.setenv('BACKEND_REPROBE_HOURS', '24')
+    return BackendPreferenceStore(tmp_path)
+
+
+def test_backend_preference_falls_back_to_browser_then_reprobes(backend_store):
+    assert backend_store.preferences(['100'], now=T0) == {'100': 'http'}
+
+    backend_store.record({'100': False}, now=T0)
+    assert backend_store.preferences(['100'], now=T0 + timedelta(hours=23)) == {'100': 'browser'}
+    assert backend_store.preferences(['100'], now=T0 + timedelta(hours=24)) == {'100': 'http'}
+
+    # 연속 실패 시 재검사 주기 2배
+    backend_store.record({'100': False}, now=T0)
+    assert backend_store.preferred(backend_store.load()['100'], now=T0 + timedelta(hours=47)) == 'browser'
+
+    backend_store.record({'100': True}, now=T0)
+    assert backend_store.preferred(backend_store.load()['100'], now=T0) == 'http'
@@ -0,0 +1,68 @@
+"""
+circuit_breaker 테스트 (차단 / 대기 / 시험 요청 / 복구)
+"""
+from circuit_breaker import CLOSED, HALF_OPEN, OPEN, PROBE_POLL_SECONDS, BotDetectionBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _breaker(clock):
+    return BotDetectionBreaker(threshold=3, window=60, cooldown=100, max_cooldown=300, clock=clock)
+
+
+def test_trips_only_when_signals_fall_within_window():
+    clock = FakeClock()
+    breaker = _breaker(clock)
+
+    assert not breaker.record_signal('a')
+    clock.now = 50
+    assert not breaker.record_signal('b')
+    clock.now = 100  # 첫 신호는 창 밖
+    assert not breaker.record_signal('c')
+    assert breaker.state == CLOSED
+
+    clock.now = 105
+    assert breaker.record_signal('d')
+    assert breaker.state == OPEN and breaker.trips == 1
+    assert breaker.wait_time() == 100
+
+
+def test_half_open_allows_single_probe_and_recovers():
+    clock = FakeClock()
+    breaker = _breaker(clock)
+    for _ in range(3):
+        breaker.record_signal('redirect')
+
+    clock.now = 100
+    assert breaker.wait_time() == 0  # 첫 크롤러가 시험 요청
+    assert breaker.state == HALF_OPEN
+    assert breaker.wait_time() == PROBE_POLL_SECONDS  # 나머지는 대기
+
+    assert breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.wait_time() == 0
+
+
+def test_failed_probe_doubles_cooldown():
+    clock = FakeClock()
+    breaker = _breaker(clock)
+    for _ in range(3):
+        breaker.record_signal('redirect')
+
+    clock.now = 100
+    breaker.wait_time()
+    assert breaker.record_signal('redirect again')
+    assert breaker.state == OPEN and breaker.trips == 2
+    assert breaker.wait_time() == 200
+
+    # 복구되면 대기 시간 초기화
+    clock.now = 300
+    breaker.wait_time()
+    breaker.record_success()
+    assert breaker.cooldown == 100
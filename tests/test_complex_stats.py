@@ -0,0 +1,136 @@
+"""
+complex_stats 테스트 (매물 변동 집계 / 재크롤링 우선순위)
+"""
+import math
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from complex_stats import ComplexStatsStore, article_price_map, diff_articles
+from cost_model import estimate_costs
+
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _articles(*items):
+    return [{'articleNo': no, 'dealOrWarrantPrc': price, 'rentPrc': ''} for no, price in items]
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setenv('MAX_RECRAWL_HOURS', '168')
+    monkeypatch.setenv('CHURN_EWMA_ALPHA', '0.5')
+    monkeypatch.setenv('FULL_SWEEP_HOURS', '72')
+    return ComplexStatsStore(tmp_path)
+
+
+def test_diff_articles_counts_new_removed_and_price_changes():
+    previous = article_price_map(_articles(('1', '5억'), ('2', '6억'), ('3', '7억')))
+    current = article_price_map(_articles(('2', '6억'), ('3', '7억 5,000'), ('4', '8억')))
+    assert diff_articles(previous, current) == {'new': 1, 'removed': 1, 'price_changed': 1, 'total': 3}
+
+
+def test_record_crawl_tracks_churn_rate(store):
+    assert store.record_crawl('100', _articles(('1', '5억'), ('2', '6억')), now=T0) is None
+
+    changes = store.record_crawl('100', _articles(('2', '6억 1,000'), ('3', '7억')), now=T0 + timedelta(hours=2))
+    assert changes == {'new': 1, 'removed': 1, 'price_changed': 1, 'total': 2}
+
+    entry = store.load()['100']
+    assert entry['crawl_count'] == 2
+    assert entry['churn_rate'] == pytest.approx(1.5)  # 3건 / 2시간
+
+    store.record_crawl('100', _articles(('2', '6억 1,000'), ('3', '7억')), now=T0 + timedelta(hours=4))
+    assert store.load()['100']['churn_rate'] == pytest.approx(0.75)  # EWMA(0.5): 1.5 → 0
+    assert [a['articleNo'] for a in store.load_snapshot('100')['articles']] == ['2', '3']
+
+
+def test_select_prefers_stale_busy_and_never_crawled(store):
+    store.record_crawl('busy', _articles(('1', '5억')), now=T0)
+    store.record_crawl('busy', _articles(('2', '5억')), now=T0 + timedelta(hours=1))
+    store.record_crawl('quiet', _articles(('1', '5억')), now=T0)
+    store.record_crawl('quiet', _articles(('1', '5억')), now=T0 + timedelta(hours=1))
+
+    now = T0 + timedelta(hours=5)
+    assert store.priority(store.load()['busy'], now) > store.priority(store.load()['quiet'], now)
+    assert store.priority(None, now) == math.inf
+
+    selected, skipped = store.select(['quiet', 'new', 'busy'], budget=2, now=now)
+    assert selected == ['new', 'busy']
+    assert skipped == ['quiet']
+
+    # 최대 재크롤링 간격을 넘은 단지는 변동이 없어도 우선 포함
+    later = T0 + timedelta(hours=200)
+    assert store.priority(store.load()['quiet'], later) == math.inf
+
+
+def test_select_without_budget_keeps_everything(store):
+    assert store.select(['a', 'b'], budget=0) == (['a', 'b'], [])
+
+
+def test_record_results_skips_failed_complexes(store):
+    results = [
+        {'crawling_info': {'complex_no': '1'}, 'articles': {'articleList': _articles(('9', '1억'))}},
+        {'crawling_info': {'complex_no': '2'}, 'error': 'timeout'},
+    ]
+    assert store.record_results(results) == 1
+    assert set(store.load()) == {'1'}
+
+
+def test_record_results_saves_once_with_slim_snapshots(store, monkeypatch):
+    saves = []
+    save = store._save
+    monkeypatch.setattr(store, '_save', lambda complexes: saves.append(1) or save(complexes))
+    article = dict(_articles(('9', '1억'))[0], tradeTypeCode='A1', articleFeatureDesc='남향', tagList=['역세권'])
+    results = [
+        {'crawling_info': {'complex_no': str(no)}, 'articles': {'articleList': [dict(article, articleNo=f"{no}-9")]}}
+        for no in range(5)
+    ] + [{'crawling_info': {'complex_no': '0'}, 'error': 'timeout'}]
+
+    assert store.record_results(results, now=T0) == 5
+    assert len(saves) == 1  # 단지 수와 무관하게 통계 파일은 한 번만 저장
+    assert store.load_snapshot('0')['articles'] == [
+        {'articleNo': '0-9', 'dealOrWarrantPrc': '1억', 'rentPrc': '', 'tradeTypeCode': 'A1'}
+    ]
+    assert store.load()['0']['failures'] == 1
+
+
+def test_incremental_results_carry_snapshot_articles(store):
+    store.record_crawl('100', _articles(('1', '5억'), ('2', '6억')), now=T0)
+    results = [{
+        'crawling_info': {'complex_no': '100'},
+        'articles': {'articleList': _articles(('3', '7억'), ('1', '5억 1,000')), 'crawlMode': 'incremental',
+                     'carriedArticleNos': ['2']},
+    }]
+    store.record_results(results, now=T0 + timedelta(hours=1))
+
+    entry = store.load()['100']
+    assert entry['last_changes'] == {'new': 1, 'removed': 0, 'price_changed': 1, 'total': 3}
+    assert entry['article_count'] == 3
+    assert [a['articleNo'] for a in store.incremental_baseline('100', now=T0 + timedelta(hours=2))] == ['3', '1', '2']
+
+
+def test_incremental_baseline_until_full_sweep_is_due(store):
+    assert store.incremental_baseline('100', now=T0) is None  # 스냅샷 없음 → 전체 크롤링
+
+    store.record_crawl('100', _articles(('1', '5억'), ('2', '6억')), now=T0)
+    assert [a['articleNo'] for a in store.incremental_baseline('100', now=T0 + timedelta(hours=24))] == ['1', '2']
+
+    # 증분 크롤링은 전체 크롤링 시각을 갱신하지 않음
+    store.record_crawl('100', _articles(('3', '7억'), ('1', '5억'), ('2', '6억')), now=T0 + timedelta(hours=48), full=False)
+    assert store.incremental_baseline('100', now=T0 + timedelta(hours=71)) is not None
+    assert store.incremental_baseline('100', now=T0 + timedelta(hours=72)) is None
+
+
+def test_failures_raise_estimated_cost(store):
+    store.record_crawl('100', _articles(('1', '5억')), now=T0, duration=40, scroll_attempts=3)
+    store.record_results([{'complex_no': '100', 'error': 'Timeout 30000ms exceeded'}])
+
+    entry = store.load()['100']
+    assert entry['failure_rate'] == 0.5  # 성공 기록이 있으므로 0에서 출발한 EWMA
+    assert entry['avg_scroll_attempts'] == 3
+    assert estimate_costs(store, ['100']) == {'100': 60.0}  # 실패율만큼 재시도 비용 추가
+
+    # 시간 예산으로 연기한 단지는 실패로 보지 않음
+    store.record_results([{'complex_no': '100', 'error': '연기', 'deferred': True}])
+    assert store.load()['100']['failures'] == 1
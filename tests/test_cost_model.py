@@ -0,0 +1,69 @@
+"""
+cost_model 테스트 (비용 보정 ETA / LPT 분배 / 시간 예산 계획)
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from complex_stats import ComplexStatsStore
+from cost_model import (DEFAULT_COMPLEX_SECONDS, estimate_duration, estimate_total_seconds, lpt_partition,
+                        plan_time_budget)
+
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _articles(*items):
+    return [{'articleNo': no, 'dealOrWarrantPrc': price, 'rentPrc': ''} for no, price in items]
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setenv('MAX_RECRAWL_HOURS', '168')
+    monkeypatch.setenv('CHURN_EWMA_ALPHA', '0.5')
+    return ComplexStatsStore(tmp_path)
+
+
+def test_eta_scales_predicted_cost_by_observed_ratio():
+    # 예측 100초짜리 단지를 50초에 끝냄 → 전체 예측 1000초를 절반으로 보정
+    assert estimate_total_seconds(50, done_cost=100, total_cost=1000, progress=1, total=10) == 500
+    # 비용 기록이 없으면 단지 수 기준
+    assert estimate_total_seconds(50, done_cost=0, total_cost=0, progress=1, total=10) == 500
+    # 아직 완료한 단지가 없으면 예측치 그대로
+    assert estimate_total_seconds(5, done_cost=0, total_cost=300) == 300
+
+
+def test_lpt_balances_by_cost_not_count():
+    costs = {'big': 100, 'a': 30, 'b': 30, 'c': 30, 'd': 10}
+    shards = lpt_partition(['a', 'b', 'big', 'c', 'd'], costs, bins=2)
+
+    assert shards == [['big'], ['a', 'b', 'c', 'd']]
+    assert [sum(costs[no] for no in shard) for shard in shards] == [100, 100]
+
+
+def test_lpt_never_returns_empty_shards():
+    assert lpt_partition(['a'], {'a': 5}, bins=3) == [['a']]
+    assert lpt_partition([], {}, bins=3) == []
+
+
+def test_time_budget_plan_prefers_cheap_urgent_complexes(store):
+    store.record_crawl('slow', _articles(('1', '5억')), now=T0, duration=300)
+    store.record_crawl('fast', _articles(('1', '5억')), now=T0, duration=20)
+    store.record_crawl('recent', _articles(('1', '5억')), now=T0 + timedelta(hours=9), duration=20)
+
+    assert estimate_duration(store.load()['fast']) == 20
+    assert estimate_duration(None) == DEFAULT_COMPLEX_SECONDS
+
+    now = T0 + timedelta(hours=10)
+    planned, deferred = plan_time_budget(store, ['slow', 'recent', 'fast', 'new'], budget_seconds=100, now=now)
+    assert planned == ['new', 'fast', 'recent']  # 처음 크롤링하는 단지 → 시간당 가치 순
+    assert deferred == ['slow']
+
+
+def test_time_budget_plan_keeps_top_complex_larger_than_budget(store):
+    store.record_crawl('huge', _articles(('1', '5억')), now=T0, duration=500)
+    store.record_crawl('small', _articles(('1', '5억')), now=T0, duration=20)
+
+    now = T0 + timedelta(hours=10)
+    # 1순위 단지가 혼자 예산을 넘어도 단독 계획 (매번 연기되지 않도록)
+    assert plan_time_budget(store, ['huge'], budget_seconds=100, now=now) == (['huge'], [])
+    assert plan_time_budget(store, ['huge', 'small'], budget_seconds=100, now=now) == (['small'], ['huge'])
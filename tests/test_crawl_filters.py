@@ -0,0 +1,57 @@
+"""
+crawl_filters 테스트 (거래유형 파싱 / 명령행 옵션 / API 파라미터)
+"""
+import pytest
+
+from crawl_filters import CrawlFilters, parse_trade_types
+
+
+def test_parse_trade_types_accepts_names_and_codes():
+    assert parse_trade_types('매매, b1:월세,A1') == ['A1', 'B1', 'B2']
+    assert parse_trade_types('') == []
+    with pytest.raises(ValueError):
+        parse_trade_types('분양')
+
+
+def test_args_parse_filter_options():
+    filters, args = CrawlFilters.from_args(['22065,12345', '--trade-types=매매', 'crawl-1',
+                                            '--price-max=50,000', '--area-min=59.9'])
+    assert args == ['22065,12345', 'crawl-1']
+    assert filters.active
+    assert filters.api_params() == {'tradeType': 'A1', 'priceMax': '50000', 'areaMin': '59'}
+
+
+def test_decimal_bounds_widen_to_include_boundary_listings():
+    """정수로 보낼 때 하한은 내림, 상한은 올림 (84.9 상한에 84.x㎡ 매물 포함)"""
+    filters, _ = CrawlFilters.from_args(['--area-min=59.9', '--area-max=84.9', '--price-max=50000.5'])
+    assert filters.api_params() == {'areaMin': '59', 'areaMax': '85', 'priceMax': '50001'}
+
+    filters, _ = CrawlFilters.from_args(['--area-max=84', '--price-min=30000'])
+    assert filters.api_params() == {'priceMin': '30000', 'areaMax': '84'}
+
+
+def test_args_reject_option_without_value():
+    """'--price-max 90000'은 값이 crawl_id로 새지 않도록 오류"""
+    with pytest.raises(ValueError):
+        CrawlFilters.from_args(['22065', '--price-max', '90000'])
+    with pytest.raises(ValueError):
+        CrawlFilters.from_args(['22065', '--trade-types='])
+
+
+def test_env_does_not_apply_filters(monkeypatch):
+    """필터는 명령행에서 요청한 경우만 (환경변수로 전체 크롤링이 부분 수집이 되지 않도록)"""
+    monkeypatch.setenv('CRAWL_TRADE_TYPES', '전세')
+    monkeypatch.setenv('CRAWL_PRICE_MAX', '50000')
+    filters, args = CrawlFilters.from_args(['22065', 'crawl-1'])
+    assert args == ['22065', 'crawl-1']
+    assert not filters.active
+
+
+def test_inactive_filters_leave_query_untouched():
+    filters = CrawlFilters()
+    assert not filters.active
+    assert filters.api_params() == {}
+    assert filters.restrict_trade_types('B2:B3') == 'B2:B3'
+
+    assert CrawlFilters(trade_types=['A1', 'B3']).restrict_trade_types('B2:B3') == 'B3'
+    assert CrawlFilters(trade_types=['A1']).restrict_trade_types('B1') is None
@@ -0,0 +1,73 @@
+"""
+db_scheduler 테스트 (크롤링 API 위임 / 시크릿 없으면 시작 거부)
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("psycopg2")
+pytest.importorskip("apscheduler")
+
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+from db_scheduler import DBScheduler  # noqa: E402
+
+SCHEDULE = {'id': 'schedule-1', 'name': '매일 아침', 'userId': 'user-1',
+            'use_bookmarked_complexes': False, 'complexNos': ['22065', '12345']}
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    monkeypatch.setenv("INTERNAL_API_SECRET", "secret")
+    monkeypatch.setenv("CRAWL_BUDGET", "0")
+    monkeypatch.setenv("SCHEDULE_JITTER_SECONDS", "0")
+    scheduler = DBScheduler()
+    scheduler.logs = []
+    scheduler.write_log = lambda *args: scheduler.logs.append(args)
+    return scheduler
+
+
+def run_with_api(scheduler, status, body):
+    """가짜 크롤링 API를 띄우고 스케줄 1회 실행, 받은 요청 반환"""
+    requests = []
+
+    async def crawl(request):
+        requests.append((request.headers.get('x-internal-secret'), await request.json()))
+        return web.json_response(body, status=status)
+
+    async def main():
+        app = web.Application()
+        app.router.add_post('/api/crawl', crawl)
+        async with TestServer(app) as server:
+            scheduler.crawl_api_url = str(server.make_url('')).rstrip('/')
+            await scheduler.execute_schedule(dict(SCHEDULE))
+
+    asyncio.run(main())
+    return requests
+
+
+def test_requires_internal_secret(monkeypatch):
+    monkeypatch.delenv("INTERNAL_API_SECRET", raising=False)
+    with pytest.raises(RuntimeError):
+        DBScheduler()
+
+
+def test_schedule_is_handed_off_to_crawl_api(scheduler):
+    requests = run_with_api(scheduler, 200, {'success': True, 'crawlId': 'crawl_1'})
+
+    assert requests == [('secret', {
+        'complexNumbers': ['22065', '12345'], 'userId': 'user-1', 'initiator': 'schedule',
+        'scheduleId': 'schedule-1', 'scheduleName': '매일 아침',
+    })]
+    # 성공 로그는 앱의 크롤링 워크플로가 DB 저장 후 기록
+    assert scheduler.logs == []
+
+
+def test_rejected_handoff_is_logged_as_failure(scheduler):
+    run_with_api(scheduler, 409, {'success': False, 'error': '이미 크롤링이 진행 중입니다.'})
+
+    assert len(scheduler.logs) == 1
+    schedule_id, status, _, articles_count, message = scheduler.logs[0]
+    assert (schedule_id, status, articles_count) == ('schedule-1', 'failed', 0)
+    assert '409' in message
@@ -0,0 +1,112 @@
+"""
+법정동코드 인덱스 테스트 (logic/dong_code_index.py)
+"""
+import pytest
+
+from dong_code_index import DongCodeIndex, build_index, get_dong_code_index, normalize_name
+
+SOURCE = """법정동코드\t법정동명\t폐지여부
+1100000000\t서울특별시\t존재
+1168000000\t서울특별시 강남구\t존재
+1168010100\t서울특별시 강남구 역삼동\t존재
+1168010300\t서울특별시 강남구 개포동\t존재
+1168010400\t서울특별시 강남구 청담동\t폐지
+4159000000\t경기도 화성시\t존재
+4159012700\t경기도 화성시 반송동\t존재
+2611000000\t부산광역시 중구\t존재
+2611010100\t부산광역시 중구 영주동\t존재
+"""
+
+
+@pytest.fixture
+def index(tmp_path):
+    source = tmp_path / "dong_code.txt"
+    source.write_text(SOURCE, encoding="utf-8")
+    idx = DongCodeIndex(build_index(source, tmp_path / "dong_code.idx", include_abolished=True))
+    yield idx
+    idx.close()
+
+
+class TestDongCodeIndex:
+    """코드/이름/주소 조회"""
+
+    def test_code_to_name(self, index):
+        assert index.get_name("1168010100") == "서울특별시 강남구 역삼동"
+        assert index.get_name(4159012700) == "경기도 화성시 반송동"
+        assert index.get_name("9999999999") is None
+
+    def test_find_by_name(self, index):
+        assert index.find("서울특별시 강남구 역삼동")["code"] == "1168010100"
+        assert index.find("서울 강남구 역삼동")["code"] == "1168010100"
+        assert index.find("강남구역삼동")["code"] == "1168010100"
+        assert index.find("없는동") is None
+
+    def test_resolve_address_longest_match(self, index):
+        entry = index.resolve_address("경기도 화성시 반송동 93-1")
+        assert entry["code"] == "4159012700"
+        assert entry["lawdCd"] == "41590"
+
+        # 동이 색인에 없으면 시군구까지 일치
+        assert index.resolve_address("경기 화성시 동탄대로 1")["code"] == "4159000000"
+        assert index.resolve_address("전혀 다른 주소") is None
+
+    def test_children_of_sigungu(self, index):
+        codes = [e["code"] for e in index.children("11680")]
+        assert codes == ["1168010100", "1168010300"]
+
+        with_abolished = [e["code"] for e in index.children("11680", include_abolished=True)]
+        assert "1168010400" in with_abolished
+
+    def test_prefix_search(self, index):
+        names = [e["name"] for e in index.prefix_search("서울강남구")]
+        assert "서울특별시 강남구 역삼동" in names
+        assert "서울특별시 강남구 개포동" in names
+
+
+class TestBuildIndex:
+    """인덱스 컴파일"""
+
+    def test_excludes_abolished_by_default(self, tmp_path):
+        source = tmp_path / "dong_code.txt"
+        source.write_text(SOURCE, encoding="utf-8")
+        idx = DongCodeIndex(build_index(source, tmp_path / "active.idx"))
+        try:
+            assert idx.get_name("1168010400") is None
+            assert len(idx) == 8
+        finally:
+            idx.close()
+
+    def test_reads_cp949_source(self, tmp_path):
+        source = tmp_path / "dong_code_cp949.txt"
+        source.write_bytes(SOURCE.encode("cp949"))
+        idx = DongCodeIndex(build_index(source, tmp_path / "cp949.idx"))
+        try:
+            assert idx.get_name("2611010100") == "부산광역시 중구 영주동"
+        finally:
+            idx.close()
+
+    def test_rejects_invalid_file(self, tmp_path):
+        bogus = tmp_path / "bogus.idx"
+        bogus.write_bytes(b"\0" * 128)
+        with pytest.raises(ValueError):
+            DongCodeIndex(bogus)
+
+    def test_normalize_name(self):
+        assert normalize_name(" 서울특별시  강남구 ") == "서울특별시강남구"
+
+
+class TestGetDongCodeIndex:
+    """인덱스 로드 캐시"""
+
+    def test_caches_per_index_path(self, tmp_path):
+        seoul = tmp_path / "seoul.txt"
+        seoul.write_text(SOURCE, encoding="utf-8")
+        busan = tmp_path / "busan.txt"
+        busan.write_text("법정동코드\t법정동명\t폐지여부\n2611010100\t부산광역시 중구 영주동\t존재\n", encoding="utf-8")
+
+        first = get_dong_code_index(seoul, tmp_path / "seoul.idx")
+        second = get_dong_code_index(busan, tmp_path / "busan.idx")
+        assert first is not second
+        assert first.get_name("1168010100") == "서울특별시 강남구 역삼동"
+        assert second.get_name("1168010100") is None
+        assert get_dong_code_index(seoul, tmp_path / "seoul.idx") is first
@@ -0,0 +1,101 @@
+"""
+http_cache 테스트 (TTL / 조건부 요청 검증자 / LRU 정리 / 오류 시 만료 응답)
+"""
+import asyncio
+import os
+import time
+
+import pytest
+
+from http_cache import HttpResponseCache, cache_key
+
+
+def _cache(tmp_path, max_bytes=10 * 1024 * 1024):
+    return HttpResponseCache(tmp_path, ttls={'overview': 3600, 'articles': 0}, max_bytes=max_bytes)
+
+
+def test_cache_key_ignores_param_order():
+    assert cache_key('u', {'a': 1, 'b': 2}) == cache_key('u', {'b': 2, 'a': 1})
+    assert cache_key('u', {'a': 1}) != cache_key('u', {'a': 2})
+
+
+def test_fresh_hit_and_stale_revalidation(tmp_path):
+    cache = _cache(tmp_path)
+    assert cache.lookup('overview', 'u', {'a': 1}) == (None, False)
+
+    cache.store('u', {'a': 1}, {'complexName': 'A'}, {'ETag': '"v1"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'})
+    entry, fresh = cache.lookup('overview', 'u', {'a': 1})
+    assert fresh and entry['data'] == {'complexName': 'A'}
+
+    # TTL 0인 엔드포인트는 항상 조건부 요청 대상
+    entry, fresh = cache.lookup('articles', 'u', {'a': 1})
+    assert not fresh
+    assert cache.conditional_headers(entry) == {
+        'If-None-Match': '"v1"',
+        'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT',
+    }
+    assert cache.revalidated('u', {'a': 1}, entry) == {'complexName': 'A'}
+    assert cache.stats == {'hit': 1, 'revalidated': 1, 'stale': 0, 'miss': 1, 'evicted': 0}
+
+
+def test_lru_eviction_keeps_recently_used(tmp_path):
+    payload = {'data': 'x' * 1000}
+    cache = _cache(tmp_path, max_bytes=3500)
+    for i, key in enumerate(['a', 'b', 'c']):
+        cache.store(key, None, payload, {})
+        past = time.time() - 100 + i
+        os.utime(tmp_path / f"{cache_key(key)}.json", (past, past))
+
+    cache.lookup('overview', 'a')           # a를 최근 사용으로 갱신
+    cache.store('d', None, payload, {})     # 상한 초과 → 가장 오래된 b부터 삭제
+
+    assert cache.lookup('overview', 'b') == (None, False)
+    assert cache.lookup('overview', 'a')[1]
+    assert cache.total_bytes <= 3500
+    assert cache.stats['evicted'] >= 1
+
+
+def test_entry_deleted_during_lookup_is_a_miss(tmp_path, monkeypatch):
+    cache = _cache(tmp_path)
+    cache.store('u', None, {'a': 1}, {})
+
+    def deleted(path, *args):
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(os, 'utime', deleted)
+    assert cache.lookup('overview', 'u') == (None, False)
+    assert cache.stats['miss'] == 1
+
+
+def test_stale_entry_served_on_server_error_and_connection_failure(tmp_path, monkeypatch):
+    pytest.importorskip("pandas")
+    from aiohttp import ClientSession, web
+    from aiohttp.test_utils import TestServer
+    from simple_crawler import SimpleNaverRealEstateCrawler
+
+    monkeypatch.setenv('OUTPUT_DIR', str(tmp_path))
+    monkeypatch.setenv('HTTP_CACHE', 'true')
+    monkeypatch.setenv('HTTP_CACHE_TTL_ARTICLES', '0')
+    monkeypatch.delenv('HTTP_CACHE_DIR', raising=False)
+    crawler = SimpleNaverRealEstateCrawler()
+
+    async def unavailable(request):
+        return web.Response(status=503)
+
+    async def main():
+        app = web.Application()
+        app.router.add_get('/api/articles', unavailable)
+        async with TestServer(app) as server, ClientSession() as session:
+            crawler.session = session
+            url = str(server.make_url('/api/articles'))
+            assert await crawler._get_json('articles', url, {'page': 1}) == (None, 503)
+
+            crawler.http_cache.store(url, {'page': 1}, {'articleList': [1]}, {})
+            assert await crawler._get_json('articles', url, {'page': 1}) == ({'articleList': [1]}, 200)
+        # 서버 종료 후 연결 실패
+        async with ClientSession() as session:
+            crawler.session = session
+            assert await crawler._get_json('articles', url, {'page': 1}) == ({'articleList': [1]}, 200)
+
+    asyncio.run(main())
+    assert crawler.http_cache.stats['stale'] == 2
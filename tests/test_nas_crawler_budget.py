@@ -0,0 +1,107 @@
+"""
+nas_playwright_crawler 시간 예산 / 봇 탐지 차단 테스트 (차단 대기 / 첫 단지 / 연기 / 시험 요청 / 하이브리드 HTTP 연기)
+"""
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("playwright")
+pytest.importorskip("pandas")
+pytest.importorskip("psycopg2")
+
+from circuit_breaker import CLOSED, BotDetectionBreaker  # noqa: E402
+from nas_playwright_crawler import NASNaverRealEstateCrawler, pop_time_budget  # noqa: E402
+
+
+@pytest.fixture
+def crawler(tmp_path, monkeypatch):
+    """DB 없이 파일 모드로 동작하는 크롤러 (단지 크롤링은 기록만)"""
+    monkeypatch.setenv("OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setenv("RETRY_MODE", "inline")
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    monkeypatch.delenv("RECORD_TRAFFIC_DIR", raising=False)
+    monkeypatch.delenv("REPLAY_TRAFFIC_DIR", raising=False)
+    crawler = NASNaverRealEstateCrawler()
+    crawler.breaker = BotDetectionBreaker()
+    crawler.request_delay = 0
+    crawler.crawled = []
+
+    async def crawl_complex_data(complex_no, inline_retry=True):
+        # DB에 있는 단지처럼 개요 수집을 건너뛰고 매물만 수집 (skip_overview - record_success 호출 없음)
+        crawler.crawled.append(complex_no)
+        return {'complex_no': complex_no, 'overview': {'complexNo': complex_no},
+                'articles': {'articleList': []}}
+
+    async def browser_watchdog():
+        pass
+
+    crawler.crawl_complex_data = crawl_complex_data
+    crawler.browser_watchdog = browser_watchdog
+    return crawler
+
+
+def test_breaker_wait_past_deadline_defers_instead_of_sleeping(crawler):
+    crawler.deadline = time.time() + 100
+    crawler.complex_costs = {'a': 10.0, 'b': 10.0}
+    crawler.breaker.record_signal('a')
+    crawler.breaker.record_signal('b')
+    assert crawler.breaker.record_signal('c')  # 180초 차단
+
+    results = asyncio.run(asyncio.wait_for(crawler.crawl_multiple_complexes(['a', 'b']), timeout=5))
+    assert crawler.crawled == []
+    assert [r.get('deferred') for r in results] == [True, True]
+    assert crawler.deferred_complexes == ['a', 'b']
+
+
+def test_first_complex_runs_even_if_larger_than_budget(crawler):
+    crawler.deadline = time.time() + 100
+    crawler.complex_costs = {'huge': 500.0, 'small': 10.0}
+
+    results = asyncio.run(crawler.crawl_multiple_complexes(['huge', 'small']))
+    assert crawler.crawled == ['huge', 'small']
+    assert not any(r.get('deferred') for r in results)
+
+
+def test_pop_time_budget_requires_value():
+    assert pop_time_budget(['22065', '--time-budget=600', 'crawl-1']) == (600.0, ['22065', 'crawl-1'])
+    with pytest.raises(ValueError):
+        pop_time_budget(['22065', '--time-budget', '600'])
+
+
+def test_probe_without_overview_closes_breaker(crawler):
+    """개요 수집을 건너뛴 단지도 탐지 없이 끝나면 시험 요청 성공 (half_open이 계속 남지 않음)"""
+    clock = [0.0]
+    crawler.breaker = BotDetectionBreaker(threshold=1, cooldown=10, clock=lambda: clock[0])
+
+    async def rotate_identity():
+        pass
+
+    crawler.rotate_identity = rotate_identity
+    assert crawler.breaker.record_signal('a')
+    clock[0] = 11  # 대기 종료 → 다음 단지가 시험 요청
+
+    asyncio.run(crawler.crawl_multiple_complexes(['a', 'b']))
+    assert crawler.crawled == ['a', 'b']
+    assert crawler.breaker.state == CLOSED
+    assert crawler.breaker.cooldown == 10
+
+
+def test_hybrid_http_path_defers_past_deadline(tmp_path, monkeypatch):
+    from hybrid_crawler import HybridNaverRealEstateCrawler
+
+    monkeypatch.setenv("OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setenv("HTTP_CACHE_DIR", str(tmp_path / "http_cache"))
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    crawler = HybridNaverRealEstateCrawler()
+    crawler.deadline = time.time() - 1
+    crawler.deferred_complexes = []
+
+    async def browser_fallback(keep_browser=False):
+        raise AssertionError("연기된 단지를 브라우저로 넘기면 안 됨")
+
+    crawler.crawl_multiple_complexes = browser_fallback
+
+    results = asyncio.run(crawler.crawl_targets(['a', 'b']))
+    assert [r.get('deferred') for r in results] == [True, True]
+    assert crawler.deferred_complexes == ['a', 'b']
@@ -0,0 +1,114 @@
+"""
+nas_playwright_crawler 매물 스크롤 테스트 (페이지 내 스크롤 에이전트 / 수집 완료 판정)
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("playwright")
+pytest.importorskip("pandas")
+pytest.importorskip("psycopg2")
+
+from retry_queue import classify_error  # noqa: E402
+from nas_playwright_crawler import (  # noqa: E402
+    SCROLL_AGENT_START_SCRIPT,
+    SCROLL_AGENT_STOP_SCRIPT,
+    NASNaverRealEstateCrawler,
+    article_list_complete,
+)
+
+
+@pytest.fixture
+def crawler(tmp_path, monkeypatch):
+    """DB 없이 파일 모드로 동작하는 크롤러 (출력은 임시 디렉토리)"""
+    monkeypatch.setenv("OUTPUT_DIR", str(tmp_path))
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    monkeypatch.delenv("RECORD_TRAFFIC_DIR", raising=False)
+    monkeypatch.delenv("REPLAY_TRAFFIC_DIR", raising=False)
+    return NASNaverRealEstateCrawler()
+
+
+class FakePage:
+    """스크롤 에이전트 시작 시 report를 바인딩으로 보고하는 가짜 페이지 (report가 None이면 보고 안 함)"""
+
+    def __init__(self, crawler, report=None):
+        self.crawler = crawler
+        self.report = report
+        self.scripts = []
+        self.main_frame = object()
+        self.listeners = {}
+
+    def on(self, event, handler):
+        self.listeners.setdefault(event, []).append(handler)
+
+    def remove_listener(self, event, handler):
+        self.listeners[event].remove(handler)
+
+    def emit(self, event, arg=None):
+        for handler in list(self.listeners.get(event, [])):
+            handler(arg)
+
+    async def evaluate(self, script, arg=None):
+        self.scripts.append(script)
+        if script == SCROLL_AGENT_START_SCRIPT and self.report is not None:
+            asyncio.get_running_loop().call_later(
+                0.01, lambda: asyncio.ensure_future(self.crawler._on_scroll_agent_report({'page': self}, self.report))
+            )
+        return True
+
+
+def test_agent_report_ends_scroll(crawler):
+    page = FakePage(crawler, {'reason': 'end', 'attempts': 7})
+
+    async def scroll():
+        return await crawler._scroll_with_agent(page, '22065', [], asyncio.Event())
+
+    assert asyncio.run(scroll()) == 7
+    assert crawler.scroll_agent_futures == {}
+
+
+def test_list_complete_stops_agent(crawler):
+    page = FakePage(crawler)
+
+    async def scroll():
+        list_complete = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.01, list_complete.set)
+        return await crawler._scroll_with_agent(page, '22065', [], list_complete)
+
+    assert asyncio.run(scroll()) == 0
+    assert page.scripts == [SCROLL_AGENT_START_SCRIPT, SCROLL_AGENT_STOP_SCRIPT]
+    assert crawler.scroll_agent_futures == {}
+
+
+@pytest.mark.parametrize("event", ["close", "crash", "framenavigated"])
+def test_page_lost_aborts_agent_as_context_destroyed(crawler, event):
+    """페이지가 이동/크래시/닫히면 에이전트 보고를 기다리지 않고 컨텍스트 파괴 오류로 중단"""
+    page = FakePage(crawler)
+
+    async def scroll():
+        loop = asyncio.get_running_loop()
+        # 하위 프레임 이동은 무시
+        loop.call_later(0.01, page.emit, "framenavigated", object())
+        loop.call_later(0.02, page.emit, event, page.main_frame)
+        return await asyncio.wait_for(crawler._scroll_with_agent(page, '22065', [], asyncio.Event()), timeout=2)
+
+    with pytest.raises(RuntimeError) as excinfo:
+        asyncio.run(scroll())
+    assert classify_error(str(excinfo.value)) == 'context_destroyed'
+    assert crawler.scroll_agent_futures == {}
+    assert all(not handlers for handlers in page.listeners.values())
+
+
+def test_article_list_complete_counts_grouped_representatives_only():
+    """묶기 전 응답으로 모은 개별 매물의 sameAddrCnt는 합산하지 않음"""
+    ungrouped = [{'articleNo': str(no), 'sameAddrCnt': 3} for no in range(4)]
+    grouped = [{'articleNo': '10', 'sameAddrCnt': 3}, {'articleNo': '11', 'sameAddrCnt': 2}]
+    all_articles = ungrouped + grouped
+
+    # 묶기 전 매물까지 합산하면 4*3 + 5 = 17 >= 10 으로 조기 완료됨
+    assert not article_list_complete(all_articles, 10, True, grouped)
+    assert article_list_complete(all_articles, 10, True, grouped + [{'articleNo': '12', 'sameAddrCnt': 5}])
+    assert not article_list_complete(all_articles, 10, True, None)
+    assert article_list_complete(all_articles, 6, True, None)
+    assert article_list_complete(all_articles, 100, False, None)
+    assert not article_list_complete([], 0, True, grouped)
@@ -0,0 +1,80 @@
+"""
+가격 정규화 모듈 테스트 (logic/price_normalizer.py)
+"""
+import pytest
+
+pytest.importorskip("pandas")
+
+from price_normalizer import (  # noqa: E402
+    clear_price_cache,
+    normalize_article_prices,
+    parse_price_to_won,
+    parse_prices_to_won,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_price_cache()
+    yield
+    clear_price_cache()
+
+
+class TestParsePriceToWon:
+    """단건 파싱 (lib/price-utils.ts parsePriceToWonBigInt와 동일 규칙)"""
+
+    @pytest.mark.parametrize(
+        "input_str,expected",
+        [
+            ("3억", 300000000),
+            ("3억 5,000", 350000000),
+            ("7억6,000", 760000000),
+            ("12억 3,456", 1234560000),
+            ("8,500", 85000000),
+            ("500", 5000000),
+        ],
+    )
+    def test_formats(self, input_str, expected):
+        assert parse_price_to_won(input_str) == expected
+
+    def test_empty_values(self):
+        assert parse_price_to_won("") is None
+        assert parse_price_to_won("-") is None
+        assert parse_price_to_won(None) is None
+
+    def test_invalid_format(self):
+        assert parse_price_to_won("잘못된값") == 0
+
+
+class TestParsePricesToWon:
+    """배치(벡터화) 파싱"""
+
+    def test_matches_scalar_parser(self):
+        values = ["3억 5,000", "8,500", "-", "", None, "10억", "억5,000", "abc", "3억5,000"]
+        batch = parse_prices_to_won(values)
+        clear_price_cache()
+        assert batch == [parse_price_to_won(v) for v in values]
+
+    def test_returns_python_ints(self):
+        result = parse_prices_to_won(["3억", "3억", "1,000"])
+        assert result == [300000000, 300000000, 10000000]
+        assert all(type(v) is int for v in result)
+
+    def test_empty_batch(self):
+        assert parse_prices_to_won([]) == []
+
+
+class TestNormalizeArticlePrices:
+    """매물 목록에 숫자 가격 추가"""
+
+    def test_adds_won_columns(self):
+        articles = [
+            {"articleNo": "1", "dealOrWarrantPrc": "3억 5,000", "rentPrc": ""},
+            {"articleNo": "2", "dealOrWarrantPrc": "5,000", "rentPrc": "120"},
+        ]
+        normalize_article_prices(articles)
+
+        assert articles[0]["dealOrWarrantPrcWon"] == 350000000
+        assert articles[0]["rentPrcWon"] is None
+        assert articles[1]["dealOrWarrantPrcWon"] == 50000000
+        assert articles[1]["rentPrcWon"] == 1200000
@@ -0,0 +1,56 @@
+"""
+retry_queue 테스트 (오류 분류 / 유형별 재시도 예산 / 백오프 순서)
+"""
+import pytest
+
+from retry_queue import RetryQueue, classify_error
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.parametrize("message,expected", [
+    ("Page.goto: Timeout 30000ms exceeded", 'timeout'),
+    ("Execution context was destroyed, most likely because of a navigation", 'context_destroyed'),
+    ("봇 탐지 리다이렉트: https://new.land.naver.com/complexes", 'bot_redirect'),
+    ("KeyError: 'articleList'", 'other'),
+    (None, 'other'),
+])
+def test_classify_error(message, expected):
+    assert classify_error(message) == expected
+
+
+def test_budget_is_per_error_class():
+    queue = RetryQueue(base_delay=1.0, budgets={'timeout': 2, 'bot_redirect': 1}, clock=FakeClock())
+
+    assert queue.push('100', 'Timeout 30000ms exceeded') == 1.0
+    assert queue.push('100', 'Timeout 30000ms exceeded') == 2.0  # 지수 백오프
+    assert queue.push('100', 'Timeout 30000ms exceeded') is None  # timeout 예산 소진
+
+    # 다른 유형은 별도 예산 (봇 탐지는 백오프 4배)
+    assert queue.push('100', '봇 탐지 리다이렉트') == 4.0
+    assert queue.push('100', '봇 탐지 리다이렉트') is None
+    assert queue.retry_count('100') == 3
+
+
+def test_pop_ready_respects_backoff_order():
+    clock = FakeClock()
+    queue = RetryQueue(base_delay=10.0, clock=clock)
+    queue.push('slow', '봇 탐지 리다이렉트')  # 40초
+    queue.push('fast', 'Execution context was destroyed')  # 5초
+
+    assert queue.pop_ready() is None
+    assert queue.next_ready_in() == 5.0
+
+    clock.now = 5.0
+    assert queue.pop_ready() == 'fast'
+    assert queue.pop_ready() is None
+
+    clock.now = 40.0
+    assert queue.pop_ready() == 'slow'
+    assert len(queue) == 0
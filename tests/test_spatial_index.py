@@ -0,0 +1,68 @@
+"""
+spatial_index 테스트 (격자 인덱스 결과를 전체 스캔 결과와 비교)
+"""
+import random
+
+from spatial_index import ComplexSpatialIndex, haversine_km, update_spatial_index
+
+
+def _brute_force(points, lat, lng):
+    return sorted((haversine_km(lat, lng, p_lat, p_lng), no) for no, (p_lat, p_lng) in points.items())
+
+
+def _make_index(count=500, seed=7):
+    rng = random.Random(seed)
+    index = ComplexSpatialIndex()
+    points = {}
+    for i in range(count):
+        lat = 37.2 + rng.random() * 0.6
+        lng = 126.8 + rng.random() * 0.6
+        points[str(10000 + i)] = (lat, lng)
+        index.upsert(str(10000 + i), lat, lng, f"단지{i}")
+    return index, points
+
+
+def test_haversine_known_distance():
+    # 서울시청 ↔ 강남역 약 8.9km
+    assert 8.5 < haversine_km(37.5663, 126.9779, 37.4979, 127.0276) < 9.3
+
+
+def test_nearest_matches_brute_force():
+    index, points = _make_index()
+    for lat, lng in [(37.5, 127.0), (37.21, 126.81), (38.5, 128.0)]:
+        expected = [no for _, no in _brute_force(points, lat, lng)[:5]]
+        assert [r['complexNo'] for r in index.nearest(lat, lng, k=5)] == expected
+
+
+def test_within_radius_matches_brute_force():
+    index, points = _make_index()
+    expected = [no for dist, no in _brute_force(points, 37.5, 127.0) if dist <= 3.0]
+    assert [r['complexNo'] for r in index.within_radius(37.5, 127.0, 3.0)] == expected
+
+
+def test_upsert_moves_complex_and_skips_invalid_coordinates():
+    index = ComplexSpatialIndex()
+    assert index.upsert('1', 37.5, 127.0)
+    assert not index.upsert('1', 37.5, 127.0)
+    assert index.upsert('1', 35.1, 129.0)
+    assert not index.upsert('2', None, 127.0)
+    assert not index.upsert('3', 0, 0)
+
+    assert index.within_radius(37.5, 127.0, 1.0) == []
+    assert index.nearest(35.1, 129.0, k=1)[0]['complexNo'] == '1'
+    assert index.nearest_to_complex('1') == []
+
+
+def test_incremental_update_persists(tmp_path):
+    path = tmp_path / 'spatial.json'
+    results = [
+        {'overview': {'complexNo': '22065', 'complexName': 'A', 'latitude': 37.2, 'longitude': 127.07}},
+        {'overview': {'complexNo': '12345', 'complexName': 'B', 'latitude': 37.21, 'longitude': 127.08}},
+        {'crawling_info': {'complex_no': '99999'}, 'error': 'failed'},
+    ]
+    assert update_spatial_index(results, path) == 2
+    assert update_spatial_index(results, path) == 0
+
+    index = ComplexSpatialIndex.load(path)
+    assert len(index) == 2
+    assert index.nearest_to_complex('22065', k=1)[0]['complexNo'] == '12345'
@@ -0,0 +1,126 @@
+"""
+traffic_replay 테스트 (녹화 → 재생 왕복 / 재생 순서 / 매물 API 파라미터 적용)
+"""
+import asyncio
+
+import pytest
+
+from traffic_replay import TrafficRecorder, TrafficReplayer
+
+
+class FakeRequest:
+    def __init__(self, url, method='GET'):
+        self.url = url
+        self.method = method
+        self.resource_type = 'fetch'
+
+
+class FakeResponse:
+    def __init__(self, body, status=200):
+        self.status = status
+        self.headers = {'content-type': 'application/json', 'content-encoding': 'gzip'}
+        self._body = body
+
+    async def body(self):
+        return self._body
+
+
+class FakeRoute:
+    """route.fetch()는 준비된 응답을 순서대로 반환하고, fulfill/abort 결과를 기록"""
+
+    def __init__(self, url, responses=None):
+        self.request = FakeRequest(url)
+        self.responses = list(responses or [])
+        self.fulfilled = None
+        self.aborted = None
+        self.fetched_url = None
+
+    async def fetch(self, url=None):
+        self.fetched_url = url or self.request.url
+        return self.responses.pop(0)
+
+    async def fulfill(self, response=None, status=None, headers=None, body=None):
+        self.fulfilled = {'status': status or response.status, 'headers': headers, 'body': body}
+
+    async def abort(self, error_code):
+        self.aborted = error_code
+
+
+def _record(tmp_path, traffic):
+    recorder = TrafficRecorder(tmp_path)
+
+    async def run():
+        for url, body in traffic:
+            await recorder.handle(FakeRoute(url, [FakeResponse(body)]))
+
+    asyncio.run(run())
+    return recorder
+
+
+def _replay(replayer, url):
+    route = FakeRoute(url)
+    asyncio.run(replayer.handle(route))
+    return route
+
+
+def test_record_then_replay_round_trip(tmp_path):
+    recorder = _record(tmp_path, [
+        ('https://new.land.naver.com/api/complexes/1', b'{"a": 1}'),
+        ('https://new.land.naver.com/api/complexes/1', b'{"a": 2}'),
+    ])
+    assert recorder.recorded_count == 2
+
+    replayer = TrafficReplayer(tmp_path, latency_scale=0)
+    assert replayer.entry_count == 2
+    first = _replay(replayer, 'https://new.land.naver.com/api/complexes/1')
+    assert first.fulfilled['body'] == b'{"a": 1}'
+    assert 'content-encoding' not in first.fulfilled['headers']
+    assert _replay(replayer, 'https://new.land.naver.com/api/complexes/1').fulfilled['body'] == b'{"a": 2}'
+    # 소진되면 마지막 응답 반복
+    assert _replay(replayer, 'https://new.land.naver.com/api/complexes/1').fulfilled['body'] == b'{"a": 2}'
+
+    missing = _replay(replayer, 'https://new.land.naver.com/api/other')
+    assert missing.aborted == 'internetdisconnected'
+    assert (replayer.hit_count, replayer.miss_count) == (3, 1)
+
+
+def test_exact_and_loose_matches_keep_separate_cursors(tmp_path):
+    _record(tmp_path, [
+        ('https://new.land.naver.com/api/articles', b'first'),
+        ('https://new.land.naver.com/api/articles', b'second'),
+    ])
+    replayer = TrafficReplayer(tmp_path, latency_scale=0)
+
+    # 쿼리만 다른 요청(경로 매칭)이 같은 URL의 정확 매칭 순서를 건너뛰지 않음
+    assert _replay(replayer, 'https://new.land.naver.com/api/articles?ts=9').fulfilled['body'] == b'first'
+    assert _replay(replayer, 'https://new.land.naver.com/api/articles').fulfilled['body'] == b'first'
+    assert _replay(replayer, 'https://new.land.naver.com/api/articles?ts=10').fulfilled['body'] == b'second'
+    assert _replay(replayer, 'https://new.land.naver.com/api/articles').fulfilled['body'] == b'second'
+
+
+def test_article_params_applied_when_recording_and_replaying(tmp_path, monkeypatch):
+    pytest.importorskip("playwright")
+    pytest.importorskip("pandas")
+    pytest.importorskip("psycopg2")
+    from nas_playwright_crawler import NASNaverRealEstateCrawler
+
+    monkeypatch.setenv("OUTPUT_DIR", str(tmp_path))
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    monkeypatch.delenv("RECORD_TRAFFIC_DIR", raising=False)
+    monkeypatch.delenv("REPLAY_TRAFFIC_DIR", raising=False)
+    crawler = NASNaverRealEstateCrawler()
+    crawler.article_order = 'dateDesc'
+    url = 'https://new.land.naver.com/api/articles/complex/22065?order=rank&page=1'
+
+    crawler.traffic_recorder = TrafficRecorder(tmp_path / 'traffic')
+    route = FakeRoute(url, [FakeResponse(b'{"articleList": []}')])
+    asyncio.run(crawler._route_handler(route))
+    assert 'order=dateDesc' in route.fetched_url
+
+    crawler.traffic_recorder = None
+    crawler.traffic_replayer = TrafficReplayer(tmp_path / 'traffic', latency_scale=0)
+    assert crawler.traffic_replayer.find('GET', route.fetched_url)['url'] == route.fetched_url
+    replayed = FakeRoute(url)
+    asyncio.run(crawler._route_handler(replayed))
+    assert replayed.fulfilled['body'] == b'{"articleList": []}'
+    assert crawler.traffic_replayer.hit_count == 1
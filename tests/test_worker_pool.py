@@ -0,0 +1,113 @@
+"""
+worker_pool 테스트 (작업 중 메모리 상한 / 취소 시 워커 재시작 / 시작 실패 정리)
+"""
+import asyncio
+import os
+
+import pytest
+
+import worker_pool
+from worker_pool import CrawlWorkerPool, WorkerError, WorkerProcess
+
+
+class FakeProcess:
+    def __init__(self):
+        self.returncode = None
+
+    async def wait(self):
+        return self.returncode
+
+
+class FakeWorker:
+    """작업이 끝나지 않는 가짜 워커 (RSS는 rss 목록 순서대로 증가)"""
+
+    def __init__(self, rss):
+        self.name = 'worker-1'
+        self.process = FakeProcess()
+        self.rss = list(rss)
+        self.killed = 0
+
+    @property
+    def alive(self):
+        return self.process.returncode is None
+
+    async def start(self):
+        self.process = FakeProcess()
+
+    async def run(self, job_id, complex_numbers, timeout, on_progress=None):
+        await asyncio.sleep(3600)
+
+    def rss_mb(self):
+        return self.rss.pop(0) if len(self.rss) > 1 else self.rss[0]
+
+    def kill(self):
+        if self.alive:
+            self.killed += 1
+            self.process.returncode = -9
+
+
+def _pool(monkeypatch, worker):
+    monkeypatch.setenv('WORKER_MAX_RSS_MB', '1000')
+    monkeypatch.setenv('WORKER_RSS_SAMPLE_SECONDS', '0.01')
+    pool = CrawlWorkerPool(1)
+    pool.idle = asyncio.Queue()
+    pool.idle.put_nowait(worker)
+    pool.workers.append(worker)
+    return pool
+
+
+def test_memory_limit_kills_worker_during_job(monkeypatch):
+    worker = FakeWorker([300, 800, 1500])
+
+    async def run():
+        pool = _pool(monkeypatch, worker)
+        with pytest.raises(WorkerError, match='메모리'):
+            await asyncio.wait_for(pool.run(['22065']), timeout=2)
+        return pool.idle.qsize()
+
+    assert asyncio.run(run()) == 1  # 종료된 워커는 다음 작업 때 다시 시작
+    assert worker.killed == 1
+    assert not worker.alive
+
+
+def test_cancelled_job_kills_worker_before_requeue(monkeypatch):
+    worker = FakeWorker([100])
+
+    async def run():
+        pool = _pool(monkeypatch, worker)
+        task = asyncio.ensure_future(pool.run(['22065']))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return pool.idle.qsize()
+
+    assert asyncio.run(run()) == 1
+    assert worker.killed == 1
+    assert not worker.alive
+
+
+def test_worker_failing_handshake_is_killed_and_reset(tmp_path, monkeypatch):
+    # 준비 신호 대신 오류를 보내고 종료하지 않는 워커
+    script = tmp_path / 'broken_worker.py'
+    script.write_text('import json, time\nprint(json.dumps({"type": "error"}), flush=True)\ntime.sleep(3600)\n')
+    monkeypatch.setattr(worker_pool, 'WORKER_SCRIPT', script)
+    worker = WorkerProcess('worker-1')
+    pids = []
+
+    async def run():
+        original = asyncio.create_subprocess_exec
+
+        async def spawn(*args, **kwargs):
+            process = await original(*args, **kwargs)
+            pids.append(process.pid)
+            return process
+
+        monkeypatch.setattr(asyncio, 'create_subprocess_exec', spawn)
+        with pytest.raises(WorkerError):
+            await asyncio.wait_for(worker.start(), timeout=10)
+
+    asyncio.run(run())
+    assert not worker.alive and worker.process is None
+    with pytest.raises(ProcessLookupError):
+        os.kill(pids[0], 0)